@@ -0,0 +1,350 @@
+"""CI용 비대화형 리뷰 파이프라인.
+
+REPL의 자유로운 도구 선택 루프 대신 고정된 순서로 실행합니다.
+
+  diff 조회 → 리뷰(solar-pro3 1회, JSON) → 배치 groundedness 검증(1회)
+
+LLM 계획(tool 선택) 턴이 없으므로 PR당 호출 수가 2회로 고정되고,
+결과는 JSON 또는 SARIF로 출력되어 파이프라인에서 바로 소비할 수 있습니다.
+
+ReviewStore를 넘기면 커밋 범위/파일 blob 단위로 결과를 재사용하여,
+이전 리뷰 이후 내용이 바뀐 파일만 LLM으로 다시 리뷰합니다.
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from common.client import client
+from commit_guardian.git_tools import (
+    get_range_diff,
+    get_range_changed_files,
+    get_range_blobs,
+    resolve_range,
+)
+from commit_guardian.review_tools import (
+    format_review_context,
+    parse_diff_stats,
+    split_diff_by_file,
+)
+from commit_guardian.groundedness import check_groundedness_batch
+from commit_guardian.review_store import ReviewStore
+
+MODEL = "solar-pro3"
+
+# 리뷰 프롬프트를 바꾸면 버전을 올려서 결과를 구분합니다.
+REVIEW_PROMPT_VERSION = "1"
+
+SEVERITIES = ["CRITICAL", "WARNING", "INFO", "SUGGESTION"]
+
+# 종료 코드: grounded 발견사항 중 가장 높은 심각도 기준
+EXIT_CODES = {"CRITICAL": 2, "WARNING": 1}
+ERROR_EXIT_CODE = 3
+
+SARIF_LEVELS = {
+    "CRITICAL": "error",
+    "WARNING": "warning",
+    "INFO": "note",
+    "SUGGESTION": "note",
+}
+
+REVIEW_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "code_review",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "findings": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "severity": {"type": "string", "enum": SEVERITIES},
+                            "category": {
+                                "type": "string",
+                                "enum": ["security", "performance", "error-handling", "style", "test"],
+                            },
+                            "file": {
+                                "type": "string",
+                                "description": "File path as shown in the diff",
+                            },
+                            "line": {
+                                "type": "integer",
+                                "description": "Line number in the new file",
+                            },
+                            "title": {"type": "string"},
+                            "message": {"type": "string"},
+                        },
+                        "required": ["severity", "category", "file", "title", "message"],
+                    },
+                }
+            },
+            "required": ["findings"],
+        },
+    },
+}
+
+REVIEW_PROMPT = """당신은 시니어 코드 리뷰어입니다. 주어진 diff만 근거로 코드 리뷰 발견사항을 도출합니다.
+
+규칙:
+- diff에 실제로 존재하는 변경에 대해서만 발견사항을 작성하세요.
+- 각 발견사항에 파일 경로와 변경 후 기준 줄 번호를 지정하세요.
+- title과 message는 한국어로 작성하세요.
+- 심각도: CRITICAL, WARNING, INFO, SUGGESTION
+
+리뷰 체크리스트:
+[security] SQL 인젝션, XSS, 하드코딩된 시크릿, 권한 문제
+[performance] N+1 쿼리, 불필요한 반복, 메모리 누수, 큰 파일 로딩
+[error-handling] 미처리 예외, 빈 catch 블록, 에러 메시지 노출
+[style] 네이밍 규칙, 코드 중복, 함수 길이, 복잡도
+[test] 테스트 커버리지, 경계값 테스트, 에러 케이스 테스트
+"""
+
+
+def review_diff(diff_text: str, changed_files: str, tracker=None) -> list[dict]:
+    """diff를 한 번의 LLM 호출로 리뷰하여 구조화된 발견사항 목록을 반환."""
+    # [Upstage API] Chat Completions (Structured Output)
+    # 도구 선택 턴 없이 diff를 바로 전달하고 발견사항을 JSON으로 받음
+    response = client.chat.completions.create(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": REVIEW_PROMPT},
+            {"role": "user", "content": format_review_context(diff_text, changed_files)},
+        ],
+        response_format=REVIEW_SCHEMA,
+    )
+    if tracker:
+        tracker.track_chat(response)
+    data = json.loads(response.choices[0].message.content)
+
+    findings = []
+    for f in data.get("findings", []):
+        severity = str(f.get("severity", "INFO")).upper()
+        findings.append(
+            {
+                "severity": severity if severity in SEVERITIES else "INFO",
+                "category": f.get("category", ""),
+                "file": f.get("file", ""),
+                "line": f.get("line") if isinstance(f.get("line"), int) else None,
+                "title": f.get("title", ""),
+                "message": f.get("message", ""),
+            }
+        )
+    return findings
+
+
+def verify_findings(diff_text: str, findings: list[dict]) -> list[dict]:
+    """발견사항에 groundedness 판정(verdict)을 채워 반환."""
+    verdicts = check_groundedness_batch(
+        diff_text,
+        [
+            {
+                "finding": f"[{f['severity']}] {f['title']}: {f['message']}",
+                "file": f["file"],
+                "line": f["line"],
+            }
+            for f in findings
+        ],
+    )
+    for f, v in zip(findings, verdicts):
+        f["verdict"] = v["verdict"]
+    return findings
+
+
+def parse_range_blobs(raw_text: str) -> dict[str, tuple[str, str]]:
+    """git diff --raw 출력을 {경로: (변경 전 blob, 변경 후 blob)}로 파싱."""
+    blobs = {}
+    for line in raw_text.split("\n"):
+        if not line.startswith(":"):
+            continue
+        meta, _, paths = line.partition("\t")
+        fields = meta.split()
+        if len(fields) >= 4:
+            blobs[paths.split("\t")[-1]] = (fields[2], fields[3])
+    return blobs
+
+
+def _match_file(path: str, files: list[str]) -> str | None:
+    """LLM이 보고한 파일 경로를 diff의 실제 경로로 매칭."""
+    path = (path or "").strip().removeprefix("./")
+    for f in files:
+        if f == path or f.endswith("/" + path) or path.endswith("/" + f):
+            return f
+    return None
+
+
+def run_review(
+    repo_path: str, rev_range: str, tracker=None, store: ReviewStore | None = None
+) -> dict:
+    """커밋 범위를 고정 파이프라인(diff → 리뷰 → groundedness)으로 리뷰."""
+    result = {
+        "repo": repo_path,
+        "range": rev_range,
+        "model": MODEL,
+        "prompt_version": REVIEW_PROMPT_VERSION,
+        "findings": [],
+        "filtered": [],
+        "error": None,
+    }
+
+    # 범위를 SHA로 고정 (브랜치 이름이 가리키는 커밋이 바뀌어도 키가 정확하도록)
+    resolved = resolve_range(repo_path, rev_range)
+    if resolved.startswith("["):
+        result["error"] = resolved
+        return result
+    shas = resolved.split()
+    head_sha = next((x for x in shas if not x.startswith("^")), "")
+    base_sha = next((x[1:] for x in shas if x.startswith("^")), "")
+
+    # 범위(A..B)가 아니면 작업 트리와 비교하므로 커밋 단위 재사용을 하지 않음
+    if not base_sha:
+        store = None
+
+    if store:
+        cached = store.get_commit_review(head_sha, base_sha, MODEL, REVIEW_PROMPT_VERSION)
+        if cached:
+            cached.update(repo=repo_path, range=rev_range)
+            cached["cache"] = {
+                "commit": True,
+                "files_cached": len(cached.get("stats_files", [])),
+                "files_reviewed": 0,
+            }
+            return cached
+
+    diff_text = get_range_diff(repo_path, rev_range)
+    if diff_text.startswith("["):
+        result["error"] = diff_text
+        return result
+    if diff_text == "(변경 사항 없음)":
+        return result
+
+    result["stats"] = parse_diff_stats(diff_text)
+    file_diffs = split_diff_by_file(diff_text)
+    result["stats_files"] = sorted(file_diffs)
+    blobs = parse_range_blobs(get_range_blobs(repo_path, rev_range)) if store else {}
+
+    # 저장소에 결과가 있는 파일은 재사용하고, 나머지 파일만 리뷰
+    findings: list[dict] = []
+    pending = []
+    for path in file_diffs:
+        cached_findings = None
+        if store and path in blobs:
+            cached_findings = store.get_file_review(
+                path, *blobs[path], MODEL, REVIEW_PROMPT_VERSION
+            )
+        if cached_findings is None:
+            pending.append(path)
+        else:
+            findings.extend(cached_findings)
+
+    if pending:
+        pending_diff = "\n".join(file_diffs[p] for p in pending)
+        changed_files = "\n".join(
+            line
+            for line in get_range_changed_files(repo_path, rev_range).split("\n")
+            if line.split("\t")[-1] in pending
+        )
+        try:
+            reviewed = verify_findings(
+                pending_diff, review_diff(pending_diff, changed_files, tracker)
+            )
+        except Exception as e:
+            result["error"] = f"[리뷰 오류] {e}"
+            return result
+
+        # 검증 오류가 난 결과는 다음 실행에서 다시 리뷰하도록 저장하지 않고, 오류 종료 코드로 보고
+        verify_errors = [f["verdict"] for f in reviewed if f["verdict"].startswith("[")]
+        if verify_errors:
+            result["error"] = verify_errors[0]
+            store = None
+
+        by_file: dict[str, list[dict]] = {p: [] for p in pending}
+        unmatched = []
+        for f in reviewed:
+            matched = _match_file(f["file"], pending)
+            if matched:
+                f["file"] = matched
+                by_file[matched].append(f)
+            else:
+                unmatched.append(f)
+        findings.extend(unmatched)
+        for path, file_findings in by_file.items():
+            findings.extend(file_findings)
+            # 파일에 매칭되지 않은 발견사항이 있으면 파일별 결과만으로는 다시 만들 수 없으므로
+            # 파일 단위로 저장하지 않음 (커밋 단위 결과에만 포함, 부분 재리뷰 시 해당 파일을 다시 리뷰)
+            if store and path in blobs and not unmatched:
+                store.put_file_review(
+                    path, *blobs[path], MODEL, REVIEW_PROMPT_VERSION, file_findings
+                )
+
+    result["findings"] = [f for f in findings if f["verdict"] == "grounded"]
+    result["filtered"] = [f for f in findings if f["verdict"] != "grounded"]
+    result["cache"] = {
+        "commit": False,
+        "files_cached": len(file_diffs) - len(pending),
+        "files_reviewed": len(pending),
+    }
+    if store:
+        store.put_commit_review(head_sha, base_sha, MODEL, REVIEW_PROMPT_VERSION, result)
+    return result
+
+
+def exit_code(result: dict) -> int:
+    """grounded 발견사항의 최고 심각도에 따른 종료 코드."""
+    if result.get("error"):
+        return ERROR_EXIT_CODE
+    severities = {f["severity"] for f in result["findings"]}
+    return max((code for sev, code in EXIT_CODES.items() if sev in severities), default=0)
+
+
+def to_json(result: dict) -> str:
+    """리뷰 결과를 JSON 문자열로 변환."""
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
+def to_sarif(result: dict) -> str:
+    """리뷰 결과를 SARIF 2.1.0 문자열로 변환 (grounded 발견사항만 포함)."""
+    rules = {}
+    results = []
+    for f in result["findings"]:
+        rule_id = f"commit-guardian/{f['category'] or 'general'}"
+        rules.setdefault(rule_id, {"id": rule_id, "name": f["category"] or "general"})
+        location = {"artifactLocation": {"uri": f["file"]}}
+        if f["line"]:
+            location["region"] = {"startLine": f["line"]}
+        results.append(
+            {
+                "ruleId": rule_id,
+                "level": SARIF_LEVELS.get(f["severity"], "note"),
+                "message": {"text": f"[{f['severity']}] {f['title']}\n{f['message']}"},
+                "locations": [{"physicalLocation": location}],
+            }
+        )
+
+    run = {
+        "tool": {
+            "driver": {
+                "name": "commit-guardian",
+                "version": REVIEW_PROMPT_VERSION,
+                "rules": list(rules.values()),
+            }
+        },
+        "results": results,
+    }
+    if result.get("error"):
+        run["invocations"] = [
+            {
+                "executionSuccessful": False,
+                "toolExecutionNotifications": [{"message": {"text": result["error"]}}],
+            }
+        ]
+
+    sarif = {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [run],
+    }
+    return json.dumps(sarif, ensure_ascii=False, indent=2)
@@ -1,5 +1,8 @@
+import atexit
 import os
 import subprocess
+import threading
+from collections import OrderedDict
 
 
 def _run_git(repo_path: str, args: list[str]) -> str:
@@ -68,3 +71,186 @@ def get_commit_info(repo_path: str, commit_hash: str) -> str:
             commit_hash,
         ],
     )
+
+
+def get_range_diff(repo_path: str, rev_range: str) -> str:
+    """커밋 범위(A..B)의 diff 조회."""
+    return _run_git(repo_path, ["diff", rev_range])
+
+
+def get_range_changed_files(repo_path: str, rev_range: str) -> str:
+    """커밋 범위(A..B)의 변경 파일 목록 조회."""
+    return _run_git(repo_path, ["diff", "--name-status", rev_range])
+
+
+def get_range_log(repo_path: str, rev_range: str) -> str:
+    """커밋 범위의 로그를 파싱하기 쉬운 형식으로 조회.
+
+    커밋마다 "\\x1e<sha>\\x1f<subject>" 줄 뒤에 변경 파일 경로가 이어집니다.
+    """
+    return _run_git(
+        repo_path,
+        ["log", "--no-merges", "--reverse", "--name-only", "--format=%x1e%H%x1f%s", rev_range],
+    )
+
+
+def get_commits_patch(repo_path: str, commit_hashes: list[str]) -> str:
+    """여러 커밋의 patch를 한 번의 git show로 조회 (커밋마다 "\\x1e<sha>"로 시작)."""
+    return _run_git(
+        repo_path, ["show", "--no-color", "--stat", "--patch", "--format=%x1e%H"] + commit_hashes
+    )
+
+
+def resolve_range(repo_path: str, rev_range: str) -> str:
+    """커밋 범위를 전체 SHA로 변환 (A..B → "B\\n^A")."""
+    return _run_git(repo_path, ["rev-parse", rev_range])
+
+
+def get_range_blobs(repo_path: str, rev_range: str) -> str:
+    """커밋 범위에서 변경된 파일별 변경 전/후 blob SHA 조회 (git diff --raw)."""
+    return _run_git(repo_path, ["diff", "--raw", "--no-abbrev", rev_range])
+
+
+class CatFileBatch:
+    """`git cat-file --batch` 장기 실행 프로세스 기반 blob 리더.
+
+    파일마다 `git show`를 fork하는 대신 하나의 파이프로 여러 경로/리비전의
+    blob을 스트리밍하고, 최근 읽은 blob은 LRU에 보관합니다.
+    LRU 키는 "<커밋 SHA>:<경로>"이므로 호출자는 전체 커밋 SHA를 넘겨야
+    브랜치 이동 후에도 오래된 내용을 반환하지 않습니다.
+    """
+
+    # 한 번에 파이프에 쓰는 요청 수 (stdout 버퍼가 찬 상태에서 stdin 쓰기가 막히지 않도록)
+    _CHUNK = 64
+
+    def __init__(self, repo_path: str, cache_size: int = 256):
+        self.repo_path = repo_path
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, bytes | None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._proc = None
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _read_object(self) -> bytes | None:
+        """응답 하나를 읽음: "<sha> <type> <size>\n<content>\n" 또는 "<spec> missing\n"."""
+        header = self._proc.stdout.readline()
+        if not header:
+            raise BrokenPipeError("git cat-file 프로세스가 종료되었습니다.")
+        parts = header.split()
+        if len(parts) != 3 or parts[1] != b"blob":
+            # missing / ambiguous, 또는 blob이 아닌 객체(tree 등)는 내용을 건너뜀
+            if len(parts) == 3 and parts[2].isdigit():
+                self._proc.stdout.read(int(parts[2]) + 1)
+            return None
+        content = self._proc.stdout.read(int(parts[2]))
+        self._proc.stdout.read(1)  # 객체 뒤의 개행
+        return content
+
+    def _fetch(self, specs: list[str]) -> list[bytes | None]:
+        if self._proc is None or self._proc.poll() is not None:
+            self._start()
+        results = []
+        for i in range(0, len(specs), self._CHUNK):
+            chunk = specs[i : i + self._CHUNK]
+            self._proc.stdin.write("".join(f"{spec}\n" for spec in chunk).encode())
+            self._proc.stdin.flush()
+            results.extend(self._read_object() for _ in chunk)
+        return results
+
+    def read_many(self, specs: list[str]) -> dict[str, bytes | None]:
+        """"<rev>:<path>" 목록의 blob 내용을 반환 (없으면 None)."""
+        with self._lock:
+            found = {}
+            missing = []
+            for spec in dict.fromkeys(specs):
+                if spec in self._cache:
+                    self._cache.move_to_end(spec)
+                    found[spec] = self._cache[spec]
+                else:
+                    missing.append(spec)
+
+            if missing:
+                try:
+                    contents = self._fetch(missing)
+                except (BrokenPipeError, OSError):
+                    # 프로세스가 죽었으면 한 번만 재시작하여 재시도
+                    self.close()
+                    contents = self._fetch(missing)
+                for spec, content in zip(missing, contents):
+                    found[spec] = content
+                    self._cache[spec] = content
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            return found
+
+    def close(self):
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
+
+
+_BATCH_READERS: dict[str, CatFileBatch] = {}
+_BATCH_READERS_LOCK = threading.Lock()
+
+
+def _get_batch_reader(repo_path: str) -> CatFileBatch:
+    """저장소별 CatFileBatch를 재사용 (프로세스는 종료 시 정리)."""
+    repo_path = os.path.abspath(repo_path)
+    with _BATCH_READERS_LOCK:
+        reader = _BATCH_READERS.get(repo_path)
+        if reader is None:
+            reader = _BATCH_READERS[repo_path] = CatFileBatch(repo_path)
+        return reader
+
+
+@atexit.register
+def _close_batch_readers():
+    for reader in _BATCH_READERS.values():
+        reader.close()
+
+
+def get_file_context(
+    repo_path: str, paths: list[str], rev: str = "HEAD", max_lines: int = 200
+) -> str:
+    """여러 파일의 전체 내용을 한 번에 조회 (리뷰 시 주변 코드 확인용).
+
+    리비전은 한 번만 커밋 SHA로 변환하고, 파일 내용은 장기 실행 중인
+    `git cat-file --batch` 프로세스에서 읽습니다.
+    """
+    commit = _run_git(repo_path, ["rev-parse", "--verify", f"{rev}^{{commit}}"])
+    if commit.startswith("["):
+        return commit
+
+    specs = [f"{commit}:{p.strip().removeprefix('./')}" for p in paths]
+    try:
+        contents = _get_batch_reader(repo_path).read_many(specs)
+    except (BrokenPipeError, OSError) as e:
+        return f"[오류] git cat-file 실행 실패: {e}"
+
+    sections = []
+    for path, spec in zip(paths, specs):
+        content = contents.get(spec)
+        if content is None:
+            sections.append(f"[파일] {path} @ {rev}\n(파일 없음)")
+            continue
+        if b"\0" in content[:8000]:
+            sections.append(f"[파일] {path} @ {rev}\n(바이너리 파일, {len(content)} bytes)")
+            continue
+        lines = content.decode("utf-8", errors="replace").split("\n")
+        body = "\n".join(f"{i:>5}  {line}" for i, line in enumerate(lines[:max_lines], 1))
+        if len(lines) > max_lines:
+            body += f"\n... ({len(lines) - max_lines}줄 생략)"
+        sections.append(f"[파일] {path} @ {rev}\n{body}")
+    return "\n\n".join(sections)
@@ -1,9 +1,11 @@
+import json
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from common.client import client
+from commit_guardian.review_tools import parse_diff_hunks
 
 
 def check_groundedness(context: str, answer: str) -> str:
@@ -58,3 +60,181 @@ def check_groundedness(context: str, answer: str) -> str:
             return "notSure"
     except Exception as e:
         return f"[Groundedness 오류] {e}"
+
+
+# 배치 검증 응답 스키마 (발견사항별 판정을 구조화된 JSON으로 받음)
+BATCH_VERDICT_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "groundedness_batch",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "description": "Finding id",
+                            },
+                            "verdict": {
+                                "type": "string",
+                                "enum": ["grounded", "notGrounded", "notSure"],
+                            },
+                        },
+                        "required": ["id", "verdict"],
+                    },
+                }
+            },
+            "required": ["results"],
+        },
+    },
+}
+
+_VERDICTS = {"grounded", "notGrounded", "notSure"}
+
+
+def select_hunks(hunks: list[dict], finding: dict) -> list[int]:
+    """발견사항이 참조하는 hunk 인덱스 목록을 반환.
+
+    file이 지정되면 해당 파일의 hunk만, line까지 지정되면 그 줄을 포함하는
+    hunk만 선택합니다. file이 없으면 발견사항 본문에 언급된 파일 경로로 추정합니다.
+    """
+    target = (finding.get("file") or "").strip().removeprefix("./")
+    if target:
+        matched = [
+            i for i, h in enumerate(hunks)
+            if h["file"] == target or h["file"].endswith("/" + target)
+        ]
+    else:
+        text = finding.get("finding", "")
+        matched = [
+            i for i, h in enumerate(hunks)
+            if h["file"] and (h["file"] in text or os.path.basename(h["file"]) in text)
+        ]
+
+    line = finding.get("line")
+    if matched and isinstance(line, int) and line > 0:
+        # hunk 경계 근처의 줄 번호도 허용 (LLM이 보고하는 줄 번호 오차 감안)
+        near = [i for i in matched if hunks[i]["start"] - 3 <= line <= hunks[i]["end"] + 3]
+        if near:
+            matched = near
+    return matched
+
+
+def check_groundedness_batch(diff_text: str, findings: list[dict]) -> list[dict]:
+    """
+    여러 리뷰 발견사항을 한 번의 요청으로 검증.
+
+    발견사항마다 diff 앞부분 4000자를 반복 전송하는 대신, 각 발견사항이
+    참조하는 hunk만 골라 한 프롬프트에 담고 발견사항별 판정을 JSON으로 받습니다.
+
+    Args:
+        diff_text: 실제 코드 diff (근거 자료)
+        findings: [{"finding": str, "file": str?, "line": int?}, ...]
+
+    Returns:
+        [{"id": int, "finding": str, "file": str, "verdict": str}, ...]
+        verdict는 "grounded" | "notGrounded" | "notSure"
+    """
+    results = [
+        {
+            "id": i,
+            "finding": f.get("finding", ""),
+            "file": f.get("file", ""),
+            "verdict": "notSure",
+        }
+        for i, f in enumerate(findings)
+    ]
+    if not findings:
+        return results
+
+    # 발견사항별 근거 hunk 선택 (여러 발견사항이 공유하는 hunk는 한 번만 전송)
+    hunks = parse_diff_hunks(diff_text)
+    max_ctx = 4000
+    used: dict[int, str] = {}
+    refs: list[list[str]] = []
+    for finding in findings:
+        ctx_len = 0
+        ids = []
+        for idx in select_hunks(hunks, finding):
+            if ctx_len + len(hunks[idx]["text"]) > max_ctx and ids:
+                break
+            used.setdefault(idx, f"H{len(used) + 1}")
+            ids.append(used[idx])
+            ctx_len += len(hunks[idx]["text"])
+        refs.append(ids)
+
+    hunk_sections = []
+    for idx, hid in used.items():
+        text = hunks[idx]["text"]
+        if len(text) > max_ctx:
+            text = text[:max_ctx] + "\n...(truncated)"
+        hunk_sections.append(f"[{hid}] {hunks[idx]['file']}\n{text}")
+
+    # 참조 hunk를 찾지 못한 발견사항은 기존 방식대로 diff 앞부분을 근거로 사용
+    fallback = ""
+    if any(not ids for ids in refs):
+        fallback = diff_text[:max_ctx]
+        if len(diff_text) > max_ctx:
+            fallback += "\n...(truncated)"
+        hunk_sections.append(f"[H0] (diff 앞부분)\n{fallback}")
+
+    finding_sections = []
+    for i, (finding, ids) in enumerate(zip(findings, refs)):
+        evidence = ", ".join(ids) if ids else "H0"
+        finding_sections.append(
+            f"[Finding {i}] (evidence: {evidence})\n{finding.get('finding', '')}"
+        )
+
+    try:
+        # [Upstage API] Groundedness Check (배치)
+        # N개의 발견사항을 한 번의 호출로 검증하고, 발견사항별 판정을 JSON으로 받음
+        response = client.chat.completions.create(
+            model="solar-pro3",
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a groundedness checker. "
+                        "Given code diff hunks (context) and a list of review findings, "
+                        "determine for each finding whether it is directly supported by "
+                        "the hunks listed as its evidence. "
+                        "Return one verdict per finding id: grounded, notGrounded, or notSure."
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        "[Context - Code Diff Hunks]\n"
+                        + "\n\n".join(hunk_sections)
+                        + "\n\n[Answers - Review Findings]\n"
+                        + "\n\n".join(finding_sections)
+                    ),
+                },
+            ],
+            response_format=BATCH_VERDICT_SCHEMA,
+        )
+        data = json.loads(response.choices[0].message.content)
+        for item in data.get("results", []):
+            idx = item.get("id")
+            verdict = item.get("verdict")
+            if isinstance(idx, int) and 0 <= idx < len(results) and verdict in _VERDICTS:
+                results[idx]["verdict"] = verdict
+    except Exception as e:
+        for r in results:
+            r["verdict"] = f"[Groundedness 오류] {e}"
+    return results
+
+
+def format_batch_result(results: list[dict]) -> str:
+    """배치 검증 결과를 도구 응답 문자열로 포맷팅."""
+    lines = []
+    for r in results:
+        location = f" ({r['file']})" if r.get("file") else ""
+        lines.append(f"[{r['id']}] {r['verdict']}{location}: {r['finding']}")
+    grounded = sum(1 for r in results if r["verdict"] == "grounded")
+    lines.append(f"\ngrounded {grounded}/{len(results)}건, 제외 {len(results) - grounded}건")
+    return "\n".join(lines)
@@ -11,9 +11,15 @@ from commit_guardian.git_tools import (
     get_commit_log,
     get_changed_files,
     get_commit_info,
+    get_file_context,
 )
 from commit_guardian.review_tools import format_review_context
-from commit_guardian.groundedness import check_groundedness
+from commit_guardian.release_notes import generate_range_release_notes
+from commit_guardian.groundedness import (
+    check_groundedness,
+    check_groundedness_batch,
+    format_batch_result,
+)
 
 
 TOOLS = [
@@ -95,6 +101,32 @@ TOOLS = [
             },
         },
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_file_context",
+            "description": "변경된 파일의 전체 내용을 조회합니다. diff만으로 판단하기 어려운 주변 코드(호출부, 정의부 등)를 확인할 때 사용합니다. 여러 파일을 한 번에 요청하세요.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "repo_path": {
+                        "type": "string",
+                        "description": "Git 저장소 경로",
+                    },
+                    "paths": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "조회할 파일 경로 목록 (저장소 루트 기준)",
+                    },
+                    "rev": {
+                        "type": "string",
+                        "description": "조회할 리비전 (커밋 해시, 브랜치 등). 기본값: HEAD",
+                    },
+                },
+                "required": ["repo_path", "paths"],
+            },
+        },
+    },
     {
         "type": "function",
         "function": {
@@ -116,6 +148,54 @@ TOOLS = [
             },
         },
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "check_findings_groundedness_batch",
+            "description": "여러 코드 리뷰 발견사항을 한 번에 검증합니다. 각 발견사항은 자신이 참조하는 파일/줄의 hunk에 대해서만 검증되며, 발견사항별 판정(grounded/notGrounded/notSure)을 반환합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "repo_path": {
+                        "type": "string",
+                        "description": "Git 저장소 경로",
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["unstaged", "staged", "commit"],
+                        "description": "diff 모드",
+                    },
+                    "commit_hash": {
+                        "type": "string",
+                        "description": "특정 커밋 해시 (mode가 commit일 때)",
+                    },
+                    "findings": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "finding": {
+                                    "type": "string",
+                                    "description": "검증할 코드 리뷰 발견사항",
+                                },
+                                "file": {
+                                    "type": "string",
+                                    "description": "발견사항이 참조하는 파일 경로",
+                                },
+                                "line": {
+                                    "type": "integer",
+                                    "description": "발견사항이 참조하는 줄 번호 (변경 후 기준)",
+                                },
+                            },
+                            "required": ["finding"],
+                        },
+                        "description": "검증할 발견사항 목록",
+                    },
+                },
+                "required": ["repo_path", "findings"],
+            },
+        },
+    },
     {
         "type": "function",
         "function": {
@@ -142,6 +222,10 @@ TOOLS = [
                         "enum": ["ko", "en", "both"],
                         "description": "릴리스 노트 언어. both면 한국어+영어 모두 생성. 기본값: both",
                     },
+                    "rev_range": {
+                        "type": "string",
+                        "description": "릴리스 범위 (예: v1.2.0..v1.3.0). 지정하면 범위 내 모든 커밋을 요약해 완성된 릴리스 노트를 반환합니다.",
+                    },
                 },
                 "required": ["repo_path"],
             },
@@ -149,6 +233,27 @@ TOOLS = [
     },
 ]
 
+
+def _release_notes_context(args: dict, tracker=None) -> str:
+    """rev_range가 있으면 범위 릴리스 노트를, 없으면 최근 커밋 기반 컨텍스트를 반환.
+
+    tracker를 주면 범위 릴리스 노트의 map/reduce LLM 호출도 사용량에 집계합니다.
+    """
+    if args.get("rev_range"):
+        return generate_range_release_notes(
+            args["repo_path"], args["rev_range"], args.get("language", "both"), tracker=tracker
+        )
+    return (
+        f"[커밋 로그]\n"
+        f"{get_commit_log(args['repo_path'])}\n\n"
+        f"[변경 파일]\n"
+        f"{get_changed_files(args['repo_path'], args.get('mode', 'unstaged'), args.get('commit_hash'))}\n\n"
+        f"[Diff]\n"
+        f"{get_diff(args['repo_path'], args.get('mode', 'unstaged'), args.get('commit_hash'))}\n\n"
+        f"[요청 언어] {args.get('language', 'both')}"
+    )
+
+
 TOOL_HANDLERS = {
     "get_git_diff": lambda args: get_diff(
         args["repo_path"],
@@ -166,26 +271,31 @@ TOOL_HANDLERS = {
     "suggest_tests": lambda args: get_diff(
         args["repo_path"], args.get("mode", "unstaged"), args.get("commit_hash")
     ),
+    "get_file_context": lambda args: get_file_context(
+        args["repo_path"], args["paths"], args.get("rev") or "HEAD"
+    ),
     "check_finding_groundedness": lambda args: check_groundedness(
         args["diff_context"],
         args["finding"],
     ),
-    "generate_release_notes": lambda args: (
-        f"[커밋 로그]\n"
-        f"{get_commit_log(args['repo_path'])}\n\n"
-        f"[변경 파일]\n"
-        f"{get_changed_files(args['repo_path'], args.get('mode', 'unstaged'), args.get('commit_hash'))}\n\n"
-        f"[Diff]\n"
-        f"{get_diff(args['repo_path'], args.get('mode', 'unstaged'), args.get('commit_hash'))}\n\n"
-        f"[요청 언어] {args.get('language', 'both')}"
+    "check_findings_groundedness_batch": lambda args: format_batch_result(
+        check_groundedness_batch(
+            get_diff(
+                args["repo_path"], args.get("mode", "unstaged"), args.get("commit_hash")
+            ),
+            args["findings"],
+        )
     ),
+    "generate_release_notes": _release_notes_context,
 }
 
 TOOL_LABELS = {
     "get_git_diff": "Git Diff 조회",
     "analyze_code_changes": "코드 변경 분석",
     "suggest_tests": "테스트 제안",
+    "get_file_context": "파일 컨텍스트 조회",
     "check_finding_groundedness": "Groundedness 검증",
+    "check_findings_groundedness_batch": "Groundedness 배치 검증",
     "generate_release_notes": "릴리스 노트 생성",
 }
 
@@ -202,7 +312,7 @@ SYSTEM_PROMPT = """당신은 시니어 코드 리뷰어이자 플랫폼 엔지
 
 규칙:
 - 항상 적절한 도구(function)를 호출하여 작업하세요.
-- 코드 리뷰 발견사항은 반드시 check_finding_groundedness 도구로 검증하세요.
+- 코드 리뷰 발견사항은 반드시 check_findings_groundedness_batch 도구로 한 번에 검증하세요.
 - 검증되지 않은(notGrounded) 발견사항은 사용자에게 제시하지 마세요.
 - 모든 응답은 한국어로 작성하세요.
 - 심각도를 다음과 같이 구분하세요: [CRITICAL] [WARNING] [INFO] [SUGGESTION]
@@ -218,19 +328,22 @@ SYSTEM_PROMPT = """당신은 시니어 코드 리뷰어이자 플랫폼 엔지
 - Conventional Commits 스타일 (feat:, fix:, refactor:, docs:, test:, chore:)
 - language가 both이면 한국어 섹션 먼저, 그 다음 영어 섹션
 - 각 변경사항을 카테고리별로 분류
+- 릴리스 범위(예: v1.2.0..v1.3.0)가 주어지면 generate_release_notes에 rev_range로 전달하세요. 이때 도구가 완성된 릴리스 노트를 반환하므로 그대로 정리해 전달하세요.
 
 Groundedness 검증 워크플로우:
 1. analyze_code_changes로 diff를 가져옵니다
 2. diff를 분석하여 발견사항을 도출합니다
-3. 각 주요 발견사항을 check_finding_groundedness로 검증합니다
+3. 주요 발견사항 전체를 file/line과 함께 check_findings_groundedness_batch로 한 번에 검증합니다
 4. grounded된 발견사항만 최종 리뷰에 포함합니다
 5. 필터링된 발견사항 수를 사용자에게 알립니다
 """
 
 
-def handle_tool_call(tool_call) -> str:
+def handle_tool_call(tool_call, tracker=None) -> str:
     name = tool_call.function.name
     args = json.loads(tool_call.function.arguments)
+    if name == "generate_release_notes":
+        return _release_notes_context(args, tracker)
     handler = TOOL_HANDLERS.get(name)
     if handler:
         return handler(args)
@@ -273,7 +386,7 @@ class GuardianAgent:
                 label = TOOL_LABELS.get(name, name)
                 print(f"\n[{label}] {name} 호출됨")
 
-                result = handle_tool_call(tool_call)
+                result = handle_tool_call(tool_call, self.tracker)
                 preview = result[:200] + "..." if len(result) > 200 else result
                 print(f"[결과 미리보기]\n{preview}")
 
@@ -1,3 +1,4 @@
+import argparse
 import os
 import sys
 
@@ -5,6 +6,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from commit_guardian.guardian_agent import GuardianAgent
 from commit_guardian.git_tools import get_diff, get_commit_log
+from common.usage import UsageTracker
 
 
 HELP_TEXT = """
@@ -16,6 +18,7 @@ HELP_TEXT = """
   staged                   - staged 변경사항 리뷰
   commit <hash>            - 특정 커밋 리뷰
   release                  - 릴리스 노트 생성 (한/영)
+  release <A..B>           - 커밋 범위 릴리스 노트 생성 (예: release v1.2.0..v1.3.0)
   test                     - 변경사항에 대한 테스트 제안 (변경 없으면 최근 커밋)
   test staged              - staged 변경사항에 대한 테스트 제안
   test <hash>              - 특정 커밋에 대한 테스트 제안
@@ -30,7 +33,40 @@ HELP_TEXT = """
 """
 
 
+def run_ci(argv: list[str]) -> int:
+    """비대화형 CI 모드: review --range A..B --format json|sarif"""
+    # LLM 클라이언트는 CI 모드에서만 필요하므로 지연 import
+    from commit_guardian.ci_review import run_review, exit_code, to_json, to_sarif
+    from commit_guardian.review_store import ReviewStore
+
+    parser = argparse.ArgumentParser(
+        prog="commit_guardian review",
+        description="커밋 범위를 diff → 리뷰 → groundedness 파이프라인으로 리뷰합니다.",
+    )
+    parser.add_argument("--range", dest="rev_range", required=True, help="커밋 범위 (예: main..HEAD)")
+    parser.add_argument("--format", choices=["json", "sarif"], default="json", help="출력 형식")
+    parser.add_argument("--repo", default=".", help="Git 저장소 경로 (기본: 현재 디렉토리)")
+    parser.add_argument("--usage", action="store_true", help="사용량을 stderr로 출력")
+    parser.add_argument("--no-cache", action="store_true", help="저장된 리뷰 결과를 재사용하지 않음")
+    parser.add_argument("--store", default=None, help="리뷰 결과 저장소 경로 (기본: commit_guardian/cache_data/reviews.db)")
+    opts = parser.parse_args(argv)
+
+    tracker = UsageTracker(enabled=opts.usage)
+    store = None if opts.no_cache else ReviewStore(opts.store)
+    result = run_review(os.path.abspath(opts.repo), opts.rev_range, tracker, store)
+
+    print(to_sarif(result) if opts.format == "sarif" else to_json(result))
+    if result.get("error"):
+        print(result["error"], file=sys.stderr)
+    if opts.usage:
+        print(tracker.format_session(), file=sys.stderr)
+    return exit_code(result)
+
+
 def main():
+    if sys.argv[1:2] == ["review"]:
+        sys.exit(run_ci(sys.argv[2:]))
+
     usage_enabled = "--usage" in sys.argv
     args = [a for a in sys.argv[1:] if a != "--usage"]
 
@@ -103,6 +139,9 @@ def main():
             question = f"{repo_path} 저장소의 커밋 {commit_hash}을 코드 리뷰해주세요. 발견사항은 반드시 groundedness 검증을 해주세요."
         elif line.lower() == "release":
             question = f"{repo_path} 저장소의 변경사항으로 릴리스 노트를 한국어와 영어 모두 생성해주세요."
+        elif line.lower().startswith("release "):
+            rev_range = line[8:].strip()
+            question = f"{repo_path} 저장소의 {rev_range} 범위(rev_range)로 릴리스 노트를 한국어와 영어 모두 생성해주세요."
         elif line.lower().startswith("test"):
             test_arg = line[4:].strip().lower()
             if test_arg == "staged":
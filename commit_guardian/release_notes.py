@@ -0,0 +1,292 @@
+"""커밋 범위 릴리스 노트 생성 (map-reduce 요약).
+
+수백 개 커밋을 한 번에 LLM에 넣으면 컨텍스트가 넘치므로 두 단계로 나눕니다.
+
+  map:    Conventional Commits 타입별로 커밋을 묶어 배치 단위로 병렬 요약
+  reduce: 타입별 요약을 모아 한국어/영어 릴리스 노트로 병합
+
+커밋별 요약은 SHA 기준으로 JSON 파일에 캐시되므로, 커밋 하나가 추가된 뒤
+다시 생성하면 그 커밋만 새로 요약하고 reduce 1회만 수행합니다.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from common.client import client
+from commit_guardian.git_tools import get_range_log, get_commits_patch
+
+# 요약 프롬프트를 바꾸면 버전을 올려서 기존 캐시를 무효화합니다.
+SUMMARY_PROMPT_VERSION = "1"
+
+BATCH_SIZE = 20
+MAX_WORKERS = 4
+MAX_PATCH_CHARS = 1500
+MAX_REDUCE_CHARS = 20000
+
+COMMIT_TYPES = ["feat", "fix", "perf", "refactor", "docs", "test", "build", "ci", "chore", "style"]
+
+_CONVENTIONAL_RE = re.compile(r"^(\w+)(\([^)]*\))?!?:")
+
+SUMMARY_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "commit_summaries",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summaries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "sha": {"type": "string"},
+                            "summary": {
+                                "type": "string",
+                                "description": "One-line user-facing summary of the change",
+                            },
+                        },
+                        "required": ["sha", "summary"],
+                    },
+                }
+            },
+            "required": ["summaries"],
+        },
+    },
+}
+
+
+class SummaryCache:
+    """커밋 SHA → 요약 JSON 캐시.
+
+    저장 구조 (cache_data/commit_summaries.json):
+        {"<prompt_version>:<sha>": {"type": "feat", "subject": "...", "summary": "..."}, ...}
+    """
+
+    def __init__(self, persist_dir: str | None = None):
+        if persist_dir is None:
+            persist_dir = os.path.join(os.path.dirname(__file__), "cache_data")
+
+        os.makedirs(persist_dir, exist_ok=True)
+        self.path = os.path.join(persist_dir, "commit_summaries.json")
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> dict:
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return {}
+        return {}
+
+    def _key(self, sha: str) -> str:
+        return f"{SUMMARY_PROMPT_VERSION}:{sha}"
+
+    def get(self, sha: str) -> dict | None:
+        return self._data.get(self._key(sha))
+
+    def put_many(self, entries: dict[str, dict]):
+        """여러 요약을 저장하고 파일에 반영 (배치 스레드에서 동시 호출 가능)."""
+        with self._lock:
+            for sha, entry in entries.items():
+                self._data[self._key(sha)] = entry
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+
+
+def commit_type(subject: str) -> str:
+    """커밋 제목에서 Conventional Commits 타입 추출 (없으면 other)."""
+    match = _CONVENTIONAL_RE.match(subject.strip())
+    if match and match.group(1).lower() in COMMIT_TYPES:
+        return match.group(1).lower()
+    return "other"
+
+
+def parse_range_log(log_text: str) -> list[dict]:
+    """get_range_log 출력을 [{"sha", "subject", "files", "type"}, ...]로 파싱."""
+    commits = []
+    for block in log_text.split("\x1e"):
+        lines = block.strip("\n").split("\n")
+        if not lines or "\x1f" not in lines[0]:
+            continue
+        sha, subject = lines[0].split("\x1f", 1)
+        commits.append(
+            {
+                "sha": sha,
+                "subject": subject,
+                "files": [line for line in lines[1:] if line],
+                "type": commit_type(subject),
+            }
+        )
+    return commits
+
+
+def _split_patches(patch_text: str) -> dict[str, str]:
+    """get_commits_patch 출력을 SHA별 patch로 분리."""
+    patches = {}
+    for block in patch_text.split("\x1e"):
+        if not block.strip():
+            continue
+        sha, _, body = block.partition("\n")
+        patches[sha.strip()] = body
+    return patches
+
+
+def summarize_batch(repo_path: str, commits: list[dict], tracker=None) -> dict[str, dict]:
+    """커밋 배치를 한 번의 LLM 호출로 요약 (map 단계). LLM이 빠뜨린 커밋은 결과에 포함하지 않음."""
+    patches = _split_patches(get_commits_patch(repo_path, [c["sha"] for c in commits]))
+
+    sections = []
+    for c in commits:
+        patch = patches.get(c["sha"], "")
+        if len(patch) > MAX_PATCH_CHARS:
+            patch = patch[:MAX_PATCH_CHARS] + "\n...(truncated)"
+        sections.append(f"[commit {c['sha']}]\n{c['subject']}\n{patch}")
+
+    # [Upstage API] Chat Completions (Structured Output) — map 단계 요약
+    response = client.chat.completions.create(
+        model="solar-pro3",
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You summarize git commits for release notes. "
+                    "For each commit, write one concise user-facing sentence in English "
+                    "describing what changed. Return one summary per commit sha."
+                ),
+            },
+            {"role": "user", "content": "\n\n".join(sections)},
+        ],
+        response_format=SUMMARY_SCHEMA,
+    )
+    if tracker:
+        tracker.track_chat(response)
+
+    returned = {
+        s.get("sha", ""): s.get("summary", "")
+        for s in json.loads(response.choices[0].message.content).get("summaries", [])
+    }
+    summaries = {}
+    for c in commits:
+        # LLM이 SHA를 줄여서 반환하는 경우도 매칭
+        summary = returned.get(c["sha"]) or next(
+            (v for k, v in returned.items() if k and c["sha"].startswith(k)), ""
+        )
+        if summary:
+            summaries[c["sha"]] = {"type": c["type"], "subject": c["subject"], "summary": summary}
+    return summaries
+
+
+def _group_batches(commits: list[dict]) -> list[list[dict]]:
+    """타입별로 묶은 뒤 BATCH_SIZE 단위로 나눈 배치 목록."""
+    by_type: dict[str, list[dict]] = {}
+    for c in commits:
+        by_type.setdefault(c["type"], []).append(c)
+    batches = []
+    for group in by_type.values():
+        for i in range(0, len(group), BATCH_SIZE):
+            batches.append(group[i : i + BATCH_SIZE])
+    return batches
+
+
+def _render_sections(entries: list[dict]) -> str:
+    """타입별 요약 목록을 텍스트로 렌더링."""
+    by_type: dict[str, list[str]] = {}
+    for e in entries:
+        by_type.setdefault(e["type"], []).append(f"- {e['summary']} ({e['sha'][:7]})")
+    order = COMMIT_TYPES + ["other"]
+    return "\n\n".join(
+        f"[{t}]\n" + "\n".join(by_type[t]) for t in order if t in by_type
+    )
+
+
+def _merge(sections: str, language: str, tracker=None) -> str:
+    """요약 목록을 릴리스 노트로 병합 (reduce 단계)."""
+    lang_rule = {
+        "ko": "Write the release notes in Korean only.",
+        "en": "Write the release notes in English only.",
+    }.get(language, "Write a Korean section first, then an English section.")
+
+    # [Upstage API] Chat Completions — reduce 단계 병합 (한/영 Translation 포함)
+    response = client.chat.completions.create(
+        model="solar-pro3",
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You write release notes from per-commit summaries grouped by "
+                    "Conventional Commits type (feat, fix, refactor, docs, test, chore, ...). "
+                    "Merge duplicates, keep the categories, and keep commit short SHAs. "
+                    + lang_rule
+                ),
+            },
+            {"role": "user", "content": sections},
+        ],
+    )
+    if tracker:
+        tracker.track_chat(response)
+    return response.choices[0].message.content
+
+
+def generate_range_release_notes(
+    repo_path: str,
+    rev_range: str,
+    language: str = "both",
+    tracker=None,
+    cache: SummaryCache | None = None,
+) -> str:
+    """커밋 범위(A..B)의 릴리스 노트를 map-reduce로 생성."""
+    log_text = get_range_log(repo_path, rev_range)
+    if log_text.startswith("["):
+        return log_text
+    commits = parse_range_log(log_text)
+    if not commits:
+        return f"[결과] {rev_range} 범위에 커밋이 없습니다."
+
+    cache = cache or SummaryCache()
+    missing = [c for c in commits if cache.get(c["sha"]) is None]
+
+    try:
+        # map: 캐시에 없는 커밋만 배치로 병렬 요약
+        if missing:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                for summaries in pool.map(
+                    lambda batch: summarize_batch(repo_path, batch, tracker),
+                    _group_batches(missing),
+                ):
+                    cache.put_many(summaries)
+
+        # LLM이 요약을 빠뜨린 커밋은 제목으로 대체 (캐시에 넣지 않아 다음 실행에서 다시 요약)
+        entries = []
+        for c in commits:
+            entry = cache.get(c["sha"]) or {"type": c["type"], "subject": c["subject"], "summary": c["subject"]}
+            entries.append(dict(entry, sha=c["sha"]))
+
+        # reduce: 요약이 너무 길면 타입별로 먼저 병합한 뒤 최종 병합
+        sections = _render_sections(entries)
+        if len(sections) > MAX_REDUCE_CHARS:
+            types = list(dict.fromkeys(e["type"] for e in entries))
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                partials = pool.map(
+                    lambda t: _merge(
+                        _render_sections([e for e in entries if e["type"] == t]), "en", tracker
+                    ),
+                    types,
+                )
+                sections = "\n\n".join(f"[{t}]\n{p}" for t, p in zip(types, partials))
+
+        notes = _merge(sections, language, tracker)
+    except Exception as e:
+        return f"[릴리스 노트 오류] {e}"
+
+    return (
+        f"[릴리스 노트] {rev_range} (커밋 {len(commits)}개, 새로 요약 {len(missing)}개)\n\n"
+        f"{notes}"
+    )
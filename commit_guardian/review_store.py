@@ -0,0 +1,119 @@
+"""리뷰 결과 영속 저장소 (SQLite).
+
+같은 커밋을 다시 리뷰할 때(CI 재실행, 다른 엔지니어의 리뷰) LLM 호출을 반복하지
+않도록 리뷰 발견사항과 groundedness 판정을 저장합니다.
+
+키 구성:
+  - file_reviews:   (파일 경로, 변경 전 blob SHA, 변경 후 blob SHA, 모델, 프롬프트 버전)
+  - commit_reviews: (head 커밋 SHA, base 커밋 SHA, 모델, 프롬프트 버전)
+
+PR에 새 push가 있어도 내용이 바뀌지 않은 파일은 blob SHA가 같으므로
+file_reviews에서 결과를 재사용하고, 바뀐 파일만 다시 리뷰합니다.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+
+class ReviewStore:
+    """커밋/파일 단위 리뷰 결과 저장소."""
+
+    def __init__(self, db_path: str | None = None):
+        # 저장 경로 기본값: 이 파일과 같은 경로의 cache_data/reviews.db
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(__file__), "cache_data", "reviews.db")
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS file_reviews (
+                path TEXT NOT NULL,
+                old_blob TEXT NOT NULL,
+                new_blob TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                findings_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (path, old_blob, new_blob, model, prompt_version)
+            );
+            CREATE TABLE IF NOT EXISTS commit_reviews (
+                commit_sha TEXT NOT NULL,
+                base_sha TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                result_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (commit_sha, base_sha, model, prompt_version)
+            );
+            """
+        )
+
+    def get_file_review(
+        self, path: str, old_blob: str, new_blob: str, model: str, prompt_version: str
+    ) -> list[dict] | None:
+        """파일 리뷰 결과(판정 포함 발견사항 목록)를 조회. 없으면 None."""
+        row = self._conn.execute(
+            "SELECT findings_json FROM file_reviews "
+            "WHERE path=? AND old_blob=? AND new_blob=? AND model=? AND prompt_version=?",
+            (path, old_blob, new_blob, model, prompt_version),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_file_review(
+        self,
+        path: str,
+        old_blob: str,
+        new_blob: str,
+        model: str,
+        prompt_version: str,
+        findings: list[dict],
+    ):
+        """파일 리뷰 결과를 저장 (발견사항이 없는 파일도 빈 목록으로 저장)."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_reviews VALUES (?,?,?,?,?,?,?)",
+                (
+                    path,
+                    old_blob,
+                    new_blob,
+                    model,
+                    prompt_version,
+                    json.dumps(findings, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+
+    def get_commit_review(
+        self, commit_sha: str, base_sha: str, model: str, prompt_version: str
+    ) -> dict | None:
+        """커밋(범위) 리뷰 결과를 조회. 없으면 None."""
+        row = self._conn.execute(
+            "SELECT result_json FROM commit_reviews "
+            "WHERE commit_sha=? AND base_sha=? AND model=? AND prompt_version=?",
+            (commit_sha, base_sha, model, prompt_version),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_commit_review(
+        self, commit_sha: str, base_sha: str, model: str, prompt_version: str, result: dict
+    ):
+        """커밋(범위) 리뷰 결과를 저장."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO commit_reviews VALUES (?,?,?,?,?,?)",
+                (
+                    commit_sha,
+                    base_sha,
+                    model,
+                    prompt_version,
+                    json.dumps(result, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+
+    def close(self):
+        self._conn.close()
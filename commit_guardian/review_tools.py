@@ -38,3 +38,56 @@ def format_review_context(diff_text: str, changed_files: str) -> str:
         f"[변경 파일 목록]\n{changed_files}\n\n"
         f"[전체 Diff]\n{diff_text}{truncated}"
     )
+
+
+def parse_diff_hunks(diff_text: str) -> list[dict]:
+    """diff를 파일별 hunk 단위로 분리.
+
+    Returns:
+        [{"file": str, "start": int, "end": int, "text": str}, ...]
+        start/end는 변경 후(new) 파일 기준 줄 범위입니다.
+    """
+    hunks = []
+    current_file = ""
+    current = None
+
+    for line in diff_text.split("\n"):
+        if line.startswith("diff --git"):
+            parts = line.split(" b/")
+            current_file = parts[-1] if len(parts) > 1 else ""
+            current = None
+        elif line.startswith("@@"):
+            # @@ -a,b +c,d @@ 형식에서 변경 후 범위(c, d) 추출
+            start, length = 0, 1
+            for token in line.split():
+                if token.startswith("+") and token[1:2].isdigit():
+                    nums = token[1:].split(",")
+                    start = int(nums[0])
+                    length = int(nums[1]) if len(nums) > 1 else 1
+                    break
+            current = {
+                "file": current_file,
+                "start": start,
+                "end": start + max(length - 1, 0),
+                "lines": [line],
+            }
+            hunks.append(current)
+        elif current is not None:
+            current["lines"].append(line)
+
+    for hunk in hunks:
+        hunk["text"] = "\n".join(hunk.pop("lines"))
+    return hunks
+
+
+def split_diff_by_file(diff_text: str) -> dict[str, str]:
+    """diff를 파일 경로별 diff 조각으로 분리."""
+    files: dict[str, list[str]] = {}
+    current = None
+    for line in diff_text.split("\n"):
+        if line.startswith("diff --git"):
+            parts = line.split(" b/")
+            current = files.setdefault(parts[-1] if len(parts) > 1 else "", [])
+        if current is not None:
+            current.append(line)
+    return {path: "\n".join(lines) for path, lines in files.items()}
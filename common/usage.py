@@ -12,6 +12,8 @@ Upstage API 응답의 usage 필드(토큰 수)를 누적 추적하고,
   - 이 기능은 --usage 플래그로 활성화할 수 있습니다 (기본: 비활성).
 """
 
+import threading
+
 # Upstage API 가격표 (2026-02 기준, USD per 1M tokens)
 # 출처: https://www.upstage.ai/pricing/api
 # 실제 단가와 다를 수 있음 — 참고용
@@ -40,6 +42,7 @@ class UsageTracker:
 
     enabled=False이면 추적을 건너뜁니다 (기본: False).
     --usage 플래그로 활성화할 수 있습니다.
+    여러 스레드(예: 릴리스 노트 map-reduce 워커)에서 호출해도 누적값이 유실되지 않도록 잠금을 사용합니다.
     """
 
     def __init__(self, enabled: bool = False):
@@ -50,6 +53,7 @@ class UsageTracker:
         self.total_doc_pages = 0
         self.total_cost = 0.0
         self.call_count = 0
+        self._lock = threading.Lock()
 
     def track_chat(self, response, model: str = "solar-pro3") -> dict | None:
         """Chat/Function Calling 응답의 usage를 추적합니다.
@@ -69,10 +73,11 @@ class UsageTracker:
         price = PRICING.get(model, PRICING["solar-pro3"])
         cost = (input_tokens * price["input"] + output_tokens * price["output"]) / 1_000_000
 
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_cost += cost
-        self.call_count += 1
+        with self._lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cost += cost
+            self.call_count += 1
 
         return {
             "input": input_tokens,
@@ -92,9 +97,10 @@ class UsageTracker:
         price = PRICING.get(model, PRICING["embedding-passage"])
         cost = tokens * price["input"] / 1_000_000
 
-        self.total_embedding_tokens += tokens
-        self.total_cost += cost
-        self.call_count += 1
+        with self._lock:
+            self.total_embedding_tokens += tokens
+            self.total_cost += cost
+            self.call_count += 1
 
         return {"tokens": tokens, "cost": cost}
 
@@ -105,9 +111,10 @@ class UsageTracker:
         price_per_page = DOC_PRICING.get(model, 0.01)
         cost = pages * price_per_page
 
-        self.total_doc_pages += pages
-        self.total_cost += cost
-        self.call_count += 1
+        with self._lock:
+            self.total_doc_pages += pages
+            self.total_cost += cost
+            self.call_count += 1
 
         return {"pages": pages, "cost": cost}
 
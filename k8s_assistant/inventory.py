@@ -0,0 +1,242 @@
+"""멀티 문서 YAML 인벤토리 (analyze_yaml).
+
+Helm 렌더링 결과처럼 문서가 수백 개인 스트림도 '---' 단위로 한 문서씩 파싱해
+리소스마다 한 줄(kind, name, namespace, 이미지, 포트, 주요 설정)만 남깁니다.
+LLM에는 원본 YAML 대신 이 표를 전달하고, 원본은 요청할 때만 함께 반환합니다.
+
+    | # | 줄 | kind | name | namespace | images | ports | 주요 설정 |
+    | 1 | 1 | Deployment | web | prod | nginx:1.25 | 8080/TCP | replicas=3, configMap=web-config |
+    | 2 | 24 | Service | web | prod | - | 80→8080/TCP | type=ClusterIP, selector=app=web |
+"""
+
+from collections import Counter
+
+import yaml
+
+from k8s_assistant.templates import CLUSTER_SCOPED_KINDS
+from k8s_assistant.validator import POD_SPEC_PATHS, iter_documents
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 표에 출력할 최대 리소스 수 (넘는 리소스는 kind별 개수에만 포함)
+MAX_ROWS = 500
+# 셀 값 최대 길이 (넘으면 잘라서 표시)
+MAX_CELL_CHARS = 80
+
+_COLUMNS = ["#", "줄", "kind", "name", "namespace", "images", "ports", "주요 설정"]
+_CLUSTER_SCOPED = set(CLUSTER_SCOPED_KINDS)
+
+
+def _get(tree, *path):
+    for key in path:
+        if isinstance(tree, dict):
+            tree = tree.get(key)
+        elif isinstance(tree, list) and isinstance(key, int) and key < len(tree):
+            tree = tree[key]
+        else:
+            return None
+    return tree
+
+
+def _items(value) -> list:
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+def _container_ports(container: dict) -> list[str]:
+    return [
+        f"{port.get('containerPort')}/{port.get('protocol', 'TCP')}"
+        for port in _items(container.get("ports"))
+        if port.get("containerPort") is not None
+    ]
+
+
+def _service_ports(spec: dict) -> list[str]:
+    ports = []
+    for port in _items(spec.get("ports")):
+        text = str(port.get("port"))
+        if port.get("targetPort") is not None and port.get("targetPort") != port.get("port"):
+            text += f"→{port['targetPort']}"
+        text += f"/{port.get('protocol', 'TCP')}"
+        if port.get("nodePort"):
+            text += f" (nodePort {port['nodePort']})"
+        ports.append(text)
+    return ports
+
+
+def _pod_references(pod_spec: dict) -> list[str]:
+    """Pod spec이 참조하는 ConfigMap/Secret/PVC/ServiceAccount (중복 제거, 순서 유지)."""
+    refs = []
+    if pod_spec.get("serviceAccountName"):
+        refs.append(f"serviceAccount={pod_spec['serviceAccountName']}")
+    for volume in _items(pod_spec.get("volumes")):
+        if _get(volume, "configMap", "name"):
+            refs.append(f"configMap={volume['configMap']['name']}")
+        elif _get(volume, "secret", "secretName"):
+            refs.append(f"secret={volume['secret']['secretName']}")
+        elif _get(volume, "persistentVolumeClaim", "claimName"):
+            refs.append(f"pvc={volume['persistentVolumeClaim']['claimName']}")
+    for container in _items(pod_spec.get("initContainers")) + _items(pod_spec.get("containers")):
+        for source in _items(container.get("envFrom")):
+            if _get(source, "configMapRef", "name"):
+                refs.append(f"configMap={source['configMapRef']['name']}")
+            elif _get(source, "secretRef", "name"):
+                refs.append(f"secret={source['secretRef']['name']}")
+        for env in _items(container.get("env")):
+            if _get(env, "valueFrom", "configMapKeyRef", "name"):
+                refs.append(f"configMap={env['valueFrom']['configMapKeyRef']['name']}")
+            elif _get(env, "valueFrom", "secretKeyRef", "name"):
+                refs.append(f"secret={env['valueFrom']['secretKeyRef']['name']}")
+    return list(dict.fromkeys(refs))
+
+
+def _details(kind: str, resource: dict) -> list[str]:
+    """kind별 주요 설정. 알 수 없는 kind는 최상위/spec 필드 이름만."""
+    spec = resource.get("spec") if isinstance(resource.get("spec"), dict) else {}
+    details = []
+    if kind in ("Deployment", "StatefulSet", "ReplicaSet") and "replicas" in spec:
+        details.append(f"replicas={spec['replicas']}")
+    if kind == "StatefulSet" and spec.get("serviceName"):
+        details.append(f"serviceName={spec['serviceName']}")
+    if kind == "CronJob" and spec.get("schedule"):
+        details.append(f"schedule={spec['schedule']}")
+    if kind == "Service":
+        details.append(f"type={spec.get('type', 'ClusterIP')}")
+        if isinstance(spec.get("selector"), dict):
+            details.append("selector=" + ",".join(f"{k}={v}" for k, v in spec["selector"].items()))
+    elif kind == "Ingress":
+        for rule in _items(spec.get("rules")):
+            for path in _items(_get(rule, "http", "paths")):
+                backend = _get(path, "backend", "service") or {}
+                port = _get(backend, "port", "number") or _get(backend, "port", "name")
+                details.append(f"{rule.get('host', '*')}{path.get('path', '/')}→{backend.get('name')}:{port}")
+    elif kind in ("ConfigMap", "Secret"):
+        keys = [k for field in ("data", "stringData", "binaryData") for k in (resource.get(field) or {})]
+        details.append(f"keys={','.join(map(str, keys)) or '-'}")
+    elif kind == "PersistentVolumeClaim":
+        details.append(f"storage={_get(spec, 'resources', 'requests', 'storage')}")
+    elif kind == "HorizontalPodAutoscaler":
+        target = spec.get("scaleTargetRef") or {}
+        details.append(f"target={target.get('kind')}/{target.get('name')}")
+        details.append(f"replicas={spec.get('minReplicas', 1)}-{spec.get('maxReplicas')}")
+    elif kind not in POD_SPEC_PATHS:
+        body = spec or {k: v for k, v in resource.items() if k not in ("apiVersion", "kind", "metadata")}
+        if body:
+            details.append(("spec: " if spec else "") + ",".join(map(str, body)))
+
+    pod_spec = _get(resource, *POD_SPEC_PATHS[kind]) if kind in POD_SPEC_PATHS else None
+    if isinstance(pod_spec, dict):
+        details.extend(_pod_references(pod_spec))
+    return details
+
+
+def summarize_resource(resource) -> dict:
+    """리소스 dict 하나 → 인벤토리 행.
+
+    Returns:
+        {"kind", "name", "namespace", "images": [...], "ports": [...], "details": [...]}
+    """
+    if not isinstance(resource, dict):
+        return {"kind": "(매핑 아님)", "name": "", "namespace": "", "images": [], "ports": [], "details": []}
+    kind = str(resource.get("kind") or "(kind 없음)")
+    metadata = resource.get("metadata") if isinstance(resource.get("metadata"), dict) else {}
+    if kind in _CLUSTER_SCOPED:
+        namespace = "(클러스터)"
+    else:
+        namespace = str(metadata.get("namespace") or "-")
+
+    images, ports = [], []
+    pod_spec = _get(resource, *POD_SPEC_PATHS[kind]) if kind in POD_SPEC_PATHS else None
+    if isinstance(pod_spec, dict):
+        for field, suffix in (("initContainers", " (init)"), ("containers", "")):
+            for container in _items(pod_spec.get(field)):
+                if container.get("image"):
+                    images.append(f"{container['image']}{suffix}")
+                ports.extend(_container_ports(container))
+    elif kind == "Service" and isinstance(resource.get("spec"), dict):
+        ports = _service_ports(resource["spec"])
+    else:
+        # EndpointSlice처럼 최상위에 ports가 있는 리소스
+        ports = [
+            f"{port.get('port')}/{port.get('protocol', 'TCP')}"
+            for port in _items(resource.get("ports"))
+            if port.get("port") is not None
+        ]
+
+    return {
+        "kind": kind,
+        "name": str(metadata.get("name") or metadata.get("generateName") or ""),
+        "namespace": namespace,
+        "images": list(dict.fromkeys(images)),
+        "ports": ports,
+        "details": _details(kind, resource),
+    }
+
+
+def iter_inventory(yaml_content: str):
+    """문서를 하나씩 파싱해 인벤토리 행을 생성. 빈 문서는 건너뜀.
+
+    채팅으로 붙여 넣은 Windows(CRLF) 스트림도 validator.iter_documents가 '---\\r\\n'을 구분자로 인식하므로
+    LF 스트림과 같은 결과가 됩니다.
+
+    행에는 summarize_resource 항목과 "line"(시작 줄, 1부터), 파싱 실패 시 "error"가 추가됩니다.
+    """
+    for offset, text in iter_documents(yaml_content):
+        try:
+            resource = yaml.load(text, Loader=_Loader)
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None)
+            line = offset + mark.line + 1 if mark else offset + 1
+            yield {"line": line, "error": getattr(e, "problem", None) or str(e)}
+            continue
+        if resource is None:
+            continue
+        # 문서 시작 줄: 구분자/주석/빈 줄 다음의 첫 내용 줄
+        leading = next(
+            (i for i, line in enumerate(text.splitlines()) if line.strip() and not line.lstrip().startswith(("#", "---"))),
+            0,
+        )
+        yield {"line": offset + leading + 1, **summarize_resource(resource)}
+
+
+def _cell(values) -> str:
+    text = ", ".join(values) if isinstance(values, list) else str(values)
+    text = text.replace("|", "\\|") or "-"
+    return text if len(text) <= MAX_CELL_CHARS else text[: MAX_CELL_CHARS - 3] + "..."
+
+
+def format_inventory(yaml_content: str) -> str:
+    """인벤토리 표 문자열. 행은 MAX_ROWS개까지 출력하고, 개수 집계는 모든 문서를 대상으로 함."""
+    kinds: Counter = Counter()
+    rows = []
+    errors = []
+    total = 0
+    for row in iter_inventory(yaml_content):
+        total += 1
+        if "error" in row:
+            errors.append(f"- 문서 {total} (line {row['line']}): YAML 파싱 오류 - {row['error']}")
+            continue
+        kinds[row["kind"]] += 1
+        if len(rows) < MAX_ROWS:
+            rows.append(
+                "| "
+                + " | ".join(
+                    [str(total), str(row["line"])]
+                    + [_cell(row[key]) for key in ("kind", "name", "namespace", "images", "ports", "details")]
+                )
+                + " |"
+            )
+
+    if not total:
+        return "[YAML 분석] 리소스가 없습니다."
+    summary = ", ".join(f"{kind} {count}" for kind, count in kinds.most_common())
+    lines = [f"[YAML 분석] 문서 {total}개, 리소스 {sum(kinds.values())}개 ({summary or '-'})"]
+    if rows:
+        lines.append("| " + " | ".join(_COLUMNS) + " |")
+        lines.append("|" + "---|" * len(_COLUMNS))
+        lines.extend(rows)
+    if sum(kinds.values()) > len(rows):
+        lines.append(f"... (리소스 {sum(kinds.values()) - len(rows)}개 생략)")
+    if errors:
+        lines.append("[파싱 오류]")
+        lines.extend(errors)
+    return "\n".join(lines)
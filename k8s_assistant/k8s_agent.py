@@ -14,13 +14,72 @@ from k8s_assistant.yaml_tools import (
     generate_multi_resource,
     diff_yaml,
 )
+from k8s_assistant.policy import PolicyError
+from k8s_assistant.validator import BUILTIN_CATEGORIES, all_categories
+
+
+def _check_categories() -> list[str]:
+    """validate_yaml의 카테고리 목록. 정책 플러그인을 로드할 수 없으면 내장 카테고리만 (오류는 도구 결과로 보고)."""
+    try:
+        return all_categories()
+    except PolicyError:
+        return BUILTIN_CATEGORIES
+
+
+# generate_yaml/generate_multi_resource의 렌더링 스펙 (renderer.py)
+SPEC_PARAMETER = {
+    "type": "object",
+    "description": "렌더링 스펙. 채우면 YAML을 직접 작성하지 말고 반환된 매니페스트를 사용하세요. 명시하지 않은 값은 템플릿 기본값을 사용합니다.",
+    "properties": {
+        "name": {"type": "string", "description": "리소스/컨테이너 이름 (app 레이블)"},
+        "namespace": {"type": "string"},
+        "image": {"type": "string", "description": "컨테이너 이미지 (태그 포함, 워크로드에 필수)"},
+        "port": {"type": "integer", "description": "컨테이너 포트 (기본 8080)"},
+        "service_port": {"type": "integer", "description": "Service/Ingress 포트 (기본값은 port)"},
+        "replicas": {"type": "integer"},
+        "host": {"type": "string", "description": "Ingress 호스트"},
+        "storage": {"type": "string", "description": "PVC/StatefulSet 스토리지 크기 (예: 10Gi)"},
+        "schedule": {"type": "string", "description": "CronJob 스케줄"},
+        "command": {"type": "array", "items": {"type": "string"}},
+        "args": {"type": "array", "items": {"type": "string"}},
+        "min_replicas": {"type": "integer"},
+        "max_replicas": {"type": "integer"},
+        "resources": {
+            "type": "object",
+            "description": "컨테이너 resources (기본값에 덮어씀). 예: {'limits': {'memory': '512Mi'}}",
+        },
+        "probes": {
+            "type": "object",
+            "description": "헬스체크. {'path': '/healthz'}는 liveness/readiness 모두에 적용. {'liveness': {...}, 'readiness': {...}}로 따로 지정, 항목마다 path/port/tcp/exec/initialDelaySeconds/periodSeconds 사용 가능. Job/CronJob에는 적용하지 않음",
+        },
+        "env": {
+            "type": ["object", "array"],
+            "description": "평문 환경변수 {이름: 값} 또는 [{'name': ..., 'value': ...}] (valueFrom 항목도 가능)",
+        },
+        "env_from": {
+            "type": "array",
+            "items": {"type": "object"},
+            "description": "envFrom 참조 [{'kind': 'ConfigMap'|'Secret', 'name': ...}]",
+        },
+        "config": {"type": "object", "description": "ConfigMap data"},
+        "secret": {"type": "object", "description": "Secret stringData (평문, 예시 값)"},
+        "labels": {"type": "object"},
+        "annotations": {"type": "object"},
+        "security_context": {"type": "object", "description": "컨테이너 securityContext (기본 allowPrivilegeEscalation: false)"},
+        "overrides": {
+            "type": "object",
+            "description": "리소스 종류별로 덮어쓸 필드 {kind: {필드 트리}}. 값을 null로 주면 삭제",
+        },
+    },
+    "required": ["name"],
+}
 
 TOOLS = [
     {
         "type": "function",
         "function": {
             "name": "analyze_repo",
-            "description": "레포지토리의 Dockerfile, docker-compose, 환경변수, 소스 코드 엔트리포인트 등을 분석하여 K8s 배포에 필요한 정보(이미지, 포트, 환경변수, 의존 서비스 등)를 추출합니다. 사용자가 레포지토리 경로를 제공하면 반드시 이 도구를 먼저 호출하세요.",
+            "description": "레포지토리의 Dockerfile, docker-compose, 환경변수, 소스 코드 엔트리포인트 등을 분석하여 K8s 배포에 필요한 정보(이미지, 포트, 환경변수, 의존 서비스 등)를 추출합니다. 모노레포(services/*, cmd/* 등)는 서비스를 자동으로 찾아 서비스별 요약을 함께 반환합니다. 사용자가 레포지토리 경로를 제공하면 반드시 이 도구를 먼저 호출하세요.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -37,14 +96,18 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "analyze_yaml",
-            "description": "입력된 Kubernetes YAML 매니페스트를 분석하여 리소스 종류, 주요 설정, 동작을 설명합니다.",
+            "description": "입력된 Kubernetes YAML 매니페스트(여러 문서 가능)를 문서 단위로 파싱해 리소스별 인벤토리(kind, name, namespace, 이미지, 포트, 주요 설정) 표를 반환합니다.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "yaml_content": {
                         "type": "string",
                         "description": "분석할 Kubernetes YAML 매니페스트 전문",
-                    }
+                    },
+                    "include_yaml": {
+                        "type": "boolean",
+                        "description": "원본 YAML도 함께 반환할지 여부 (기본 false, 사용자가 원본 인용을 요청한 경우에만 true)",
+                    },
                 },
                 "required": ["yaml_content"],
             },
@@ -54,7 +117,7 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "generate_yaml",
-            "description": "자연어 요구사항을 기반으로 Kubernetes YAML 매니페스트를 생성합니다.",
+            "description": "자연어 요구사항을 기반으로 Kubernetes YAML 매니페스트를 생성합니다. spec을 채우면 템플릿을 로컬에서 렌더링한 완성 YAML과 검증 결과를 반환하고, 없으면 참고 템플릿을 반환합니다.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -67,6 +130,7 @@ TOOLS = [
                         "items": {"type": "string"},
                         "description": "생성할 리소스 종류 목록 (예: ['Deployment', 'Service']). 비어있으면 요구사항에서 추론합니다.",
                     },
+                    "spec": SPEC_PARAMETER,
                 },
                 "required": ["requirement"],
             },
@@ -76,7 +140,7 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "validate_yaml",
-            "description": "Kubernetes YAML의 보안, 리소스 제한, 베스트 프랙티스를 검증합니다.",
+            "description": "Kubernetes YAML의 보안, 리소스 제한, 베스트 프랙티스를 검증합니다. OpenAPI 스키마가 설치되어 있으면 필드 이름 오타, 타입, 필수 필드도 검사합니다.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -88,15 +152,13 @@ TOOLS = [
                         "type": "array",
                         "items": {
                             "type": "string",
-                            "enum": [
-                                "security",
-                                "resources",
-                                "reliability",
-                                "networking",
-                                "all",
-                            ],
+                            "enum": _check_categories() + ["all"],
                         },
-                        "description": "검증할 카테고리. 기본값은 ['all'].",
+                        "description": "검증할 카테고리. 기본값은 ['all']. policy 등 조직 정책 카테고리는 정책 플러그인이 있을 때만 포함됩니다.",
+                    },
+                    "k8s_version": {
+                        "type": "string",
+                        "description": "스키마 검증에 사용할 Kubernetes 버전 (예: '1.29.0'). 사용자가 클러스터 버전을 언급했을 때만 지정하세요.",
                     },
                 },
                 "required": ["yaml_content"],
@@ -107,7 +169,7 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "generate_multi_resource",
-            "description": "연관된 여러 Kubernetes 리소스를 한 번에 생성합니다 (예: Deployment + Service + Ingress).",
+            "description": "연관된 여러 Kubernetes 리소스를 한 번에 생성합니다 (예: Deployment + Service + Ingress). 하나의 spec으로 모든 리소스를 로컬에서 렌더링합니다.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -120,6 +182,7 @@ TOOLS = [
                         "items": {"type": "string"},
                         "description": "생성할 리소스 종류 목록 (예: ['Deployment', 'Service', 'Ingress'])",
                     },
+                    "spec": SPEC_PARAMETER,
                 },
                 "required": ["requirement", "resource_types"],
             },
@@ -129,7 +192,7 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "diff_yaml",
-            "description": "두 개의 Kubernetes YAML 매니페스트를 비교하여 차이점을 설명합니다.",
+            "description": "두 개의 Kubernetes YAML 매니페스트를 구조적으로 비교합니다. 리소스를 (kind, namespace, name)으로, 컨테이너 등 리스트 항목을 name 등 병합 키로 짝지어 변경된 경로(+ 추가, - 삭제, ~ 변경)만 반환합니다.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -162,6 +225,9 @@ SYSTEM_PROMPT = """당신은 Kubernetes YAML 전문가입니다. 사용자의 
 - 항상 적절한 도구(function)를 호출하여 작업하세요.
 - 사용자가 레포지토리 경로를 제공하면 반드시 analyze_repo를 먼저 호출하여 Dockerfile, 환경변수, 포트, 헬스체크 엔드포인트 등을 확인한 뒤 매니페스트를 생성하세요.
 - 레포 분석 결과를 기반으로 YAML을 생성할 때, Dockerfile의 EXPOSE 포트, 소스 코드의 환경변수, 실제 존재하는 엔드포인트를 정확히 반영하세요.
+- analyze_repo 결과에 [서비스 목록]이 있으면 모노레포입니다. 서비스별 요약(JSON)의 ports, env, cmd, dependencies를 사용해 서비스마다 매니페스트를 생성하고, 서비스 디렉토리를 다시 하나씩 분석하지 마세요.
+- analyze_yaml은 원본 대신 리소스 인벤토리 표를 반환합니다. 표의 참조(configMap=, secret=, selector=)로 리소스 간 관계를 설명하고, 세부 필드는 사용자가 입력한 YAML을 참고하세요.
+- YAML을 생성할 때는 generate_yaml/generate_multi_resource에 spec(image, port, replicas, resources, probes 등)을 채워 호출하세요. 반환된 [렌더링된 매니페스트]를 그대로 사용하고, 요구사항에 맞게 바꿀 부분만 설명하거나 수정하세요. [직접 생성 필요] 리소스만 직접 작성하세요.
 - 환경변수 중 비밀번호, API 키 등 민감 정보는 Secret으로, 나머지는 ConfigMap으로 분리하세요.
 - YAML 생성 시 반드시 포함: metadata.labels, resources.requests/limits, securityContext
 - 생성된 YAML은 apiVersion, kind, metadata, spec 구조를 갖추세요.
@@ -176,19 +242,20 @@ SYSTEM_PROMPT = """당신은 Kubernetes YAML 전문가입니다. 사용자의 
 [안정성] livenessProbe, readinessProbe 설정 권장
 [안정성] replicas >= 2 권장 (프로덕션)
 [네트워킹] Service type 적절성, port/targetPort 매칭
+[스키마] 필드 이름 오타(SCH001), 타입(SCH002), 필수 필드(SCH003) - 도구 결과에 있으면 수정안을 함께 제시
 """
 
 TOOL_HANDLERS = {
     "analyze_repo": lambda args: analyze_repo(args["repo_path"]),
-    "analyze_yaml": lambda args: analyze_yaml(args["yaml_content"]),
+    "analyze_yaml": lambda args: analyze_yaml(args["yaml_content"], args.get("include_yaml", False)),
     "generate_yaml": lambda args: generate_yaml(
-        args["requirement"], args.get("resource_types")
+        args["requirement"], args.get("resource_types"), args.get("spec")
     ),
     "validate_yaml": lambda args: validate_yaml(
-        args["yaml_content"], args.get("check_categories")
+        args["yaml_content"], args.get("check_categories"), args.get("k8s_version")
     ),
     "generate_multi_resource": lambda args: generate_multi_resource(
-        args["requirement"], args["resource_types"]
+        args["requirement"], args["resource_types"], args.get("spec")
     ),
     "diff_yaml": lambda args: diff_yaml(args["yaml_before"], args["yaml_after"]),
 }
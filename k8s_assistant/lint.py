@@ -0,0 +1,381 @@
+"""매니페스트 일괄 검증 (LLM 호출 없음).
+
+디렉토리의 *.yaml/*.yml 파일이나 stdin(helm template 출력 등)을 읽어
+validator.py 규칙(내장 규칙 + 정책 플러그인)으로 검증하고, 발견사항을 JSON으로 집계합니다.
+
+  - 파일 목록은 디렉토리를 순회하면서 바로 워커에 넘기므로 전체 목록을 미리 만들지 않음
+  - 파싱/검증은 multiprocessing 풀의 워커가 수행 (캐시를 쓰지 않으면 파일 내용도 워커가 직접 읽고,
+    캐시를 쓰면 부모가 파일을 읽어 문서별 캐시를 확인한 뒤 바뀐 파일만 워커에 넘김)
+  - stdin은 helm의 '# Source: <path>' 주석 기준으로, 없으면 문서 STDIN_BATCH_DOCS개씩 나눠 병렬 처리
+  - 문서별 검증 결과는 (문서 sha256, 규칙 세트 버전) 기준으로 캐시하므로(LintCache),
+    다시 실행하면 바뀐 문서만 파싱/검증합니다
+  - --k8s-version을 주면 OpenAPI 스키마 검증도 수행 (워커마다 컴파일된 스키마를 한 번씩만 읽음)
+
+사용법:
+    python3 k8s_assistant/main.py lint k8s/
+    helm template ./chart | python3 k8s_assistant/main.py lint -
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from k8s_assistant.policy import PolicyError
+from k8s_assistant.validator import (
+    SEVERITIES,
+    cache_key,
+    rule_by_id,
+    ruleset_version,
+    split_documents,
+    validate_documents,
+)
+
+MANIFEST_EXTENSIONS = (".yaml", ".yml")
+# 워커에 한 번에 넘길 작업 수 (프로세스 간 통신 횟수 감소)
+CHUNK_SIZE = 16
+# helm Source 주석이 없는 stdin을 나눌 문서 수
+STDIN_BATCH_DOCS = 200
+
+# 발견사항 최고 심각도에 따른 종료 코드 (파싱 실패는 CRITICAL로 취급)
+EXIT_CODES = {"CRITICAL": 2, "WARNING": 1}
+ERROR_EXIT_CODE = 3
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "cache_data", "lint_cache.json")
+# 캐시에 보관할 최대 문서 수 (초과 시 이번 실행에서 사용하지 않은 오래된 항목부터 삭제)
+MAX_CACHE_ENTRIES = 200_000
+
+_HELM_SOURCE_RE = re.compile(r"^# Source: (.+?)\s*$", re.MULTILINE)
+
+
+class LintCache:
+    """문서 sha256 → validator.check_document 결과 캐시.
+
+    저장 구조 (cache_data/lint_cache.json, 스키마 검증 결과는 키가 "<sha256>@<k8s 버전>"):
+        {"version": ruleset_version(), "entries": {"<sha256>": {"line", "kind", "name", "error",
+                                                             "findings": [...]} | null, ...}}
+
+    저장된 version이 현재 ruleset_version()과 다르면(내장/정책 규칙 또는 검사 로직 변경)
+    전체를 버리고 새로 만듭니다. 정책 플러그인을 로드할 수 없으면 PolicyError가 발생합니다.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = MAX_CACHE_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.entries = self._load()
+        self._used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != ruleset_version():
+            return {}
+        return data.get("entries", {})
+
+    def lookup(self, split: list[tuple[int, str]], k8s_version: str | None = None) -> tuple[dict, bool]:
+        """문서들 중 캐시에 있는 결과를 찾아 사용 표시.
+
+        Returns:
+            ({cache_key: 결과} (캐시에 있는 문서만), 모든 문서가 캐시에 있는지 여부)
+        """
+        found = {}
+        complete = True
+        for _, text in split:
+            key = cache_key(text, k8s_version)
+            if key in self.entries:
+                found[key] = self.entries[key]
+                self.hits += 1
+            else:
+                complete = False
+        self._used.update(found)
+        return found, complete
+
+    def update(self, entries: dict):
+        with self._lock:
+            self.entries.update(entries)
+            self._used.update(entries)
+            self.misses += len(entries)
+
+    def save(self):
+        """새 결과가 있으면 파일에 저장. 최대 개수를 넘으면 이번 실행에서 사용하지 않은 항목부터 삭제."""
+        with self._lock:
+            if not self.misses and os.path.exists(self.path):
+                return
+            if len(self.entries) > self.max_entries:
+                unused = [key for key in self.entries if key not in self._used]
+                for key in unused[: len(self.entries) - self.max_entries]:
+                    del self.entries[key]
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                # json.dump(f)보다 한 번에 직렬화하는 json.dumps가 빠름 (C 인코더 사용)
+                payload = json.dumps({"version": ruleset_version(), "entries": self.entries}, ensure_ascii=False)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass  # 캐시 저장 실패는 무시
+
+
+def iter_manifest_files(root: str):
+    """root 아래 매니페스트 파일 경로를 순회하며 생성.
+
+    숨김 디렉토리와 Helm 차트의 templates/(렌더링 전 템플릿은 YAML이 아님)는 건너뜁니다.
+    """
+    if os.path.isfile(root):
+        yield root
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        skip = {"templates"} if "Chart.yaml" in filenames else set()
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in skip)
+        for filename in sorted(filenames):
+            if filename.endswith(MANIFEST_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def split_stdin(text: str) -> list[tuple[str, str, int]]:
+    """stdin 스트림을 작업 단위로 분할. [(이름, YAML 텍스트, 시작 줄 오프셋), ...]"""
+    sources = list(_HELM_SOURCE_RE.finditer(text))
+    if sources:
+        units = []
+        if text[: sources[0].start()].strip("-\n "):
+            units.append(("<stdin>", text[: sources[0].start()], 0))
+        for i, match in enumerate(sources):
+            end = sources[i + 1].start() if i + 1 < len(sources) else len(text)
+            offset = text.count("\n", 0, match.start())
+            units.append((match.group(1), text[match.start() : end], offset))
+        return units
+
+    documents = split_documents(text)
+    units = []
+    for i in range(0, len(documents), STDIN_BATCH_DOCS):
+        batch = documents[i : i + STDIN_BATCH_DOCS]
+        units.append(("<stdin>", "".join(doc for _, doc in batch), batch[0][0]))
+    return units
+
+
+def _read_unit(unit) -> tuple[str, str | None, int, str | None]:
+    """작업 단위 → (이름, YAML 텍스트, 줄 오프셋, 읽기 오류)."""
+    if not isinstance(unit, str):
+        name, text, offset = unit
+        return name, text, offset, None
+    try:
+        with open(unit, "r", encoding="utf-8", errors="replace") as f:
+            return unit, f.read(), 0, None
+    except OSError as e:
+        return unit, None, 0, str(e)
+
+
+def lint_unit(
+    unit,
+    categories: list[str] | None = None,
+    cache: dict | None = None,
+    split=None,
+    k8s_version: str | None = None,
+) -> dict:
+    """파일 경로 또는 (이름, 텍스트, 줄 오프셋) 하나를 검증.
+
+    cache(cache_key → 결과)를 주면 캐시된 문서는 건너뛰고 새 결과를 cache에 추가합니다.
+    split에 이미 나눈 문서 목록을 주면 다시 나누지 않습니다.
+    k8s_version을 주면 스키마 검증도 수행합니다.
+    """
+    name, text, offset, error = _read_unit(unit)
+    if error is not None:
+        return {"file": name, "documents": 0, "errors": [{"line": 0, "error": error}], "findings": []}
+
+    result = validate_documents(
+        split if split is not None else split_documents(text), categories, cache, k8s_version
+    )
+    errors = [
+        {"line": d["line"] + offset, "error": d["error"]} for d in result["documents"] if d["error"]
+    ]
+    findings = []
+    for f in result["findings"]:
+        finding = {
+            "rule": f["rule"],
+            "severity": f["severity"],
+            "line": f["line"] + offset,
+            "kind": f["kind"],
+            "name": f["name"],
+            "path": f["path"],
+        }
+        if f["detail"]:
+            finding["detail"] = f["detail"]
+        findings.append(finding)
+    return {"file": name, "documents": len(result["documents"]), "errors": errors, "findings": findings}
+
+
+def _lint_task(args):
+    """워커 작업: 검증 결과와, 캐시에 추가할 새 문서 결과를 함께 반환.
+
+    cached(cache_key → 결과)를 주면 그 문서들은 다시 파싱하지 않고, 새로 검증한 문서만 cache_entries로 반환합니다.
+    """
+    unit, categories, cached, k8s_version = args
+    entries = None if cached is None else dict(cached)
+    output = lint_unit(unit, categories, entries, k8s_version=k8s_version)
+    if cached is not None:
+        output["cache_entries"] = {key: entry for key, entry in entries.items() if key not in cached}
+    return output
+
+
+def _pending_units(units, categories, cache: "LintCache", done: list, k8s_version: str | None = None):
+    """캐시로 전부 처리되는 작업은 바로 검증해 done에 추가하고, 나머지만 워커 작업으로 생성.
+
+    일부 문서만 바뀐 작업은 캐시에 있는 문서 결과를 함께 넘겨, 워커가 바뀐 문서만 파싱/검증하게 합니다.
+    """
+    for unit in units:
+        name, text, offset, error = _read_unit(unit)
+        if error is not None:
+            done.append(lint_unit(unit))
+            continue
+        split = split_documents(text)
+        cached, complete = cache.lookup(split, k8s_version)
+        if complete:
+            done.append(lint_unit((name, text, offset), categories, cache.entries, split, k8s_version))
+        else:
+            yield (name, text, offset), categories, cached, k8s_version
+
+
+def run_lint(
+    target: str,
+    categories: list[str] | None = None,
+    jobs: int | None = None,
+    cache: LintCache | None = None,
+    k8s_version: str | None = None,
+) -> dict:
+    """target(디렉토리/파일/'-')을 병렬 검증하고 결과를 집계.
+
+    k8s_version을 주면 해당 버전의 OpenAPI 스키마 검증(SCH 규칙)도 수행합니다.
+
+    cache가 있으면 캐시된 문서만으로 이루어진 파일은 프로세스 풀 없이 바로 집계하고,
+    바뀐 파일은 캐시에 없는 문서만 워커에서 검증한 뒤 결과를 캐시에 저장합니다.
+
+    Returns:
+        {"target", "files", "documents", "parse_errors", "findings",
+         "by_severity": {심각도: 건수}, "by_rule": {규칙 ID: {"severity", "message", "count"}},
+         "results": [{"file", "documents", "errors", "findings"}, ...]  # 문제가 있는 파일만,
+         "k8s_version": 스키마 검증 버전 | None,
+         "cache": {"hits", "misses"} | None, "elapsed_sec", "files_per_sec"}
+    """
+    started = time.perf_counter()
+    try:
+        # 정책 플러그인은 워커를 만들기 전에 부모에서 한 번 로드 (잘못된 정책은 오류로 보고)
+        ruleset_version()
+    except PolicyError as e:
+        return {"target": target, "error": f"정책 플러그인 로드 실패 - {e}"}
+    if target == "-":
+        units = split_stdin(sys.stdin.read())
+    elif os.path.exists(target):
+        units = iter_manifest_files(target)
+    else:
+        return {"target": target, "error": f"경로를 찾을 수 없습니다: {target}"}
+
+    done: list[dict] = []
+    if cache is None:
+        tasks = ((unit, categories, None, k8s_version) for unit in units)
+    else:
+        # 캐시 확인은 워커 시작 전에 모두 끝내서, 바뀐 파일이 없으면 풀을 만들지 않음
+        tasks = list(_pending_units(units, categories, cache, done, k8s_version))
+
+    jobs = jobs or os.cpu_count() or 1
+    pool = None
+    if jobs == 1 or (cache is not None and len(tasks) <= CHUNK_SIZE):
+        outputs = map(_lint_task, tasks)
+    else:
+        pool = multiprocessing.Pool(processes=jobs)
+        outputs = pool.imap_unordered(_lint_task, tasks, chunksize=CHUNK_SIZE)
+
+    by_file: dict[str, dict] = {}
+    summary = {
+        "target": target,
+        "files": 0,
+        "documents": 0,
+        "parse_errors": 0,
+        "findings": 0,
+        "by_severity": {severity: 0 for severity in SEVERITIES},
+        "by_rule": {},
+        "results": [],
+        "k8s_version": k8s_version,
+        "cache": None,
+    }
+    try:
+        for output in _chain(done, outputs):
+            entries = output.pop("cache_entries", None)
+            if entries is not None:
+                cache.update(entries)
+            summary["documents"] += output["documents"]
+            summary["parse_errors"] += len(output["errors"])
+            summary["findings"] += len(output["findings"])
+            for finding in output["findings"]:
+                summary["by_severity"][finding["severity"]] += 1
+                rule = summary["by_rule"].setdefault(
+                    finding["rule"],
+                    {
+                        "severity": finding["severity"],
+                        "message": rule_by_id(finding["rule"])["message"],
+                        "count": 0,
+                    },
+                )
+                rule["count"] += 1
+            merged = by_file.get(output["file"])
+            if merged is None:
+                by_file[output["file"]] = output
+            else:  # stdin을 나눈 작업 단위는 다시 합침
+                merged["documents"] += output["documents"]
+                merged["errors"].extend(output["errors"])
+                merged["findings"].extend(output["findings"])
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    if cache is not None:
+        cache.save()
+        summary["cache"] = {"hits": cache.hits, "misses": cache.misses}
+
+    elapsed = time.perf_counter() - started
+    summary["files"] = len(by_file)
+    summary["results"] = [
+        output for _, output in sorted(by_file.items()) if output["errors"] or output["findings"]
+    ]
+    for output in summary["results"]:
+        output["errors"].sort(key=lambda e: e["line"])
+        output["findings"].sort(key=lambda f: f["line"])
+    summary["by_rule"] = dict(sorted(summary["by_rule"].items()))
+    summary["elapsed_sec"] = round(elapsed, 3)
+    summary["files_per_sec"] = round(len(by_file) / elapsed, 1) if elapsed > 0 else None
+    return summary
+
+
+def _chain(first: list, rest):
+    yield from first
+    yield from rest
+
+
+def exit_code(summary: dict) -> int:
+    """최고 심각도에 따른 종료 코드 (파싱 실패는 CRITICAL)."""
+    if summary.get("error"):
+        return ERROR_EXIT_CODE
+    if summary["parse_errors"]:
+        return EXIT_CODES["CRITICAL"]
+    return max(
+        (code for sev, code in EXIT_CODES.items() if summary["by_severity"].get(sev)),
+        default=0,
+    )
+
+
+def to_json(summary: dict, summary_only: bool = False) -> str:
+    """검증 결과를 JSON 문자열로 변환 (summary_only이면 파일별 결과 제외)."""
+    if summary_only:
+        summary = {k: v for k, v in summary.items() if k != "results"}
+    return json.dumps(summary, ensure_ascii=False, indent=2)
@@ -1,10 +1,9 @@
+import argparse
 import os
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from k8s_assistant.k8s_agent import K8sAgent
-
 
 HELP_TEXT = """
 사용 가능한 기능:
@@ -19,6 +18,9 @@ HELP_TEXT = """
   clear - 대화 초기화
   quit  - 종료
 
+일괄 검증 (LLM 호출 없음):
+  python3 k8s_assistant/main.py lint <디렉토리|파일|->
+
 YAML 입력 방법:
   apiVersion: 또는 kind: 또는 --- 로 시작하면
   멀티라인 모드가 활성화됩니다.
@@ -55,7 +57,63 @@ def is_yaml_start(line: str) -> bool:
     return line.startswith(("apiVersion:", "kind:", "---"))
 
 
+def run_lint(argv: list[str]) -> int:
+    """비대화형 일괄 검증: lint <dir|file|-> [--categories ...] [--jobs N]"""
+    from k8s_assistant.lint import ERROR_EXIT_CODE, LintCache, exit_code, run_lint as lint, to_json
+    from k8s_assistant.policy import PolicyError
+    from k8s_assistant.schema import available_versions, resolve_version
+    from k8s_assistant.validator import all_categories
+
+    try:
+        categories = all_categories()
+    except PolicyError as e:
+        print(f"[오류] 정책 플러그인 로드 실패 - {e}", file=sys.stderr)
+        return ERROR_EXIT_CODE
+
+    parser = argparse.ArgumentParser(
+        prog="k8s_assistant lint",
+        description="매니페스트 디렉토리/파일/stdin을 병렬로 검증하고 결과를 JSON으로 출력합니다.",
+    )
+    parser.add_argument("target", help="검증할 디렉토리 또는 파일 ('-'이면 stdin)")
+    parser.add_argument("--categories", nargs="+", choices=categories, help="검증할 카테고리 (기본: 전체)")
+    parser.add_argument("--jobs", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--summary-only", action="store_true", help="파일별 결과 없이 집계만 출력")
+    parser.add_argument("--no-cache", action="store_true", help="이전 검증 결과를 재사용하지 않음")
+    parser.add_argument("--cache", default=None, help="검증 결과 캐시 경로 (기본: k8s_assistant/cache_data/lint_cache.json)")
+    parser.add_argument(
+        "--k8s-version",
+        default=None,
+        help="이 버전의 OpenAPI 스키마로 필드/타입도 검증 (예: 1.29.0, k8s_assistant/schemas에 설치 필요)",
+    )
+    opts = parser.parse_args(argv)
+
+    if opts.k8s_version and resolve_version(opts.k8s_version) is None:
+        installed = ", ".join(available_versions()) or "없음"
+        print(f"[오류] k8s {opts.k8s_version} 스키마가 없습니다 (설치된 버전: {installed})", file=sys.stderr)
+        return ERROR_EXIT_CODE
+
+    cache = None if opts.no_cache else (LintCache(opts.cache) if opts.cache else LintCache())
+    summary = lint(opts.target, opts.categories, opts.jobs, cache, opts.k8s_version)
+    print(to_json(summary, opts.summary_only))
+    if summary.get("error"):
+        print(f"[오류] {summary['error']}", file=sys.stderr)
+    else:
+        print(
+            f"{summary['files']}개 파일 / {summary['documents']}개 문서 검증: "
+            f"{summary['elapsed_sec']}초 ({summary['files_per_sec']} files/sec)"
+            + (f", 캐시 적중 {summary['cache']['hits']}개 문서" if summary["cache"] else ""),
+            file=sys.stderr,
+        )
+    return exit_code(summary)
+
+
 def main():
+    if sys.argv[1:2] == ["lint"]:
+        sys.exit(run_lint(sys.argv[2:]))
+
+    # 대화형 모드에서만 LLM 클라이언트가 필요하므로 지연 import (lint는 API 키 없이 실행)
+    from k8s_assistant.k8s_agent import K8sAgent
+
     usage_enabled = "--usage" in sys.argv
 
     print("=== Kubernetes YAML Assistant ===")
@@ -0,0 +1,214 @@
+"""모노레포 서비스 탐색과 서비스별 요약 매니페스트.
+
+services/*/, apps/*/, cmd/*/ 같은 디렉토리(와 Dockerfile이 있는 최상위 디렉토리)를 서비스로 보고,
+서비스마다 Dockerfile/의존성 파일/환경변수 예시를 스레드 풀에서 동시에 읽어
+K8s 매니페스트 생성에 필요한 항목만 담은 요약(dict)을 만듭니다.
+
+서비스 탐색 패턴(discovery_patterns)은 analyze_repo의 scan_repo 순회에 함께 넣으므로
+레포 전체 순회는 한 번뿐이고, 서비스별 순회는 해당 서비스 디렉토리 안에서만 수행합니다.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from k8s_assistant.repo_scanner import read_head, scan_repo
+
+# 서비스를 담는 디렉토리 이름 (그 바로 아래 디렉토리가 서비스)
+SERVICE_ROOTS = ["services", "apps", "cmd", "packages", "svc", "microservices"]
+# 서비스 디렉토리로 판단하는 파일
+SERVICE_MARKERS = [
+    "Dockerfile",
+    "go.mod",
+    "main.go",
+    "package.json",
+    "requirements.txt",
+    "pyproject.toml",
+    "pom.xml",
+    "build.gradle",
+    "Cargo.toml",
+]
+# 단일 앱의 바이너리 엔트리포인트를 두는 디렉토리 (cmd/app/main.go 등).
+# 자체 Dockerfile이 있거나 루트에 빌드 파일(ROOT_BUILD_FILES)이 없을 때만 서비스로 봄
+ENTRYPOINT_ROOTS = ["cmd"]
+# 레포 루트에 있으면 레포 전체를 하나의 빌드 단위로 보는 파일
+ROOT_BUILD_FILES = [marker for marker in SERVICE_MARKERS if marker != "main.go"]
+# 서비스별 스캔 스레드 수
+SERVICE_WORKERS = 8
+# 요약할 최대 서비스 수
+MAX_SERVICES = 100
+# 의존성 파일은 앞부분만 읽음
+DEPENDENCY_LINES = 500
+
+# 언어 판별 (마커 파일 → 언어, 앞쪽이 우선)
+_LANGUAGES = [
+    ("go.mod", "Go"),
+    ("main.go", "Go"),
+    ("Cargo.toml", "Rust"),
+    ("pom.xml", "Java"),
+    ("build.gradle", "Java"),
+    ("package.json", "Node.js"),
+    ("pyproject.toml", "Python"),
+    ("requirements.txt", "Python"),
+]
+
+# 의존성 이름에 포함된 문자열 → 외부 서비스 (K8s에서 별도 리소스/Secret이 필요한 대상)
+_DEPENDENCY_HINTS = [
+    (("redis",), "Redis"),
+    (("postgres", "psycopg", "pgx", "lib/pq", "asyncpg", '"pg"'), "PostgreSQL"),
+    (("mysql",), "MySQL"),
+    (("mongo",), "MongoDB"),
+    (("kafka",), "Kafka"),
+    (("amqp", "rabbitmq", "pika"), "RabbitMQ"),
+    (("elasticsearch", "opensearch"), "Elasticsearch"),
+    (("nats",), "NATS"),
+    (("grpc",), "gRPC"),
+]
+
+# 의존 서비스를 추정할 의존성 파일
+_DEPENDENCY_FILES = ["go.mod", "package.json", "requirements.txt", "pyproject.toml", "pom.xml", "build.gradle", "Cargo.toml"]
+
+_ENV_FILES = [".env.example", ".env.sample", ".env.template"]
+_ENV_KEY_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=", re.MULTILINE)
+
+
+def discovery_patterns() -> list[str]:
+    """서비스 탐색용 scan_repo 패턴."""
+    patterns = [f"{root}/*/{marker}" for root in SERVICE_ROOTS for marker in SERVICE_MARKERS]
+    patterns.append("*/Dockerfile")
+    patterns.extend(ROOT_BUILD_FILES)
+    return patterns
+
+
+def discover_services(matches: dict[str, list[str]]) -> list[str]:
+    """scan_repo 결과에서 서비스 디렉토리(레포 기준 상대 경로) 목록을 추출.
+
+    cmd/* 디렉토리는 자체 Dockerfile이 있거나 레포 루트에 빌드 파일이 없을 때만 서비스로 봅니다.
+    루트 go.mod/Dockerfile로 빌드하는 단일 앱의 cmd/app/main.go는 서비스가 아니라 엔트리포인트입니다.
+    """
+    root_build = any(matches.get(name) for name in ROOT_BUILD_FILES)
+    services = set()
+    for root in SERVICE_ROOTS:
+        markers = ["Dockerfile"] if root_build and root in ENTRYPOINT_ROOTS else SERVICE_MARKERS
+        for marker in markers:
+            for rel_path in matches.get(f"{root}/*/{marker}", []):
+                services.add(os.path.dirname(rel_path))
+    for rel_path in matches.get("*/Dockerfile", []):
+        services.add(os.path.dirname(rel_path))
+    return sorted(services)
+
+
+def parse_dockerfile(text: str) -> dict:
+    """Dockerfile에서 베이스 이미지, 포트, 실행 명령, 환경변수 키 등을 추출."""
+    info = {"base_images": [], "ports": [], "env": [], "args": []}
+    logical = re.sub(r"\\\s*\n", " ", text)
+    for line in logical.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        instruction, _, rest = line.partition(" ")
+        instruction = instruction.upper()
+        rest = rest.strip()
+        if instruction == "FROM":
+            tokens = [t for t in rest.split() if not t.startswith("--")]
+            if tokens:
+                info["base_images"].append(tokens[0])
+        elif instruction == "EXPOSE":
+            for token in rest.split():
+                port = token.split("/")[0]
+                info["ports"].append(int(port) if port.isdigit() else port)
+        elif instruction in ("ENV", "ARG"):
+            key = "env" if instruction == "ENV" else "args"
+            if "=" in rest.split(" ", 1)[0]:
+                names = [t.split("=", 1)[0] for t in rest.split() if "=" in t]
+            else:
+                names = [rest.split()[0]] if rest else []
+            info[key].extend(n for n in names if n not in info[key])
+        elif instruction in ("CMD", "ENTRYPOINT"):
+            info[instruction.lower()] = _exec_form(rest)
+        elif instruction in ("USER", "HEALTHCHECK"):
+            info[instruction.lower()] = rest
+    return info
+
+
+def _exec_form(value: str) -> str:
+    """exec 형식(["a", "b"])이면 공백으로 이어 붙인 명령으로 변환."""
+    if value.startswith("["):
+        try:
+            return " ".join(str(v) for v in json.loads(value))
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return value
+
+
+def _dependency_text(service_dir: str, files) -> str:
+    parts = []
+    for name in _DEPENDENCY_FILES:
+        if name in files:
+            parts.append(read_head(os.path.join(service_dir, name), DEPENDENCY_LINES) or "")
+    return "\n".join(parts).lower()
+
+
+def summarize_service(repo_path: str, rel_dir: str, entrypoints: list[str]) -> dict:
+    """서비스 디렉토리 하나를 스캔해 요약 매니페스트 생성.
+
+    Returns:
+        {"name", "path", "language", "entrypoint", "base_image", "ports", "cmd",
+         "env", "dependencies", ...}  # 값이 없는 항목은 생략
+    """
+    service_dir = os.path.join(repo_path, rel_dir)
+    patterns = SERVICE_MARKERS + _ENV_FILES + entrypoints
+    scan = scan_repo(service_dir, patterns)
+    files = {pattern: paths for pattern, paths in scan["matches"].items() if paths}
+
+    manifest = {"name": os.path.basename(rel_dir), "path": rel_dir}
+    manifest["language"] = next((lang for marker, lang in _LANGUAGES if marker in files), None)
+    manifest["entrypoint"] = next(
+        (paths[0] for pattern in entrypoints for paths in [files.get(pattern)] if paths), None
+    )
+
+    if "Dockerfile" in files:
+        docker = parse_dockerfile(read_head(os.path.join(service_dir, "Dockerfile"), DEPENDENCY_LINES) or "")
+        images = docker["base_images"]
+        manifest["base_image"] = images[-1] if images else None
+        if len(images) > 1:
+            manifest["build_image"] = images[0]
+        manifest["ports"] = docker["ports"]
+        manifest["cmd"] = " ".join(filter(None, [docker.get("entrypoint"), docker.get("cmd")])) or None
+        manifest["user"] = docker.get("user")
+        manifest["healthcheck"] = docker.get("healthcheck")
+        manifest["env"] = docker["env"]
+
+    env_keys = list(manifest.get("env") or [])
+    for name in _ENV_FILES:
+        if name in files:
+            for key in _ENV_KEY_RE.findall(read_head(os.path.join(service_dir, name)) or ""):
+                if key not in env_keys:
+                    env_keys.append(key)
+    manifest["env"] = env_keys
+
+    if "go.mod" in files:
+        go_mod = read_head(os.path.join(service_dir, "go.mod"), 5) or ""
+        module = re.search(r"^module\s+(\S+)", go_mod, re.MULTILINE)
+        manifest["module"] = module.group(1) if module else None
+
+    dependencies = _dependency_text(service_dir, files)
+    manifest["dependencies"] = [
+        label for needles, label in _DEPENDENCY_HINTS if any(n in dependencies for n in needles)
+    ]
+    return {key: value for key, value in manifest.items() if value not in (None, [], "")}
+
+
+def scan_services(repo_path: str, services: list[str], entrypoints: list[str]) -> list[dict]:
+    """서비스 목록을 스레드 풀(SERVICE_WORKERS)에서 동시에 요약 (입력 순서 유지)."""
+    with ThreadPoolExecutor(max_workers=SERVICE_WORKERS) as pool:
+        return list(pool.map(lambda rel_dir: summarize_service(repo_path, rel_dir, entrypoints), services))
+
+
+def render_services(manifests: list[dict], total: int) -> str:
+    """서비스 요약을 한 줄에 하나씩 JSON으로 출력 (에이전트가 한 번의 도구 결과로 사용)."""
+    lines = [json.dumps(m, ensure_ascii=False, separators=(",", ":")) for m in manifests]
+    if total > len(manifests):
+        lines.append(f"... (서비스 {total - len(manifests)}개 생략)")
+    return "\n".join(lines)
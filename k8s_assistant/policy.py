@@ -0,0 +1,290 @@
+"""조직 정책 규칙 플러그인 (선언형 규칙 파일 → 컴파일된 매처).
+
+정책 디렉토리(기본: k8s_assistant/policies/, K8S_POLICY_DIR 환경변수로 변경)의
+*.yaml/*.yml/*.json 파일에서 규칙 목록을 읽습니다.
+
+    - id: ORG001
+      severity: WARNING            # CRITICAL / WARNING / INFO
+      category: policy             # 생략하면 policy
+      message: "team 레이블이 필요합니다."
+      kinds: [Deployment, StatefulSet]   # 생략하거나 "*"면 클러스터 범위 리소스를 제외한 모든 리소스
+      select: metadata.labels.team
+      present: true
+
+    - id: ORG002
+      severity: CRITICAL
+      message: "사내 레지스트리 이미지만 사용할 수 있습니다."
+      kinds: [Deployment]
+      select: $containers.image
+      matches: "^registry\\.example\\.com/"
+
+선택자(select): '.'로 구분한 경로. name[*](리스트 전체), name[0](인덱스), *(맵의 모든 값),
+["a.b/c"](점이 들어간 키). $pod는 리소스 종류별 Pod spec, $containers는 initContainers/containers 전체.
+조건(predicate, 여러 개면 모두 만족해야 통과):
+    present(true/false), equals, not_equals, in, not_in, matches, not_matches(정규식),
+    min, max(숫자 또는 "500m", "2Gi" 같은 수량)
+present 외의 조건은 값이 없으면 검사하지 않습니다.
+when: [{select, <조건>}, ...]를 주면 모든 when 조건을 만족하는 리소스에만 적용합니다.
+
+규칙은 로드할 때 한 번 컴파일(선택자 분해, 정규식/수량 해석)되고, validator.py가 내장 규칙과 함께
+리소스 종류별로 색인해 문서마다 해당 kind의 규칙만 노드 트리에서 평가합니다.
+"""
+
+import json
+import os
+import re
+
+import yaml
+
+from k8s_assistant.templates import POD_KINDS
+
+# 정책 디렉토리 (K8S_POLICY_DIR 환경변수로 변경 가능)
+POLICY_DIR = os.environ.get("K8S_POLICY_DIR") or os.path.join(os.path.dirname(__file__), "policies")
+POLICY_EXTENSIONS = (".yaml", ".yml", ".json")
+# category를 생략한 규칙의 카테고리
+DEFAULT_CATEGORY = "policy"
+
+SEVERITIES = ("CRITICAL", "WARNING", "INFO")
+_PREDICATES = ("present", "equals", "not_equals", "in", "not_in", "matches", "not_matches", "min", "max")
+_SELECTOR_TOKEN_RE = re.compile(r'\.?([A-Za-z0-9_$\-]+|\*)|\["([^"]+)"\]|\[(\*|\d+)\]')
+_QUANTITY_RE = re.compile(r"^([+-]?\d+(?:\.\d+)?)(m|k|M|G|T|P|Ki|Mi|Gi|Ti|Pi)?$")
+_QUANTITY_UNITS = {
+    None: 1,
+    "m": 1e-3,
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+    "P": 1e15,
+    "Ki": 2**10,
+    "Mi": 2**20,
+    "Gi": 2**30,
+    "Ti": 2**40,
+    "Pi": 2**50,
+}
+
+
+# 선택한 노드의 값이 없음 / 스칼라가 아님 (조건 검사 함수에 넘기는 표식)
+MISSING = object()
+NOT_SCALAR = object()
+
+
+class PolicyError(ValueError):
+    """정책 파일 또는 규칙 정의 오류."""
+
+
+# ---------------------------------------------------------------------------
+# 선택자
+# ---------------------------------------------------------------------------
+
+
+def parse_selector(selector: str) -> tuple:
+    """선택자 문자열 → 세그먼트 튜플.
+
+    ("key", 이름) / ("index", n) / ("each",) 리스트 전체 / ("values",) 맵의 모든 값 /
+    ("$pod",) / ("$containers",) (맨 앞에만)
+    """
+    segments = []
+    pos = 0
+    while pos < len(selector):
+        match = _SELECTOR_TOKEN_RE.match(selector, pos)
+        if not match or match.end() == pos:
+            raise PolicyError(f"선택자 해석 실패: {selector!r} (위치 {pos})")
+        name, quoted, bracket = match.groups()
+        if name in ("$pod", "$containers"):
+            if segments:
+                raise PolicyError(f"{name}는 선택자 맨 앞에만 올 수 있습니다: {selector!r}")
+            segments.append((name,))
+        elif name == "*":
+            segments.append(("values",))
+        elif name is not None:
+            segments.append(("key", name))
+        elif quoted is not None:
+            segments.append(("key", quoted))
+        elif bracket == "*":
+            segments.append(("each",))
+        else:
+            segments.append(("index", int(bracket)))
+        pos = match.end()
+    if not segments:
+        raise PolicyError("빈 선택자")
+    return tuple(segments)
+
+
+# ---------------------------------------------------------------------------
+# 조건
+# ---------------------------------------------------------------------------
+
+
+def parse_quantity(value) -> float | None:
+    """숫자 또는 K8s 수량 문자열("500m", "2Gi") → float. 해석할 수 없으면 None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _QUANTITY_RE.match(str(value).strip()) if value is not None else None
+    if not match:
+        return None
+    return float(match.group(1)) * _QUANTITY_UNITS[match.group(2)]
+
+
+def _compile_predicates(definition: dict, where: str) -> list:
+    """조건 목록 → [(이름, 검사 함수(값) → 통과 여부, 보고용 표기)].
+
+    검사 함수에는 선택한 노드의 값(스칼라 값, 값이 없으면 MISSING, 리스트/맵이면 NOT_SCALAR)을 넘깁니다.
+    """
+    predicates = []
+    for name in _PREDICATES:
+        if name not in definition:
+            continue
+        expected = definition[name]
+        if name == "present":
+            check = (lambda v: v is not MISSING) if expected else (lambda v: v is MISSING)
+        elif name in ("matches", "not_matches"):
+            try:
+                regex = re.compile(str(expected))
+            except re.error as e:
+                raise PolicyError(f"{where}: 정규식 오류 {expected!r} - {e}") from e
+            negate = name == "not_matches"
+            check = _value_check(lambda v, r=regex, n=negate: (r.search(str(v)) is None) == n)
+        elif name in ("in", "not_in"):
+            if not isinstance(expected, list):
+                raise PolicyError(f"{where}: {name}에는 목록이 필요합니다")
+            allowed = {_text(item) for item in expected}
+            negate = name == "not_in"
+            check = _value_check(lambda v, a=allowed, n=negate: (_text(v) in a) != n)
+        elif name in ("equals", "not_equals"):
+            negate = name == "not_equals"
+            check = _value_check(lambda v, e=_text(expected), n=negate: (_text(v) == e) != n)
+        else:  # min / max
+            bound = parse_quantity(expected)
+            if bound is None:
+                raise PolicyError(f"{where}: {name} 값이 숫자/수량이 아닙니다: {expected!r}")
+            compare = (lambda q, b=bound: q >= b) if name == "min" else (lambda q, b=bound: q <= b)
+            check = _value_check(lambda v, c=compare: (q := parse_quantity(v)) is not None and c(q))
+        # 위반 보고에 쓸 조건 표기는 미리 만들어 둠
+        label = f"[{name}: {json.dumps(expected, ensure_ascii=False, default=str)}]"
+        predicates.append((name, check, label))
+    return predicates
+
+
+def _text(value) -> str:
+    """비교용 문자열 (true/false, 숫자는 따옴표 유무와 관계없이 같은 값으로 비교)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _value_check(test):
+    """값 조건: 값이 없으면 통과(검사 안 함), 리스트/맵이면 실패."""
+
+    def check(value):
+        if value is MISSING:
+            return True
+        return value is not NOT_SCALAR and test(value)
+
+    return check
+
+
+def _compile_conditions(conditions, where: str) -> list:
+    """when 조건 → [(선택자 세그먼트, 조건 목록)]."""
+    if conditions is None:
+        return []
+    if isinstance(conditions, dict):
+        conditions = [conditions]
+    compiled = []
+    for condition in conditions:
+        if not isinstance(condition, dict) or "select" not in condition:
+            raise PolicyError(f"{where}: when 항목에는 select가 필요합니다")
+        predicates = _compile_predicates(condition, where)
+        if not predicates:
+            raise PolicyError(f"{where}: when 항목에 조건이 없습니다")
+        compiled.append((parse_selector(condition["select"]), predicates))
+    return compiled
+
+
+# ---------------------------------------------------------------------------
+# 규칙 컴파일 / 로드
+# ---------------------------------------------------------------------------
+
+
+def compile_rule(definition: dict, source: str = "<정책>") -> dict:
+    """선언형 규칙 하나 → validator 규칙 dict.
+
+    Returns:
+        {"id", "severity", "category", "message", "target": "policy", "kinds",
+         "check": 선택자 원문, "source": 파일 이름, "definition": 원본 정의,
+         "select": 선택자 세그먼트, "predicates": [(이름, 검사 함수, 표기)], "when": [(세그먼트, 조건 목록)]}
+    """
+    if not isinstance(definition, dict):
+        raise PolicyError(f"{source}: 규칙은 매핑이어야 합니다")
+    rule_id = definition.get("id")
+    where = f"{source} {rule_id or '(id 없음)'}"
+    missing = [key for key in ("id", "severity", "message", "select") if not definition.get(key)]
+    if missing:
+        raise PolicyError(f"{where}: {', '.join(missing)} 필요")
+    if definition["severity"] not in SEVERITIES:
+        raise PolicyError(f"{where}: severity는 {'/'.join(SEVERITIES)} 중 하나여야 합니다")
+    kinds = definition.get("kinds", "*")
+    if kinds != "*" and not (isinstance(kinds, list) and all(isinstance(k, str) for k in kinds)):
+        raise PolicyError(f"{where}: kinds는 리소스 종류 목록 또는 \"*\"여야 합니다")
+
+    segments = parse_selector(definition["select"])
+    if segments[0][0] in ("$pod", "$containers") and kinds == "*":
+        kinds = list(POD_KINDS)
+    predicates = _compile_predicates(definition, where)
+    if not predicates:
+        raise PolicyError(f"{where}: 조건({', '.join(_PREDICATES)})이 하나 이상 필요합니다")
+
+    return {
+        "id": str(rule_id),
+        "severity": definition["severity"],
+        "category": definition.get("category", DEFAULT_CATEGORY),
+        "check": definition["select"],
+        "message": definition["message"],
+        "target": "policy",
+        "kinds": kinds,
+        "source": source,
+        "definition": definition,
+        "select": segments,
+        "predicates": predicates,
+        "when": _compile_conditions(definition.get("when"), where),
+    }
+
+
+def _read_rules(path: str) -> list:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f) if path.endswith(".json") else yaml.safe_load(f)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        raise PolicyError(f"{path}: 정책 파일을 읽을 수 없습니다 - {e}") from e
+    if data is None:
+        return []
+    if isinstance(data, dict):
+        data = data.get("rules", [])
+    if not isinstance(data, list):
+        raise PolicyError(f"{path}: 규칙 목록(또는 rules: [...])이 필요합니다")
+    return data
+
+
+def load_policies(policy_dir: str = POLICY_DIR, reserved_ids=()) -> list[dict]:
+    """정책 디렉토리의 규칙 파일을 파일 이름 순으로 읽어 컴파일. 디렉토리가 없으면 빈 목록.
+
+    Raises:
+        PolicyError: 파일을 읽을 수 없거나 규칙 정의가 잘못된 경우, ID가 중복된 경우
+    """
+    if not os.path.isdir(policy_dir):
+        return []
+    rules = []
+    seen = set(reserved_ids)
+    for filename in sorted(os.listdir(policy_dir)):
+        if not filename.endswith(POLICY_EXTENSIONS):
+            continue
+        path = os.path.join(policy_dir, filename)
+        for definition in _read_rules(path):
+            rule = compile_rule(definition, filename)
+            if rule["id"] in seen:
+                raise PolicyError(f"{filename} {rule['id']}: 규칙 ID가 중복되었습니다")
+            seen.add(rule["id"])
+            rules.append(rule)
+    return rules
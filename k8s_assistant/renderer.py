@@ -0,0 +1,223 @@
+"""구조화된 스펙으로 templates.py의 템플릿을 채워 매니페스트를 로컬에서 렌더링.
+
+LLM은 스펙(JSON)만 채우고, YAML은 여기서 결정적으로 만듭니다.
+
+    {"name": "web", "image": "nginx:1.25", "port": 8080, "replicas": 3,
+     "resources": {"limits": {"memory": "512Mi"}},
+     "probes": {"path": "/healthz"}}
+
+  - 템플릿 자리표시자({name}, {port} 등)는 JSON 값으로 채우므로 값에 특수문자가 있어도 YAML이 깨지지 않음
+  - 채운 템플릿을 파싱한 뒤 resources/probes/env/namespace 등 스펙 항목을 트리에 덮어씀
+    (probes는 Job/CronJob처럼 실행 후 종료하는 워크로드에는 붙이지 않음)
+  - 스펙 형식이 잘못되면(예: env가 문자열) RenderError로 알림
+  - 같은 스펙이면 항상 같은 YAML이 나옴 (키 순서는 템플릿 순서 유지)
+"""
+
+import copy
+import json
+
+import yaml
+
+from k8s_assistant.templates import TEMPLATES
+from k8s_assistant.validator import POD_SPEC_PATHS
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# 스펙 기본값 (템플릿 자리표시자 전체를 덮음, host는 "<name>.example.com")
+DEFAULT_SPEC = {
+    "replicas": 2,
+    "port": 8080,
+    "storage": "1Gi",
+    "schedule": "0 * * * *",
+    "command": [],
+    "min_replicas": 2,
+    "max_replicas": 10,
+}
+# 스펙 없이는 렌더링할 수 없는 필드 (리소스 종류별)
+REQUIRED_FIELDS = {kind: ["image"] for kind in POD_SPEC_PATHS}
+# 템플릿에 resources가 없는 컨테이너(CronJob 등)의 기본값 (Deployment 템플릿과 동일, 스펙의 resources로 덮어씀)
+DEFAULT_RESOURCES = {
+    "requests": {"cpu": "100m", "memory": "128Mi"},
+    "limits": {"cpu": "500m", "memory": "256Mi"},
+}
+# 컨테이너 기본 securityContext (스펙의 security_context로 덮어씀)
+DEFAULT_SECURITY_CONTEXT = {"allowPrivilegeEscalation": False}
+# 실행 후 종료하는 워크로드 (스펙에 probes가 있어도 붙이지 않음)
+RUN_TO_COMPLETION_KINDS = ("Job", "CronJob")
+# probes 항목별 기본 주기 (템플릿 값과 동일)
+PROBE_TIMINGS = {
+    "livenessProbe": {"initialDelaySeconds": 10, "periodSeconds": 30},
+    "readinessProbe": {"initialDelaySeconds": 5, "periodSeconds": 10},
+}
+
+
+class RenderError(ValueError):
+    """스펙이 부족하거나 잘못되어 렌더링할 수 없음."""
+
+
+def _merge(base: dict, override: dict) -> dict:
+    """dict를 재귀적으로 덮어씀 (override 값이 None이면 키 삭제)."""
+    for key, value in override.items():
+        if value is None:
+            base.pop(key, None)
+        elif isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = copy.deepcopy(value)
+    return base
+
+
+def _get(tree, path):
+    for key in path:
+        if not isinstance(tree, dict) or key not in tree:
+            return None
+        tree = tree[key]
+    return tree
+
+
+def _probe(value, port) -> dict | None:
+    """probes 스펙 항목 → K8s probe. {"path"}: httpGet, {"tcp": true}: tcpSocket, {"exec": [...]}: exec."""
+    if value is False:
+        return None
+    value = dict(value or {})
+    timings = {k: value.pop(k) for k in list(value) if k.endswith("Seconds") or k in ("failureThreshold", "successThreshold")}
+    probe_port = value.pop("port", port)
+    if "exec" in value:
+        handler = {"exec": {"command": value["exec"]}}
+    elif value.get("tcp"):
+        handler = {"tcpSocket": {"port": probe_port}}
+    else:
+        handler = {"httpGet": {"path": value.get("path", "/"), "port": probe_port}}
+    return {**handler, **timings}
+
+
+def _env(value) -> list[dict]:
+    """env 스펙 → 컨테이너 env. {이름: 값} 또는 [{"name", "value" | "valueFrom"}, ...]."""
+    if isinstance(value, dict):
+        return [{"name": k, "value": str(v)} for k, v in value.items()]
+    if not isinstance(value, list):
+        raise RenderError(f"env는 {{이름: 값}} 또는 [{{'name', 'value'}}] 형식이어야 합니다: {value!r}")
+    env = []
+    for item in value:
+        if not isinstance(item, dict) or not item.get("name"):
+            raise RenderError(f"env 항목에 name이 필요합니다: {item!r}")
+        entry = copy.deepcopy(item)
+        if "value" in entry:
+            entry["value"] = str(entry["value"])
+        env.append(entry)
+    return env
+
+
+def _apply_container(container: dict, spec: dict, with_probes: bool = True):
+    port = spec["port"]
+    if not container.get("resources"):
+        container["resources"] = copy.deepcopy(DEFAULT_RESOURCES)
+    if "resources" in spec:
+        _merge(container["resources"], spec["resources"])
+    if spec.get("env"):
+        container["env"] = _env(spec["env"])
+    if spec.get("env_from"):
+        container["envFrom"] = [
+            {"configMapRef" if ref.get("kind", "ConfigMap") == "ConfigMap" else "secretRef": {"name": ref["name"]}}
+            for ref in spec["env_from"]
+        ]
+    if spec.get("args"):
+        container["args"] = list(spec["args"])
+    if with_probes and "probes" in spec:
+        probes = spec["probes"]
+        # {"path": ...}처럼 한 번만 주면 liveness/readiness에 같이 적용
+        if probes is False or not ({"liveness", "readiness"} & set(probes)):
+            probes = {"liveness": probes, "readiness": probes}
+        for key, field in (("liveness", "livenessProbe"), ("readiness", "readinessProbe")):
+            if key not in probes:
+                continue
+            probe = _probe(probes[key], port)
+            if probe is None:
+                container.pop(field, None)
+            else:
+                container[field] = {**probe, **{k: v for k, v in PROBE_TIMINGS[field].items() if k not in probe}}
+    security = {**DEFAULT_SECURITY_CONTEXT, **spec.get("security_context", {})}
+    _merge(container.setdefault("securityContext", {}), security)
+
+
+def _placeholders(spec: dict) -> dict:
+    values = {**DEFAULT_SPEC, "host": f"{spec['name']}.example.com", **spec}
+    return {key: json.dumps(value, ensure_ascii=False) for key, value in values.items()}
+
+
+def render_resource(kind: str, spec: dict) -> dict:
+    """리소스 종류 하나를 렌더링해 dict로 반환.
+
+    Raises:
+        RenderError: 템플릿이 없거나, 필수 필드가 빠졌거나, 스펙 항목의 형식이 잘못된 경우
+    """
+    if kind not in TEMPLATES:
+        raise RenderError(f"{kind}: 템플릿 없음")
+    if not isinstance(spec, dict):
+        raise RenderError(f"{kind}: 스펙은 객체여야 합니다")
+    try:
+        return _render(kind, spec)
+    except RenderError as e:
+        if str(e).startswith(f"{kind}:"):
+            raise
+        raise RenderError(f"{kind}: {e}") from e
+    except (AttributeError, TypeError, KeyError, IndexError, ValueError) as e:
+        # 예: resources가 문자열, env_from 항목에 name 없음, service_port인데 템플릿에 ports 없음
+        raise RenderError(f"{kind}: 스펙 형식 오류 - {type(e).__name__}: {e}") from e
+
+
+def _render(kind: str, spec: dict) -> dict:
+    missing = [field for field in ["name"] + REQUIRED_FIELDS.get(kind, []) if not spec.get(field)]
+    if missing:
+        raise RenderError(f"{kind}: 스펙에 {', '.join(missing)} 필요")
+
+    spec = {**DEFAULT_SPEC, **spec}
+    try:
+        resource = yaml.load(TEMPLATES[kind].format_map(_placeholders(spec)), Loader=_Loader)
+    except (KeyError, yaml.YAMLError) as e:
+        raise RenderError(f"{kind}: 템플릿 렌더링 실패 - {e}") from e
+
+    metadata = resource["metadata"]
+    if spec.get("namespace"):
+        resource["metadata"] = metadata = {"name": metadata["name"], "namespace": spec["namespace"], **metadata}
+    if spec.get("labels"):
+        metadata.setdefault("labels", {}).update(spec["labels"])
+        pod_labels = _get(resource, ("spec", "template", "metadata", "labels"))
+        if pod_labels is not None:
+            pod_labels.update(spec["labels"])
+    if spec.get("annotations"):
+        metadata.setdefault("annotations", {}).update(spec["annotations"])
+
+    if kind in POD_SPEC_PATHS:
+        pod_spec = _get(resource, POD_SPEC_PATHS[kind])
+        for container in pod_spec["containers"]:
+            _apply_container(container, spec, with_probes=kind not in RUN_TO_COMPLETION_KINDS)
+            if not container.get("command"):
+                container.pop("command", None)
+    elif kind == "Service" and spec.get("service_port"):
+        resource["spec"]["ports"][0]["port"] = spec["service_port"]
+    elif kind == "Ingress" and spec.get("service_port"):
+        resource["spec"]["rules"][0]["http"]["paths"][0]["backend"]["service"]["port"]["number"] = spec["service_port"]
+    elif kind == "ConfigMap" and spec.get("config"):
+        resource["data"] = {k: str(v) for k, v in spec["config"].items()}
+    elif kind == "Secret" and spec.get("secret"):
+        # 평문 값은 stringData로 (API 서버가 base64로 저장)
+        resource.pop("data", None)
+        resource["stringData"] = {k: str(v) for k, v in spec["secret"].items()}
+
+    if spec.get("overrides", {}).get(kind):
+        _merge(resource, spec["overrides"][kind])
+    return resource
+
+
+def render_manifests(resource_types: list[str], spec: dict) -> str:
+    """여러 리소스를 '---'로 이어 붙인 YAML 스트림으로 렌더링.
+
+    Raises:
+        RenderError: 템플릿이 없거나 스펙의 필수 필드가 빠졌거나 형식이 잘못된 경우
+    """
+    resources = [render_resource(kind, spec) for kind in resource_types]
+    return yaml.dump_all(
+        resources, Dumper=_Dumper, sort_keys=False, default_flow_style=False, allow_unicode=True, explicit_start=True
+    )
@@ -0,0 +1,218 @@
+"""레포지토리 스캐너: os.scandir 한 번의 순회로 파일 패턴 매칭과 디렉토리 목록을 수집.
+
+  - 모든 패턴을 한 번의 순회에서 평가 (파일 이름 → 패턴 색인으로 후보 패턴만 비교)
+  - 어떤 패턴의 접두 경로도 될 수 없는 디렉토리는 내려가지 않음 (순회 범위 = 패턴이 닿는 디렉토리)
+  - .gitignore(루트와 하위 디렉토리)를 적용하고, 숨김 디렉토리(.git 등)는 내려가지 않음
+  - 파일 내용은 앞부분 N줄만 읽음 (read_head)
+
+패턴 문법: '/'로 구분한 경로, 세그먼트 안의 '*'/'?'/'[...]'(fnmatch), 여러 단계는 '**'.
+"""
+
+import fnmatch
+import os
+import re
+from itertools import islice
+
+# 파일 앞부분 읽기 기본 줄 수
+HEAD_LINES = 200
+
+
+class GitIgnore:
+    """.gitignore 한 파일의 규칙 (base: 레포 루트 기준 .gitignore가 있는 디렉토리 경로 세그먼트)."""
+
+    def __init__(self, base: tuple[str, ...], lines):
+        self.base = base
+        self.rules = []  # (정규식, 부정 여부, 디렉토리 전용 여부)
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.strip("/") if dir_only else line
+            # 중간에 '/'가 있거나 '/'로 시작하면 .gitignore 위치 기준, 아니면 모든 깊이의 이름과 매칭
+            anchored = "/" in line or raw.lstrip("!").startswith("/")
+            line = line.lstrip("/")
+            if not line:
+                continue
+            prefix = "" if anchored else "(?:.*/)?"
+            self.rules.append((re.compile(prefix + _glob_to_regex(line) + r"\Z"), negate, dir_only))
+
+    @classmethod
+    def load(cls, path: str, base: tuple[str, ...]) -> "GitIgnore | None":
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                ignore = cls(base, f)
+        except OSError:
+            return None
+        return ignore if ignore.rules else None
+
+    def match(self, parts: tuple[str, ...], is_dir: bool) -> bool | None:
+        """무시하면 True, 부정 규칙(!)으로 다시 포함하면 False, 해당 규칙 없으면 None."""
+        rel = "/".join(parts[len(self.base):])
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                result = not negate
+        return result
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """gitignore 글롭 → 정규식 ('**'는 여러 단계, '*'/'?'는 한 세그먼트 안)."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                parts.append(fnmatch.translate(pattern[i : end + 1])[4:-3])
+                i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+def _ignored(stack: list[GitIgnore], parts: tuple[str, ...], is_dir: bool) -> bool:
+    """하위 디렉토리의 .gitignore가 상위보다 우선."""
+    for ignore in reversed(stack):
+        result = ignore.match(parts, is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def _match_parts(path: tuple[str, ...], pattern: tuple[str, ...], prefix: bool = False) -> bool:
+    """경로 세그먼트가 패턴과 일치하는지. prefix=True이면 패턴의 앞부분과 일치하는지(디렉토리 탐색 여부)."""
+    if not pattern:
+        return not path
+    if not path:
+        return prefix
+    head = pattern[0]
+    if head == "**":
+        return _match_parts(path, pattern[1:], prefix) or _match_parts(path[1:], pattern, prefix)
+    return fnmatch.fnmatchcase(path[0], head) and _match_parts(path[1:], pattern[1:], prefix)
+
+
+class _PatternIndex:
+    """파일 이름(마지막 세그먼트) 기준 패턴 색인."""
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = [tuple(p.strip("/").split("/")) for p in patterns]
+        self.by_name: dict[str, list[int]] = {}
+        self.wildcard: list[int] = []
+        for i, parts in enumerate(self.patterns):
+            name = parts[-1]
+            if any(c in name for c in "*?["):
+                self.wildcard.append(i)
+            else:
+                self.by_name.setdefault(name, []).append(i)
+
+    def match(self, parts: tuple[str, ...]) -> list[int]:
+        candidates = self.by_name.get(parts[-1], []) + self.wildcard
+        return [i for i in sorted(candidates) if _match_parts(parts, self.patterns[i])]
+
+    def descend(self, parts: tuple[str, ...]) -> bool:
+        return any(_match_parts(parts, pattern[:-1], prefix=True) for pattern in self.patterns)
+
+
+def scan_repo(root: str, patterns: list[str], list_dirs: list[str] = (), list_depth: int = 2) -> dict:
+    """레포를 한 번 순회해 패턴에 맞는 파일과 디렉토리 목록을 수집.
+
+    Args:
+        patterns: 찾을 파일 경로 패턴 (레포 루트 기준)
+        list_dirs: 내부 목록을 만들 최상위 디렉토리 이름 (예: "k8s")
+        list_depth: list_dirs 목록의 최대 깊이
+
+    Returns:
+        {"entries": [최상위 항목 이름 (숨김/무시 제외)],
+         "matches": {패턴: [레포 기준 상대 경로, ...]},
+         "listings": {디렉토리 이름: 들여쓰기한 파일 목록 문자열}}
+    """
+    index = _PatternIndex(patterns)
+    list_dirs = set(d.strip("/") for d in list_dirs)
+    result = {
+        "entries": [],
+        "matches": {pattern: [] for pattern in patterns},
+        "listings": {},
+    }
+
+    def walk(dirpath: str, parts: tuple[str, ...], stack: list[GitIgnore], listing: list | None, depth: int):
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+
+        if any(e.name == ".gitignore" for e in entries):
+            ignore = GitIgnore.load(os.path.join(dirpath, ".gitignore"), parts)
+            if ignore is not None:
+                stack = stack + [ignore]
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            rel = parts + (entry.name,)
+            if entry.name == ".git" or _ignored(stack, rel, is_dir):
+                continue
+            hidden = entry.name.startswith(".")
+
+            if not parts and not hidden:
+                result["entries"].append(entry.name)
+            if listing is not None and not hidden:
+                listing.append("  " * depth + entry.name + ("/" if is_dir else ""))
+
+            if not is_dir:
+                for i in index.match(rel):
+                    result["matches"][patterns[i]].append("/".join(rel))
+                continue
+            if hidden:
+                continue
+
+            child_listing = None
+            if not parts and entry.name in list_dirs:
+                child_listing = result["listings"].setdefault(entry.name, [])
+                child_depth = 0
+            elif listing is not None and depth + 1 < list_depth:
+                child_listing, child_depth = listing, depth + 1
+            else:
+                child_depth = 0
+            if child_listing is not None or index.descend(rel):
+                walk(entry.path, rel, stack, child_listing, child_depth)
+
+    walk(root, (), [], None, 0)
+    result["listings"] = {name: "\n".join(lines) for name, lines in result["listings"].items()}
+    return result
+
+
+def read_head(filepath: str, max_lines: int = HEAD_LINES) -> str | None:
+    """파일 앞부분 max_lines줄만 읽음 (나머지는 읽지 않음)."""
+    try:
+        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+            lines = list(islice(f, max_lines + 1))
+    except OSError:
+        return None
+    if len(lines) > max_lines:
+        return "".join(lines[:max_lines]) + f"\n... ({max_lines}줄 이후 생략)\n"
+    return "".join(lines)
@@ -0,0 +1,194 @@
+"""Kubernetes OpenAPI JSON 스키마 저장소 (kubeconform 형식, 오프라인).
+
+스키마는 yannh/kubernetes-json-schema의 디렉토리 구조를 그대로 사용합니다.
+
+    schemas/v1.29.0-standalone-strict/deployment-apps-v1.json
+    schemas/v1.29.0-standalone-strict/service-v1.json
+
+리소스 하나의 standalone 스키마는 수백 KB~수 MB이므로, 처음 읽을 때 검증에 필요한 항목
+(type/properties/required/items/enum/oneOf)만 남긴 트리로 컴파일해 cache_data/schema_cache/에
+pickle로 저장합니다. 이후 실행(과 lint 워커 프로세스)은 JSON 대신 컴파일된 트리를 읽고,
+같은 프로세스 안에서는 메모리에 보관한 트리를 재사용합니다.
+
+컴파일된 노드 (dict, 필요한 키만 존재):
+    "types": frozenset(JSON 타입), "properties": {필드: 노드},
+    "additional": False(정의되지 않은 필드 금지) | 노드, "required": tuple,
+    "items": 노드, "enum": tuple, "any_of": (노드, ...)
+빈 dict는 모든 값을 허용합니다.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+
+# 스키마 루트 (K8S_SCHEMA_DIR 환경변수로 변경 가능)
+SCHEMA_DIR = os.environ.get("K8S_SCHEMA_DIR") or os.path.join(os.path.dirname(__file__), "schemas")
+# 컴파일된 스키마 캐시 디렉토리
+SCHEMA_CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache_data", "schema_cache")
+# 버전을 지정하지 않았을 때 사용할 Kubernetes 버전
+DEFAULT_K8S_VERSION = "1.29.0"
+# 컴파일 결과 형식을 바꾸면 버전을 올려서 디스크 캐시를 무효화합니다.
+COMPILER_VERSION = "1"
+
+# 버전별 디렉토리 이름 후보 (strict 우선: 정의되지 않은 필드를 오류로 처리)
+_DIR_SUFFIXES = ["-standalone-strict", "-standalone"]
+
+
+def _version_dir(k8s_version: str) -> str | None:
+    version = k8s_version if k8s_version.startswith("v") or k8s_version == "master" else f"v{k8s_version}"
+    for suffix in _DIR_SUFFIXES:
+        path = os.path.join(SCHEMA_DIR, version + suffix)
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+def available_versions() -> list[str]:
+    """설치된 스키마 버전 목록 (예: ["1.28.0", "1.29.0"])."""
+    try:
+        names = os.listdir(SCHEMA_DIR)
+    except OSError:
+        return []
+    versions = set()
+    for name in names:
+        for suffix in _DIR_SUFFIXES:
+            if name.endswith(suffix) and os.path.isdir(os.path.join(SCHEMA_DIR, name)):
+                versions.add(name[: -len(suffix)].removeprefix("v"))
+    return sorted(versions)
+
+
+def resolve_version(k8s_version: str | None) -> str | None:
+    """스키마가 설치된 버전이면 그대로, 아니면 None (None이면 DEFAULT_K8S_VERSION 확인)."""
+    version = k8s_version or DEFAULT_K8S_VERSION
+    return version if _version_dir(version) else None
+
+
+def schema_filename(kind: str, api_version: str) -> str:
+    """kubeconform 파일 이름 규칙: <kind>-<그룹 첫 단어>-<버전>.json (core 그룹은 <kind>-<버전>.json)."""
+    group, _, version = api_version.rpartition("/")
+    suffix = f"-{group.split('.')[0]}-{version}" if group else f"-{version}"
+    return f"{kind}{suffix}.json".lower()
+
+
+# ---------------------------------------------------------------------------
+# 컴파일
+# ---------------------------------------------------------------------------
+
+
+class _Compiler:
+    """JSON 스키마 → 컴파일된 노드. $ref(같은 파일 또는 같은 디렉토리의 다른 파일)는 한 번만 컴파일."""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self.documents: dict[str, dict] = {}
+        self.refs: dict[str, dict] = {}
+
+    def compile(self, schema, document: str) -> dict:
+        if not isinstance(schema, dict):
+            return {}
+        if "$ref" in schema:
+            return self._ref(schema["$ref"], document)
+        if schema.get("x-kubernetes-preserve-unknown-fields") and "properties" not in schema:
+            return {}
+
+        node: dict = {}
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types:
+            node["types"] = frozenset(types)
+        if schema.get("x-kubernetes-int-or-string"):
+            node["types"] = frozenset(["integer", "string"])
+        if "enum" in schema:
+            node["enum"] = tuple(schema["enum"])
+
+        alternatives = schema.get("oneOf") or schema.get("anyOf")
+        if alternatives and not schema.get("x-kubernetes-int-or-string"):
+            compiled = tuple(self.compile(alt, document) for alt in alternatives)
+            if all(compiled):
+                node["any_of"] = compiled
+
+        if "properties" in schema:
+            node["properties"] = {
+                name: self.compile(child, document) for name, child in schema["properties"].items()
+            }
+        additional = schema.get("additionalProperties")
+        if additional is False:
+            node["additional"] = False
+        elif isinstance(additional, dict):
+            node["additional"] = self.compile(additional, document)
+        if schema.get("required"):
+            node["required"] = tuple(schema["required"])
+        if isinstance(schema.get("items"), dict):
+            node["items"] = self.compile(schema["items"], document)
+        return node
+
+    def _ref(self, ref: str, document: str) -> dict:
+        target, _, pointer = ref.partition("#")
+        target = target or document
+        key = f"{target}#{pointer}"
+        if key in self.refs:
+            return self.refs[key]
+        # 재귀 참조(JSONSchemaProps 등)를 위해 빈 노드를 먼저 등록하고 채움
+        node = self.refs[key] = {}
+        schema = self._load(target)
+        for part in filter(None, pointer.split("/")):
+            schema = schema.get(part.replace("~1", "/").replace("~0", "~"), {}) if isinstance(schema, dict) else {}
+        node.update(self.compile(schema, target))
+        return node
+
+    def _load(self, name: str) -> dict:
+        if name not in self.documents:
+            try:
+                with open(os.path.join(self.base_dir, name), "r", encoding="utf-8") as f:
+                    self.documents[name] = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.documents[name] = {}
+        return self.documents[name]
+
+
+def compile_schema(path: str) -> dict:
+    """스키마 파일 하나를 컴파일."""
+    compiler = _Compiler(os.path.dirname(path))
+    name = os.path.basename(path)
+    return compiler.compile(compiler._load(name), name)
+
+
+def _cache_path(path: str, stat: os.stat_result) -> str:
+    key = f"{COMPILER_VERSION}:{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return os.path.join(SCHEMA_CACHE_DIR, hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + ".pickle")
+
+
+def _load_compiled(path: str) -> dict:
+    """디스크 캐시(스키마 파일 경로/mtime/크기 기준)에서 읽고, 없으면 컴파일해 저장."""
+    cache_path = _cache_path(path, os.stat(path))
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    compiled = compile_schema(path)
+    try:
+        os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시
+    return compiled
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(kind: str, api_version: str, k8s_version: str) -> dict | None:
+    """리소스 종류의 컴파일된 스키마. 설치된 스키마가 없으면 None (프로세스 안에서 메모이즈)."""
+    version_dir = _version_dir(k8s_version)
+    if version_dir is None:
+        return None
+    path = os.path.join(version_dir, schema_filename(kind, api_version))
+    if not os.path.isfile(path):
+        return None
+    return _load_compiled(path)
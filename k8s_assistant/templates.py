@@ -120,7 +120,7 @@ kind: CronJob
 metadata:
   name: {name}
 spec:
-  schedule: "{schedule}"
+  schedule: {schedule}
   jobTemplate:
     spec:
       template:
@@ -195,6 +195,32 @@ spec:
 """,
 }
 
+# 검증 규칙 적용 대상 리소스 종류
+# Pod 템플릿(컨테이너)을 가진 워크로드
+POD_KINDS = ["Pod", "Deployment", "StatefulSet", "DaemonSet", "ReplicaSet", "Job", "CronJob"]
+# 계속 실행되는 워크로드 (Job/CronJob은 probe 대상 아님)
+LONG_RUNNING_KINDS = ["Pod", "Deployment", "StatefulSet", "DaemonSet", "ReplicaSet"]
+# replicas 필드를 가진 워크로드
+REPLICATED_KINDS = ["Deployment", "StatefulSet", "ReplicaSet"]
+# 네임스페이스가 없는 클러스터 범위 리소스
+CLUSTER_SCOPED_KINDS = [
+    "Namespace",
+    "Node",
+    "PersistentVolume",
+    "StorageClass",
+    "ClusterRole",
+    "ClusterRoleBinding",
+    "CustomResourceDefinition",
+    "IngressClass",
+    "PriorityClass",
+    "RuntimeClass",
+    "MutatingWebhookConfiguration",
+    "ValidatingWebhookConfiguration",
+    "APIService",
+]
+
+# target: container(컨테이너마다 검사) / resource(리소스마다 검사)
+# kinds: 적용할 리소스 종류 ("*"는 CLUSTER_SCOPED_KINDS를 제외한 모든 리소스)
 VALIDATION_RULES = [
     {
         "id": "SEC001",
@@ -202,6 +228,8 @@ VALIDATION_RULES = [
         "category": "security",
         "check": "image tag is 'latest'",
         "message": "image 태그 'latest' 사용 금지. 특정 버전을 지정하세요.",
+        "target": "container",
+        "kinds": POD_KINDS,
     },
     {
         "id": "SEC002",
@@ -209,6 +237,8 @@ VALIDATION_RULES = [
         "category": "security",
         "check": "no securityContext",
         "message": "securityContext 미설정. runAsNonRoot: true를 설정하세요.",
+        "target": "container",
+        "kinds": POD_KINDS,
     },
     {
         "id": "SEC003",
@@ -216,6 +246,8 @@ VALIDATION_RULES = [
         "category": "security",
         "check": "allowPrivilegeEscalation not set to false",
         "message": "allowPrivilegeEscalation: false를 설정하세요.",
+        "target": "container",
+        "kinds": POD_KINDS,
     },
     {
         "id": "RES001",
@@ -223,6 +255,8 @@ VALIDATION_RULES = [
         "category": "resources",
         "check": "no resources.requests or limits",
         "message": "resources.requests/limits 미설정. OOM Kill 위험이 있습니다.",
+        "target": "container",
+        "kinds": POD_KINDS,
     },
     {
         "id": "REL001",
@@ -230,6 +264,8 @@ VALIDATION_RULES = [
         "category": "reliability",
         "check": "no livenessProbe",
         "message": "livenessProbe 미설정. 컨테이너 장애 감지가 불가합니다.",
+        "target": "container",
+        "kinds": LONG_RUNNING_KINDS,
     },
     {
         "id": "REL002",
@@ -237,6 +273,8 @@ VALIDATION_RULES = [
         "category": "reliability",
         "check": "no readinessProbe",
         "message": "readinessProbe 미설정. 무중단 배포에 문제가 발생할 수 있습니다.",
+        "target": "container",
+        "kinds": LONG_RUNNING_KINDS,
     },
     {
         "id": "REL003",
@@ -244,6 +282,8 @@ VALIDATION_RULES = [
         "category": "reliability",
         "check": "replicas < 2",
         "message": "replicas가 1개입니다. 프로덕션에서는 2개 이상 권장합니다.",
+        "target": "resource",
+        "kinds": REPLICATED_KINDS,
     },
     {
         "id": "NET001",
@@ -251,5 +291,46 @@ VALIDATION_RULES = [
         "category": "networking",
         "check": "no namespace specified",
         "message": "namespace 미지정. default 네임스페이스에 배포됩니다.",
+        "target": "resource",
+        "kinds": "*",
+    },
+]
+
+# 스키마 검증 결과 (validator.py가 schema.py의 OpenAPI 스키마로 검사, k8s 버전을 지정한 경우에만)
+SCHEMA_RULES = [
+    {
+        "id": "SCH001",
+        "severity": "CRITICAL",
+        "category": "schema",
+        "check": "field not defined in the OpenAPI schema",
+        "message": "스키마에 없는 필드입니다. 필드 이름(대소문자)을 확인하세요.",
+    },
+    {
+        "id": "SCH002",
+        "severity": "CRITICAL",
+        "category": "schema",
+        "check": "value type does not match the schema",
+        "message": "필드 값의 타입이 스키마와 다릅니다.",
+    },
+    {
+        "id": "SCH003",
+        "severity": "CRITICAL",
+        "category": "schema",
+        "check": "required field missing",
+        "message": "필수 필드가 없습니다.",
+    },
+    {
+        "id": "SCH004",
+        "severity": "WARNING",
+        "category": "schema",
+        "check": "value not in enum",
+        "message": "허용되지 않는 값입니다.",
+    },
+    {
+        "id": "SCH000",
+        "severity": "INFO",
+        "category": "schema",
+        "check": "no schema for kind/apiVersion",
+        "message": "해당 kind/apiVersion의 스키마가 없어 스키마 검증을 건너뛰었습니다 (CRD 등).",
     },
 ]
@@ -0,0 +1,687 @@
+"""YAML AST 기반 K8s 매니페스트 검증 엔진.
+
+매니페스트를 문서('---') 단위로 한 번씩 파싱해 노드 트리(yaml.compose)를 만들고,
+리소스 종류(kind)별로 색인된 규칙만 해당 경로에서 평가합니다.
+
+  - 문서마다 따로 파싱하므로 한 문서의 문법 오류가 나머지 문서 검증을 막지 않음
+  - 컨테이너 규칙은 Pod spec의 containers[i]/initContainers[i]마다 평가
+  - 결과에는 문서 번호, 리소스(kind/name), 필드 경로, 원본 줄 번호가 포함됨
+  - 정책 플러그인(policy.py)의 선언형 규칙도 내장 규칙과 같은 kind 색인으로 평가
+  - k8s 버전을 지정하면 같은 노드 트리를 OpenAPI 스키마(schema.py)로도 검사 (오타 필드, 타입, 필수 필드)
+
+전체 비용은 매니페스트 크기에 비례합니다 (문서 분할 1회 + 문서별 파싱 1회 + 규칙 평가).
+"""
+
+import difflib
+import functools
+import hashlib
+import json
+import re
+
+import yaml
+
+from k8s_assistant.policy import MISSING, NOT_SCALAR, load_policies
+from k8s_assistant.schema import COMPILER_VERSION, load_schema
+from k8s_assistant.templates import CLUSTER_SCOPED_KINDS, SCHEMA_RULES, VALIDATION_RULES
+
+# libyaml이 있으면 C 파서 사용
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+
+# 문서 구분자: 0열에서 시작하는 '---' (뒤에 공백/주석/내용이 올 수 있음, CRLF 줄바꿈 포함)
+_DOC_SEPARATOR_RE = re.compile(r"^---(?:[ \t\r]|$)", re.MULTILINE)
+
+# 리소스 종류별 Pod spec 경로
+POD_SPEC_PATHS = {
+    "Pod": ("spec",),
+    "Deployment": ("spec", "template", "spec"),
+    "StatefulSet": ("spec", "template", "spec"),
+    "DaemonSet": ("spec", "template", "spec"),
+    "ReplicaSet": ("spec", "template", "spec"),
+    "Job": ("spec", "template", "spec"),
+    "CronJob": ("spec", "jobTemplate", "spec", "template", "spec"),
+}
+
+# 규칙 검사 로직(CHECKS, 정책 평가)을 바꾸면 버전을 올려서 기존 lint 캐시를 무효화합니다.
+ENGINE_VERSION = "2"
+
+_CLUSTER_SCOPED = set(CLUSTER_SCOPED_KINDS)
+
+# 내장 카테고리 (정책 플러그인의 카테고리는 ruleset()에서 뒤에 추가)
+BUILTIN_CATEGORIES = ["security", "resources", "reliability", "networking", "schema"]
+SEVERITIES = ["CRITICAL", "WARNING", "INFO"]
+
+
+def _index_rules_by_kind(rules: list[dict]) -> tuple[dict, list]:
+    """kind → 규칙 목록 색인과, 모든 네임스페이스 리소스에 적용되는 규칙("*") 목록."""
+    by_kind: dict[str, list] = {}
+    any_kind = []
+    for rule in rules:
+        if rule["kinds"] == "*":
+            any_kind.append(rule)
+            continue
+        for kind in rule["kinds"]:
+            by_kind.setdefault(kind, []).append(rule)
+    return by_kind, any_kind
+
+
+@functools.lru_cache(maxsize=1)
+def ruleset() -> dict:
+    """내장 규칙 + 정책 디렉토리(policy.POLICY_DIR)의 선언형 규칙을 처음 사용할 때 한 번 로드해 색인.
+
+    import 시에는 정책 파일을 읽지 않으므로, 정책 파일이 잘못되어도 import는 실패하지 않고
+    검증을 시작할 때 PolicyError(파일 이름과 규칙 ID 포함)가 발생합니다. 실패는 캐시하지 않습니다.
+
+    Returns:
+        {"policy_rules": [...], "kind_rules": [...] (내장 규칙 → 정책 규칙 순, kind별로 색인해 평가),
+         "rules_by_id": {규칙 ID: 규칙}, "categories": [카테고리], "version": 캐시 무효화 기준 문자열,
+         "by_kind": {kind: [규칙]}, "any_kind": [규칙], "order": {규칙 ID: 순서}}
+
+    Raises:
+        PolicyError: 정책 파일을 읽을 수 없거나 규칙 정의가 잘못된 경우
+    """
+    policy_rules = load_policies(reserved_ids=[rule["id"] for rule in VALIDATION_RULES + SCHEMA_RULES])
+    kind_rules = VALIDATION_RULES + policy_rules
+    by_kind, any_kind = _index_rules_by_kind(kind_rules)
+    # 캐시 무효화 기준: 검사 로직 버전 + 스키마 컴파일러 버전 + 내장/스키마/정책 규칙 내용
+    digest = hashlib.sha256(
+        json.dumps(
+            [VALIDATION_RULES, SCHEMA_RULES, [rule["definition"] for rule in policy_rules]],
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()[:16]
+    return {
+        "policy_rules": policy_rules,
+        "kind_rules": kind_rules,
+        "rules_by_id": {rule["id"]: rule for rule in kind_rules + SCHEMA_RULES},
+        "categories": BUILTIN_CATEGORIES
+        + sorted({rule["category"] for rule in policy_rules} - set(BUILTIN_CATEGORIES)),
+        "version": f"{ENGINE_VERSION}.{COMPILER_VERSION}:{digest}",
+        "by_kind": by_kind,
+        "any_kind": any_kind,
+        "order": {rule["id"]: i for i, rule in enumerate(kind_rules)},
+    }
+
+
+def all_categories() -> list[str]:
+    """검증 카테고리 (내장 + 정책 플러그인). Raises: PolicyError"""
+    return ruleset()["categories"]
+
+
+def ruleset_version() -> str:
+    """lint 캐시 무효화 기준 (검사 로직 버전 + 스키마 컴파일러 버전 + 규칙 내용 해시). Raises: PolicyError"""
+    return ruleset()["version"]
+
+
+def rule_by_id(rule_id: str) -> dict:
+    """규칙 ID → 규칙 (내장/스키마/정책). Raises: PolicyError"""
+    return ruleset()["rules_by_id"][rule_id]
+
+
+@functools.lru_cache(maxsize=1024)
+def rules_for_kind(kind: str | None) -> tuple[dict, ...]:
+    """리소스 종류에 적용할 규칙 목록 (kind_rules 순서 유지, kind별로 한 번만 계산)."""
+    rules_index = ruleset()
+    rules = list(rules_index["by_kind"].get(kind, []))
+    if kind not in _CLUSTER_SCOPED:
+        rules.extend(rules_index["any_kind"])
+    return tuple(sorted(rules, key=lambda r: rules_index["order"][r["id"]]))
+
+
+# ---------------------------------------------------------------------------
+# 문서 분할 / 파싱
+# ---------------------------------------------------------------------------
+
+
+def iter_documents(yaml_content: str):
+    """YAML 스트림을 문서 단위로 하나씩 생성 (전체를 줄 목록으로 만들지 않음). (시작 줄 번호(0부터), 문서 텍스트)
+
+    '---'는 0열에 있으면 블록 스칼라 안에서도 문서 구분자이므로 줄 단위 분할이 YAML 의미와 같습니다.
+    """
+    start = line = 0
+    for match in _DOC_SEPARATOR_RE.finditer(yaml_content):
+        end = match.start()
+        if end == 0:
+            continue
+        yield line, yaml_content[start:end]
+        line += yaml_content.count("\n", start, end)
+        start = end
+    if start < len(yaml_content):
+        yield line, yaml_content[start:]
+
+
+def split_documents(yaml_content: str) -> list[tuple[int, str]]:
+    """YAML 스트림을 문서 단위로 분할. [(시작 줄 번호(0부터), 문서 텍스트), ...]"""
+    return list(iter_documents(yaml_content))
+
+
+def _parse_document(offset: int, text: str) -> dict | None:
+    """문서 텍스트 하나를 노드 트리로 파싱. 빈 문서(주석/구분자만)는 None."""
+    try:
+        node = yaml.compose(text, Loader=_Loader)
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        line = offset + mark.line + 1 if mark else offset + 1
+        problem = getattr(e, "problem", None) or str(e)
+        return {"line": line, "node": None, "error": problem, "offset": offset}
+    if node is None or _is_empty(node):
+        return None
+    return {"line": offset + node.start_mark.line + 1, "node": node, "error": None, "offset": offset}
+
+
+def parse_documents(yaml_content: str) -> list[dict]:
+    """문서별로 노드 트리를 만듦. 빈 문서(주석/구분자만)는 제외.
+
+    Returns:
+        [{"index": 문서 번호(1부터), "line": 시작 줄(1부터), "node": 루트 노드 | None,
+          "error": 파싱 오류 메시지 | None, "offset": 문서 텍스트의 시작 줄(0부터)}, ...]
+    """
+    parsed = []
+    for offset, text in split_documents(yaml_content):
+        document = _parse_document(offset, text)
+        if document is not None:
+            parsed.append(dict(document, index=len(parsed) + 1))
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+# 노드 조회 헬퍼
+# ---------------------------------------------------------------------------
+
+
+def _mapping(node) -> dict:
+    """MappingNode → {키: 값 노드}. 병합 키(<<)는 명시된 키보다 우선순위가 낮게 적용."""
+    if not isinstance(node, yaml.MappingNode):
+        return {}
+    result = {}
+    merged = {}
+    for key_node, value_node in node.value:
+        if key_node.tag == "tag:yaml.org,2002:merge":
+            sources = value_node.value if isinstance(value_node, yaml.SequenceNode) else [value_node]
+            for source in sources:
+                for key, value in _mapping(source).items():
+                    merged.setdefault(key, value)
+        elif isinstance(key_node, yaml.ScalarNode):
+            result[key_node.value] = value_node
+    for key, value in merged.items():
+        result.setdefault(key, value)
+    return result
+
+
+def _get(node, *path):
+    for key in path:
+        node = _mapping(node).get(key)
+        if node is None:
+            return None
+    return node
+
+
+def _scalar(node):
+    """ScalarNode를 파이썬 값으로 변환 (bool/int/null 등 YAML 1.1 규칙 적용)."""
+    if not isinstance(node, yaml.ScalarNode):
+        return None
+    constructor = _CONSTRUCTOR.yaml_constructors.get(node.tag)
+    if constructor is None:
+        return node.value
+    try:
+        return constructor(_CONSTRUCTOR, node)
+    except (yaml.YAMLError, ValueError):
+        return node.value
+
+
+def _is_empty(node) -> bool:
+    if node is None:
+        return True
+    if isinstance(node, (yaml.MappingNode, yaml.SequenceNode)):
+        return not node.value
+    return _scalar(node) in (None, "")
+
+
+def _line(node, offset: int) -> int:
+    return offset + node.start_mark.line + 1
+
+
+# ---------------------------------------------------------------------------
+# 규칙 구현
+# ---------------------------------------------------------------------------
+# 컨테이너 규칙: (container 노드, pod spec 노드, init 컨테이너 여부) → 위반 노드(줄 위치) | None
+# 리소스 규칙: (루트 노드) → 위반 노드 | None
+
+
+def _check_latest_image(container, pod_spec, init):
+    image = _get(container, "image")
+    value = _scalar(image)
+    if not isinstance(value, str) or "@" in value:
+        return None  # 이미지 없음(다른 규칙 대상 아님) 또는 digest 고정
+    name = value.rsplit("/", 1)[-1]
+    tag = name.split(":", 1)[1] if ":" in name else "latest"
+    return image if tag == "latest" else None
+
+
+def _check_security_context(container, pod_spec, init):
+    if _is_empty(_get(container, "securityContext")) and _is_empty(_get(pod_spec, "securityContext")):
+        return container
+    return None
+
+
+def _check_privilege_escalation(container, pod_spec, init):
+    context = _get(container, "securityContext")
+    value = _get(context, "allowPrivilegeEscalation")
+    if _scalar(value) is False:
+        return None
+    return value or context or container
+
+
+def _check_resources(container, pod_spec, init):
+    resources = _get(container, "resources")
+    if _is_empty(_get(resources, "requests")) or _is_empty(_get(resources, "limits")):
+        return resources or container
+    return None
+
+
+def _check_liveness_probe(container, pod_spec, init):
+    return container if not init and _is_empty(_get(container, "livenessProbe")) else None
+
+
+def _check_readiness_probe(container, pod_spec, init):
+    return container if not init and _is_empty(_get(container, "readinessProbe")) else None
+
+
+def _check_replicas(root):
+    replicas = _get(root, "spec", "replicas")
+    value = _scalar(replicas)
+    return replicas if isinstance(value, int) and not isinstance(value, bool) and value < 2 else None
+
+
+def _check_namespace(root):
+    if _is_empty(_get(root, "metadata", "namespace")):
+        return _get(root, "metadata") or root
+    return None
+
+
+CHECKS = {
+    "SEC001": _check_latest_image,
+    "SEC002": _check_security_context,
+    "SEC003": _check_privilege_escalation,
+    "RES001": _check_resources,
+    "REL001": _check_liveness_probe,
+    "REL002": _check_readiness_probe,
+    "REL003": _check_replicas,
+    "NET001": _check_namespace,
+}
+
+
+def _containers(root, kind: str):
+    """(pod spec 노드, [(경로, container 노드, init 여부), ...])"""
+    spec_path = POD_SPEC_PATHS.get(kind)
+    pod_spec = _get(root, *spec_path) if spec_path else None
+    if pod_spec is None:
+        return None, []
+    prefix = ".".join(spec_path)
+    containers = []
+    for field, init in (("initContainers", True), ("containers", False)):
+        items = _get(pod_spec, field)
+        if not isinstance(items, yaml.SequenceNode):
+            continue
+        for i, container in enumerate(items.value):
+            containers.append((f"{prefix}.{field}[{i}]", container, init))
+    return pod_spec, containers
+
+
+# ---------------------------------------------------------------------------
+# 정책 규칙 평가 (policy.py에서 컴파일된 선택자/조건)
+# ---------------------------------------------------------------------------
+
+
+def _policy_value(node):
+    """조건 검사에 넘길 값: 스칼라 값 / MISSING(없거나 비어 있음) / NOT_SCALAR(리스트, 맵)."""
+    if _is_empty(node):
+        return MISSING
+    return _scalar(node) if isinstance(node, yaml.ScalarNode) else NOT_SCALAR
+
+
+def _join_key(path: str, key: str) -> str:
+    if "." in key:
+        return f'{path}["{key}"]'
+    return f"{path}.{key}" if path else key
+
+
+def _select(root, kind: str | None, segments: tuple, containers, mappings: dict) -> list:
+    """선택자를 노드 트리에 적용. [(필드 경로, 노드 | None, 줄 위치로 쓸 노드)]
+
+    [*]/*는 있는 항목만 펼치고, 이름/인덱스로 찾는 항목이 없으면 노드 None과 가장 가까운 상위 노드를 반환합니다.
+    containers는 $containers 시작점 ([(경로, container 노드, init 여부)]),
+    mappings는 문서 하나를 평가하는 동안 재사용하는 _mapping 결과 (id(노드) → dict).
+    """
+
+    def mapping(node) -> dict:
+        result = mappings.get(id(node))
+        if result is None:
+            result = mappings[id(node)] = _mapping(node)
+        return result
+
+    head = segments[0][0]
+    if head == "$containers":
+        current = [(_container_label(path, container), container, container) for path, container, _ in containers]
+        segments = segments[1:]
+    elif head == "$pod":
+        spec_path = POD_SPEC_PATHS.get(kind)
+        pod_spec = _get(root, *spec_path) if spec_path else None
+        current = [(".".join(spec_path), pod_spec, pod_spec)] if pod_spec is not None else []
+        segments = segments[1:]
+    else:
+        current = [("", root, root)]
+
+    for segment in segments:
+        step = []
+        op = segment[0]
+        for path, node, anchor in current:
+            if node is None:
+                if op in ("key", "index"):
+                    child_path = f"{path}[{segment[1]}]" if op == "index" else _join_key(path, segment[1])
+                    step.append((child_path, None, anchor))
+            elif op == "key":
+                child = mapping(node).get(segment[1])
+                step.append((_join_key(path, segment[1]), child, child or node))
+            elif op == "index":
+                items = node.value if isinstance(node, yaml.SequenceNode) else []
+                child = items[segment[1]] if segment[1] < len(items) else None
+                step.append((f"{path}[{segment[1]}]", child, child or node))
+            elif op == "each":
+                if isinstance(node, yaml.SequenceNode):
+                    step.extend((f"{path}[{i}]", item, item) for i, item in enumerate(node.value))
+            else:  # values
+                step.extend((_join_key(path, key), value, value) for key, value in mapping(node).items())
+        current = step
+    return current
+
+
+def _container_label(path: str, container) -> str:
+    label = _scalar(_get(container, "name"))
+    return f"{path}({label})" if label else path
+
+
+def _evaluate_policy(rule: dict, root, kind, containers, offset: int, memo: dict):
+    """정책 규칙 하나를 평가해 위반마다 (필드 경로, 줄 번호, 상세)를 생성.
+
+    memo는 문서 하나를 평가하는 동안 규칙끼리 공유하는 선택 결과 (같은 선택자를 쓰는 규칙이 많음).
+    """
+
+    def selected(segments):
+        result = memo.get(segments)
+        if result is None:
+            result = memo[segments] = _select(root, kind, segments, containers, memo.setdefault("mappings", {}))
+        return result
+
+    for segments, predicates in rule["when"]:
+        if not any(all(check(_policy_value(node)) for _, check, _ in predicates) for _, node, _ in selected(segments)):
+            return
+    for path, node, anchor in selected(rule["select"]):
+        value = _policy_value(node)
+        for _, check, label in rule["predicates"]:
+            if not check(value):
+                if value is not MISSING and value is not NOT_SCALAR:
+                    label += f" (현재 값: {json.dumps(value, ensure_ascii=False, default=str)})"
+                yield path or "(루트)", _line(anchor, offset), label
+                break
+
+
+def _evaluate(root, kind, rules, offset: int):
+    """규칙을 평가해 (규칙 ID, 필드 경로, 줄 번호, 상세 | None)를 생성."""
+    containers = None
+    pod_spec = None
+    memo: dict = {}
+    for rule in rules:
+        if rule["target"] == "policy":
+            if containers is None:
+                pod_spec, containers = _containers(root, kind)
+            for path, line, detail in _evaluate_policy(rule, root, kind, containers, offset, memo):
+                yield rule["id"], path, line, detail
+            continue
+        check = CHECKS[rule["id"]]
+        if rule["target"] == "resource":
+            node = check(root)
+            if node is not None:
+                path = "metadata" if rule["id"] == "NET001" else "spec.replicas"
+                yield rule["id"], path, _line(node, offset), None
+            continue
+
+        if containers is None:
+            pod_spec, containers = _containers(root, kind)
+        for path, container, init in containers:
+            node = check(container, pod_spec, init)
+            if node is not None:
+                yield rule["id"], _container_label(path, container), _line(node, offset), None
+
+
+# ---------------------------------------------------------------------------
+# 스키마 검사 (schema.py의 컴파일된 스키마)
+# ---------------------------------------------------------------------------
+
+
+def _node_type(node) -> str:
+    """노드의 JSON 스키마 타입."""
+    if isinstance(node, yaml.MappingNode):
+        return "object"
+    if isinstance(node, yaml.SequenceNode):
+        return "array"
+    value = _scalar(node)
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    return "string"  # 날짜 등 나머지 스칼라는 문자열로 취급
+
+
+def _type_matches(actual: str, types) -> bool:
+    return actual in types or (actual == "integer" and "number" in types)
+
+
+def _check_schema(compiled: dict, node, path: str):
+    """노드 트리를 컴파일된 스키마로 검사해 (규칙 ID, 필드 경로, 노드, 상세)를 생성."""
+    if not compiled:
+        return
+    if "any_of" in compiled:
+        if not any(next(_check_schema(alt, node, path), None) is None for alt in compiled["any_of"]):
+            allowed = sorted({t for alt in compiled["any_of"] for t in alt.get("types", ())})
+            yield "SCH002", path, node, f"{_node_type(node)} (허용: {'/'.join(allowed) or '스키마 참고'})"
+        return
+
+    actual = _node_type(node)
+    types = compiled.get("types")
+    if types and not _type_matches(actual, types):
+        yield "SCH002", path, node, f"{actual} (필요: {'/'.join(sorted(types - {'null'}))})"
+        return
+    if "enum" in compiled and actual != "null" and _scalar(node) not in compiled["enum"]:
+        allowed = ", ".join(map(str, compiled["enum"][:10]))
+        yield "SCH004", path, node, f"{_scalar(node)!r} (허용: {allowed})"
+
+    if actual == "object":
+        fields = _mapping(node)
+        properties = compiled.get("properties", {})
+        additional = compiled.get("additional")
+        for field in compiled.get("required", ()):
+            if field not in fields:
+                yield "SCH003", path or "(루트)", node, field
+        for field, child in fields.items():
+            child_path = f"{path}.{field}" if path else field
+            if field in properties:
+                yield from _check_schema(properties[field], child, child_path)
+            elif additional is False:
+                close = difflib.get_close_matches(field, properties, n=1)
+                yield "SCH001", child_path, child, f"'{field}'" + (f" ({close[0]}?)" if close else "")
+            elif additional:
+                yield from _check_schema(additional, child, child_path)
+    elif actual == "array" and "items" in compiled:
+        for i, item in enumerate(node.value):
+            yield from _check_schema(compiled["items"], item, f"{path}[{i}]")
+
+
+def _evaluate_schema(root, kind: str | None, k8s_version: str, offset: int):
+    """리소스의 스키마를 찾아 검사 결과를 (규칙 ID, 필드 경로, 줄 번호, 상세)로 생성."""
+    api_version = _scalar(_get(root, "apiVersion"))
+    if not kind or not isinstance(api_version, str):
+        return  # apiVersion/kind 누락은 스키마 없이도 알 수 있음 (k8s 리소스가 아닌 YAML일 수 있음)
+    compiled = load_schema(kind, api_version, k8s_version)
+    if compiled is None:
+        yield "SCH000", "", _line(root, offset), f"{api_version}/{kind} (k8s {k8s_version})"
+        return
+    for rule_id, path, node, detail in _check_schema(compiled, root, ""):
+        yield rule_id, path, _line(node, offset), detail
+
+
+def document_digest(text: str) -> str:
+    """문서 텍스트의 sha256 (검증 결과 캐시 키)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(text: str, k8s_version: str | None = None) -> str:
+    """검증 결과 캐시 키 (스키마 검증을 하면 k8s 버전별로 따로 캐시)."""
+    digest = document_digest(text)
+    return f"{digest}@{k8s_version}" if k8s_version else digest
+
+
+def check_document(text: str, k8s_version: str | None = None) -> dict | None:
+    """문서 텍스트 하나를 모든 카테고리 규칙으로 검증. 빈 문서는 None.
+
+    k8s_version을 주면 해당 버전의 OpenAPI 스키마로도 검사합니다 (스키마가 설치된 경우).
+    결과는 문서 텍스트(와 k8s_version)에만 의존하므로(줄 번호는 문서 텍스트 기준) 캐시할 수 있습니다.
+
+    Returns:
+        {"line", "kind", "name", "error", "findings": [{"rule", "path", "line", ("detail")}, ...]}
+    """
+    document = _parse_document(0, text)
+    if document is None:
+        return None
+    root = document["node"]
+    kind = name = None
+    findings = []
+    if isinstance(root, yaml.MappingNode):
+        kind = _scalar(_get(root, "kind"))
+        kind = kind if isinstance(kind, str) else None
+        name = _scalar(_get(root, "metadata", "name"))
+        name = name if isinstance(name, str) else None
+        results = list(_evaluate(root, kind, rules_for_kind(kind), 0))
+        if k8s_version:
+            results.extend(_evaluate_schema(root, kind, k8s_version, 0))
+        for rule_id, path, line, detail in results:
+            finding = {"rule": rule_id, "path": path, "line": line}
+            if detail is not None:
+                finding["detail"] = detail
+            findings.append(finding)
+    return {"line": document["line"], "kind": kind, "name": name, "error": document["error"], "findings": findings}
+
+
+def validate_manifests(
+    yaml_content: str,
+    categories: list[str] | None = None,
+    cache: dict | None = None,
+    k8s_version: str | None = None,
+) -> dict:
+    """YAML 스트림 전체 검증.
+
+    cache(cache_key → check_document 결과)를 주면 같은 내용의 문서는 파싱/검증을 건너뛰고,
+    새로 검증한 문서의 결과를 cache에 추가합니다.
+    k8s_version을 주면 스키마 검증(SCHEMA_RULES)도 수행합니다.
+
+    Returns:
+        {"documents": [{"index", "line", "kind", "name", "error"}, ...],
+         "findings": [{"rule", "severity", "category", "message", "detail", "document",
+                       "kind", "name", "path", "line"}, ...]}  # detail: 스키마 검사 상세 (없으면 None)
+    """
+    return validate_documents(split_documents(yaml_content), categories, cache, k8s_version)
+
+
+def validate_documents(
+    split: list[tuple[int, str]],
+    categories: list[str] | None = None,
+    cache: dict | None = None,
+    k8s_version: str | None = None,
+) -> dict:
+    """split_documents 결과를 검증 (validate_manifests와 같은 형식으로 반환).
+
+    Raises:
+        PolicyError: 정책 플러그인을 로드할 수 없는 경우
+    """
+    rules_index = ruleset()
+    if not categories or "all" in categories:
+        categories = rules_index["categories"]
+
+    documents = []
+    findings = []
+    for offset, text in split:
+        if cache is None:
+            entry = check_document(text, k8s_version)
+        else:
+            key = cache_key(text, k8s_version)
+            if key in cache:
+                entry = cache[key]
+            else:
+                entry = cache[key] = check_document(text, k8s_version)
+        if entry is None:
+            continue
+
+        index = len(documents) + 1
+        documents.append(
+            {
+                "index": index,
+                "line": entry["line"] + offset,
+                "kind": entry["kind"],
+                "name": entry["name"],
+                "error": entry["error"],
+            }
+        )
+        for finding in entry["findings"]:
+            rule = rules_index["rules_by_id"][finding["rule"]]
+            if rule["category"] not in categories:
+                continue
+            detail = finding.get("detail")
+            findings.append(
+                {
+                    "rule": rule["id"],
+                    "severity": rule["severity"],
+                    "category": rule["category"],
+                    "message": f"{rule['message']} {detail}" if detail else rule["message"],
+                    "detail": detail,
+                    "document": index,
+                    "kind": entry["kind"],
+                    "name": entry["name"],
+                    "path": finding["path"],
+                    "line": finding["line"] + offset,
+                }
+            )
+    return {"documents": documents, "findings": findings}
+
+
+def format_findings(result: dict) -> str:
+    """validate_manifests 결과를 사람이 읽는 형식으로 변환."""
+    lines = []
+    by_document: dict[int, list] = {}
+    for finding in result["findings"]:
+        by_document.setdefault(finding["document"], []).append(finding)
+
+    multi = len(result["documents"]) > 1
+    for document in result["documents"]:
+        resource = f"{document['kind'] or '(kind 없음)'}/{document['name'] or '(이름 없음)'}"
+        if document["error"]:
+            lines.append(
+                f"[ERROR] 문서 {document['index']} (line {document['line']}): "
+                f"YAML 파싱 실패 - {document['error']}"
+            )
+            continue
+        doc_findings = by_document.get(document["index"], [])
+        if multi:
+            status = f"{len(doc_findings)}건" if doc_findings else "OK"
+            lines.append(f"# 문서 {document['index']} {resource} (line {document['line']}): {status}")
+        for f in doc_findings:
+            path = f" {f['path']}" if f["path"] else ""
+            lines.append(f"[{f['severity']}] {f['rule']}{path} (line {f['line']}): {f['message']}")
+
+    if not result["findings"] and not any(d["error"] for d in result["documents"]):
+        lines.append("[OK] 주요 검증 항목을 모두 통과했습니다.")
+    return "\n".join(lines)
@@ -0,0 +1,178 @@
+"""K8s 매니페스트 구조 비교 (diff_yaml).
+
+두 YAML을 파싱해 리소스를 (kind, namespace, name)으로 짝짓고, 리스트 항목은 병합 키
+(컨테이너 name, volumeMount mountPath 등)로 짝지어 경로 단위 변경만 추출합니다.
+LLM에는 두 문서 전체 대신 변경된 경로 목록만 전달합니다.
+
+    ~ Deployment default/web
+      ~ spec.replicas: 2 → 3
+      ~ spec.template.spec.containers[name=app].image: "nginx:1.25" → "nginx:1.26"
+      + spec.template.spec.containers[name=app].resources.limits.cpu: "500m"
+"""
+
+import json
+
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 리스트 항목을 짝지을 병합 키 후보 (kubectl strategic merge의 patchMergeKey 기준, 앞쪽 우선)
+MERGE_KEYS = ["name", "mountPath", "devicePath", "containerPort", "port", "ip", "topologyKey", "key", "type"]
+# 값 출력 최대 길이 (넘으면 잘라서 표시)
+MAX_VALUE_CHARS = 120
+# 출력할 최대 변경 경로 수
+MAX_CHANGES = 300
+
+# 추가된 리소스 요약에서 제외할 필드
+_HEADER_FIELDS = ("apiVersion", "kind", "metadata")
+
+_MISSING = object()
+
+
+def load_resources(yaml_content: str) -> dict:
+    """YAML 스트림 → {(kind, namespace, name): 리소스 dict} (문서 순서 유지).
+
+    kind/name이 없는 문서는 ("(문서 N)", "", "")로, 같은 키가 두 번 나오면 번호를 붙여 구분합니다.
+    """
+    resources = {}
+    for i, doc in enumerate(yaml.load_all(yaml_content, Loader=_Loader), start=1):
+        if doc is None:
+            continue
+        if isinstance(doc, dict) and doc.get("kind") and isinstance(doc.get("metadata"), dict):
+            metadata = doc["metadata"]
+            key = (str(doc["kind"]), str(metadata.get("namespace") or "default"), str(metadata.get("name") or ""))
+        else:
+            key = (f"(문서 {i})", "", "")
+        base, n = key, 1
+        while key in resources:
+            n += 1
+            key = (base[0], base[1], f"{base[2]}#{n}")
+        resources[key] = doc
+    return resources
+
+
+def _merge_key(before: list, after: list) -> str | None:
+    """두 리스트의 모든 항목이 dict이고 값이 유일한 병합 키를 찾음."""
+    items = before + after
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for key in MERGE_KEYS:
+        for side in (before, after):
+            values = [item.get(key, _MISSING) for item in side]
+            if _MISSING in values or len(set(map(_hashable, values))) != len(values):
+                break
+        else:
+            return key
+    return None
+
+
+def _hashable(value):
+    return json.dumps(value, sort_keys=True, default=str) if isinstance(value, (dict, list)) else value
+
+
+def diff_values(before, after, path: str = ""):
+    """두 값을 재귀 비교해 (기호, 경로, 이전 값, 이후 값)을 생성. 기호: + 추가, - 삭제, ~ 변경."""
+    if before == after:
+        return
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in before:
+            child = f"{path}.{key}" if path else str(key)
+            if key not in after:
+                yield "-", child, before[key], None
+            else:
+                yield from diff_values(before[key], after[key], child)
+        for key in after:
+            if key not in before:
+                yield "+", f"{path}.{key}" if path else str(key), None, after[key]
+        return
+
+    if isinstance(before, list) and isinstance(after, list):
+        key = _merge_key(before, after)
+        if key is not None:
+            old = {_hashable(item[key]): item for item in before}
+            new = {_hashable(item[key]): item for item in after}
+            for value, item in old.items():
+                child = f"{path}[{key}={item[key]}]"
+                if value not in new:
+                    yield "-", child, item, None
+                else:
+                    yield from diff_values(item, new[value], child)
+            for value, item in new.items():
+                if value not in old:
+                    yield "+", f"{path}[{key}={item[key]}]", None, item
+            return
+        if len(before) == len(after) and all(isinstance(v, (dict, list)) for v in before + after):
+            for i, (old_item, new_item) in enumerate(zip(before, after)):
+                yield from diff_values(old_item, new_item, f"{path}[{i}]")
+            return
+
+    yield "~", path, before, after
+
+
+def _format_value(value) -> str:
+    text = json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":"))
+    return text if len(text) <= MAX_VALUE_CHARS else text[: MAX_VALUE_CHARS - 3] + "..."
+
+
+def _resource_label(key: tuple) -> str:
+    kind, namespace, name = key
+    return f"{kind} {namespace}/{name}" if name else kind
+
+
+def diff_manifests(yaml_before: str, yaml_after: str) -> dict:
+    """두 매니페스트 스트림의 구조 비교.
+
+    Returns:
+        {"added": [(리소스 키, 리소스)], "removed": [리소스 키], "unchanged": int,
+         "changed": {리소스 키: [(기호, 경로, 이전 값, 이후 값), ...]}}
+    """
+    before = load_resources(yaml_before)
+    after = load_resources(yaml_after)
+    result = {"added": [], "removed": [], "unchanged": 0, "changed": {}}
+    for key, resource in after.items():
+        if key not in before:
+            result["added"].append((key, resource))
+            continue
+        changes = list(diff_values(before[key], resource))
+        if changes:
+            result["changed"][key] = changes
+        else:
+            result["unchanged"] += 1
+    result["removed"] = [key for key in before if key not in after]
+    return result
+
+
+def format_diff(result: dict) -> str:
+    """diff_manifests 결과를 경로 단위 변경 목록 문자열로 변환."""
+    n_paths = sum(len(changes) for changes in result["changed"].values())
+    header = (
+        f"[YAML 비교] 리소스 변경 {len(result['changed'])}개, 추가 {len(result['added'])}개, "
+        f"삭제 {len(result['removed'])}개, 동일 {result['unchanged']}개 (변경 경로 {n_paths}개)"
+    )
+    if not (result["changed"] or result["added"] or result["removed"]):
+        return header + "\n차이가 없습니다."
+
+    lines = [header]
+    shown = 0
+    for key, changes in result["changed"].items():
+        if shown >= MAX_CHANGES:
+            break
+        lines.append(f"~ {_resource_label(key)}")
+        for sign, path, old, new in changes[: MAX_CHANGES - shown]:
+            path = path or "(문서 전체)"
+            if sign == "+":
+                lines.append(f"  + {path}: {_format_value(new)}")
+            elif sign == "-":
+                lines.append(f"  - {path}: {_format_value(old)}")
+            else:
+                lines.append(f"  ~ {path}: {_format_value(old)} → {_format_value(new)}")
+            shown += 1
+    if shown < n_paths:
+        lines.append(f"... (변경 경로 {n_paths - shown}개 생략)")
+    for key, resource in result["added"]:
+        # 추가된 리소스는 apiVersion/kind/metadata를 뺀 본문만 요약
+        body = {k: v for k, v in resource.items() if k not in _HEADER_FIELDS} if isinstance(resource, dict) else resource
+        lines.append(f"+ {_resource_label(key)} (추가) {_format_value(body)}")
+    for key in result["removed"]:
+        lines.append(f"- {_resource_label(key)} (삭제)")
+    return "\n".join(lines)
@@ -1,7 +1,26 @@
 import os
-import re
-
-from k8s_assistant.templates import TEMPLATES, VALIDATION_RULES
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from k8s_assistant.inventory import format_inventory
+from k8s_assistant.monorepo import (
+    MAX_SERVICES,
+    discover_services,
+    discovery_patterns,
+    render_services,
+    scan_services,
+)
+from k8s_assistant.policy import PolicyError
+from k8s_assistant.renderer import RenderError, render_manifests
+from k8s_assistant.repo_scanner import read_head, scan_repo
+from k8s_assistant.schema import available_versions, resolve_version
+from k8s_assistant.templates import TEMPLATES
+from k8s_assistant.validator import format_findings, validate_manifests
+from k8s_assistant.yaml_diff import diff_manifests, format_diff
+
+# analyze_repo에서 찾은 파일을 동시에 읽을 스레드 수
+READ_WORKERS = 8
 
 # analyze_repo에서 탐색할 파일 목록 (우선순위 순)
 _REPO_FILES = [
@@ -27,11 +46,10 @@ _REPO_FILES = [
     ("helm/", "Helm 차트 디렉토리"),
 ]
 
-# 언어별 엔트리포인트 파일 탐색 패턴
+# 언어별 엔트리포인트 파일 탐색 패턴 (레포 루트 기준, '**'는 여러 단계)
 _ENTRYPOINTS = [
     ("cmd/*/main.go", "Go 엔트리포인트"),
     ("main.go", "Go 엔트리포인트"),
-    ("cmd/app/main.go", "Go 엔트리포인트"),
     ("main.py", "Python 엔트리포인트"),
     ("app.py", "Python 엔트리포인트"),
     ("manage.py", "Django 엔트리포인트"),
@@ -47,45 +65,72 @@ _ENTRYPOINTS = [
 
 
 def analyze_repo(repo_path: str) -> str:
-    """레포지토리의 주요 파일을 읽어 K8s 배포에 필요한 정보를 추출."""
+    """레포지토리의 주요 파일을 읽어 K8s 배포에 필요한 정보를 추출.
+
+    파일 탐색은 scan_repo의 한 번의 순회로 끝내고(.gitignore 적용),
+    찾은 파일은 앞부분만 병렬로 읽습니다. services/*, cmd/* 등에서 서비스가 발견되면
+    서비스별 요약(monorepo.py)을 함께 반환합니다.
+    """
     repo_path = os.path.expanduser(repo_path.strip())
     if not os.path.isdir(repo_path):
         return f"[오류] 디렉토리를 찾을 수 없습니다: {repo_path}"
 
-    sections = []
+    repo_files = [(name, label) for name, label in _REPO_FILES if not name.endswith("/")]
+    repo_dirs = [(name, label) for name, label in _REPO_FILES if name.endswith("/")]
+    entrypoints = [pattern for pattern, _ in _ENTRYPOINTS]
+    # 여러 목록에 같은 패턴(Dockerfile, cmd/*/main.go 등)이 있어도 한 번만 매칭
+    patterns = list(dict.fromkeys([name for name, _ in repo_files] + entrypoints + discovery_patterns()))
+    scan = scan_repo(repo_path, patterns, [name for name, _ in repo_dirs])
+
+    # 모노레포: 서비스 디렉토리를 찾아 서비스별로 동시에 스캔
+    services = discover_services(scan["matches"])
+    manifests = scan_services(repo_path, services[:MAX_SERVICES], entrypoints) if services else []
+
+    # 같은 파일이 여러 패턴에 걸리면 먼저 나온 항목(우선순위 높은 쪽)으로 한 번만 표시
+    # 서비스 디렉토리 안의 파일은 서비스 요약에 포함되므로 원문을 싣지 않음
+    seen = set()
+    service_prefixes = tuple(service + "/" for service in services)
+
+    def collect(entries):
+        targets = []
+        for pattern, label in entries:
+            for rel_path in scan["matches"][pattern]:
+                if rel_path not in seen and not rel_path.startswith(service_prefixes):
+                    seen.add(rel_path)
+                    targets.append((label, rel_path))
+        return targets
+
+    file_targets = collect(repo_files)
+    entry_targets = collect(_ENTRYPOINTS)
+    targets = file_targets + entry_targets
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        contents = list(pool.map(lambda t: read_head(os.path.join(repo_path, t[1])), targets))
+    rendered = [
+        f"[{label}] {rel_path}\n{content}" if content else None
+        for (label, rel_path), content in zip(targets, contents)
+    ]
 
+    sections = []
     # 1. 디렉토리 구조 (1단계)
-    try:
-        entries = sorted(os.listdir(repo_path))
-        tree = [e for e in entries if not e.startswith(".")]
-        sections.append(f"[디렉토리 구조]\n{', '.join(tree)}")
-    except OSError:
-        pass
-
-    # 2. 주요 파일 읽기
-    for filename, label in _REPO_FILES:
-        filepath = os.path.join(repo_path, filename)
-        if filename.endswith("/"):
-            # 디렉토리인 경우 존재 여부만 확인하고 내부 파일 목록 제공
-            if os.path.isdir(filepath):
-                try:
-                    dir_files = _list_dir_recursive(filepath, max_depth=2)
-                    sections.append(f"[{label}] {filename}\n{dir_files}")
-                except OSError:
-                    sections.append(f"[{label}] {filename} (디렉토리 존재)")
-        elif os.path.isfile(filepath):
-            content = _read_file_safe(filepath)
-            if content:
-                sections.append(f"[{label}] {filename}\n{content}")
+    if scan["entries"]:
+        sections.append(f"[디렉토리 구조]\n{', '.join(scan['entries'])}")
+
+    # 2. 주요 파일 / 디렉토리 내부 목록
+    sections.extend(r for r in rendered[: len(file_targets)] if r)
+    for name, label in repo_dirs:
+        listing = scan["listings"].get(name.strip("/"))
+        if listing is not None:
+            sections.append(f"[{label}] {name}\n{listing}" if listing else f"[{label}] {name} (디렉토리 존재)")
 
     # 3. 엔트리포인트 탐색
-    for pattern, label in _ENTRYPOINTS:
-        found_files = _glob_simple(repo_path, pattern)
-        for fpath in found_files:
-            rel_path = os.path.relpath(fpath, repo_path)
-            content = _read_file_safe(fpath)
-            if content:
-                sections.append(f"[{label}] {rel_path}\n{content}")
+    sections.extend(r for r in rendered[len(file_targets) :] if r)
+
+    # 4. 서비스별 요약 (모노레포)
+    if manifests:
+        sections.append(
+            f"[서비스 목록] {len(services)}개 서비스 (모노레포, 서비스별 요약 JSON)\n"
+            + render_services(manifests, len(services))
+        )
 
     if not sections:
         return f"[결과] {repo_path} 에서 K8s 배포에 관련된 파일을 찾지 못했습니다."
@@ -94,120 +139,43 @@ def analyze_repo(repo_path: str) -> str:
     return header + "\n\n---\n\n".join(sections)
 
 
-def _read_file_safe(filepath: str, max_lines: int = 200) -> str | None:
-    """파일을 안전하게 읽되, 너무 긴 파일은 잘라서 반환."""
-    try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-        if len(lines) > max_lines:
-            truncated = lines[:max_lines]
-            truncated.append(f"\n... ({len(lines) - max_lines}줄 생략)\n")
-            return "".join(truncated)
-        return "".join(lines)
-    except (OSError, UnicodeDecodeError):
-        return None
-
-
-def _list_dir_recursive(dirpath: str, max_depth: int = 2, _depth: int = 0) -> str:
-    """디렉토리 내부 파일 목록을 재귀적으로 반환."""
-    if _depth >= max_depth:
-        return ""
-    result = []
-    try:
-        for entry in sorted(os.listdir(dirpath)):
-            if entry.startswith("."):
-                continue
-            full = os.path.join(dirpath, entry)
-            indent = "  " * _depth
-            if os.path.isdir(full):
-                result.append(f"{indent}{entry}/")
-                result.append(_list_dir_recursive(full, max_depth, _depth + 1))
-            else:
-                result.append(f"{indent}{entry}")
-    except OSError:
-        pass
-    return "\n".join(r for r in result if r)
-
-
-def _glob_simple(base: str, pattern: str) -> list[str]:
-    """간단한 glob 패턴 매칭 (** 미지원, * 는 단일 디렉토리 매칭)."""
-    parts = pattern.split("/")
-    candidates = [base]
-
-    for part in parts:
-        next_candidates = []
-        for cand in candidates:
-            if not os.path.isdir(cand):
-                continue
-            if part == "*" or part == "**":
-                # * → 현재 디렉토리의 모든 항목
-                try:
-                    for entry in os.listdir(cand):
-                        if not entry.startswith("."):
-                            next_candidates.append(os.path.join(cand, entry))
-                except OSError:
-                    pass
-            elif "*" in part:
-                # 와일드카드 포함 (예: *.java)
-                import fnmatch
-
-                try:
-                    for entry in os.listdir(cand):
-                        if fnmatch.fnmatch(entry, part):
-                            next_candidates.append(os.path.join(cand, entry))
-                except OSError:
-                    pass
-            else:
-                # 정확한 파일/디렉토리명
-                full = os.path.join(cand, part)
-                if os.path.exists(full):
-                    next_candidates.append(full)
-        candidates = next_candidates
-
-    return [c for c in candidates if os.path.isfile(c)]
-
-
-def analyze_yaml(yaml_content: str) -> str:
-    """YAML에서 핵심 필드를 추출하고 원본과 함께 반환."""
-    info_parts = []
-    lines = yaml_content.strip().split("\n")
-
-    extractors = {
-        "apiVersion:": "API 버전",
-        "kind:": "리소스 종류",
-        "replicas:": "레플리카",
-        "image:": "이미지",
-        "containerPort:": "컨테이너 포트",
-        "namespace:": "네임스페이스",
-        "serviceName:": "서비스 이름",
-        "type:": "타입",
-    }
-
-    name_found = False
-    for line in lines:
-        stripped = line.strip()
-
-        # name은 첫 번째만 추출 (metadata.name)
-        if not name_found and stripped.startswith("name:") and "  name:" in line:
-            info_parts.append(f"이름: {stripped.split(':', 1)[1].strip()}")
-            name_found = True
-            continue
-
-        for prefix, label in extractors.items():
-            if stripped.startswith(prefix):
-                value = stripped.split(":", 1)[1].strip()
-                if value:
-                    info_parts.append(f"{label}: {value}")
-                break
-
-    summary = "\n".join(info_parts) if info_parts else "구조 정보를 추출하지 못했습니다."
-    return f"[추출된 정보]\n{summary}\n\n[원본 YAML]\n{yaml_content}"
-
-
-def generate_yaml(requirement: str, resource_types: list | None = None) -> str:
-    """요구사항과 관련 템플릿을 함께 반환."""
+def analyze_yaml(yaml_content: str, include_yaml: bool = False) -> str:
+    """문서별 리소스 인벤토리(inventory.py)를 반환. include_yaml이면 원본 YAML도 함께 반환."""
+    inventory = format_inventory(yaml_content)
+    if not include_yaml:
+        return inventory
+    return f"{inventory}\n\n[원본 YAML]\n{yaml_content}"
+
+
+def generate_yaml(requirement: str, resource_types: list | None = None, spec: dict | None = None) -> str:
+    """스펙이 있으면 템플릿을 로컬에서 렌더링(renderer.py)해 검증 결과와 함께 반환.
+
+    스펙이 없으면 요구사항과 참고 템플릿을 반환합니다. 템플릿이 없는 리소스는 LLM이 직접 생성합니다.
+    """
     if not resource_types:
         resource_types = ["Deployment"]
+    untemplated = [rt for rt in resource_types if rt not in TEMPLATES]
+    templated = [rt for rt in resource_types if rt in TEMPLATES]
+
+    note = ""
+    if spec and templated:
+        try:
+            manifest = render_manifests(templated, spec)
+        except RenderError as e:
+            note = f"[렌더링 실패] {e}\n\n"
+        else:
+            try:
+                findings = format_findings(validate_manifests(manifest, k8s_version=resolve_version(None)))
+            except PolicyError as e:
+                findings = f"[오류] 정책 플러그인 로드 실패 - {e}"
+            parts = [
+                f"[요구사항] {requirement}",
+                f"[렌더링된 매니페스트] {', '.join(templated)}\n{manifest}",
+                f"[검증 결과]\n{findings}",
+            ]
+            if untemplated:
+                parts.append(f"[직접 생성 필요] {', '.join(untemplated)} (템플릿 없음)")
+            return "\n".join(parts)
 
     template_parts = []
     for rt in resource_types:
@@ -219,85 +187,48 @@ def generate_yaml(requirement: str, resource_types: list | None = None) -> str:
 
     templates_text = "\n---\n".join(template_parts)
     return (
+        f"{note}"
         f"[요구사항] {requirement}\n"
         f"[요청 리소스] {', '.join(resource_types)}\n\n"
         f"[참고 템플릿]\n{templates_text}"
     )
 
 
-def validate_yaml(yaml_content: str, check_categories: list | None = None) -> str:
-    """문자열 기반 휴리스틱 검증."""
-    if not check_categories or "all" in check_categories:
-        check_categories = ["security", "resources", "reliability", "networking"]
+def validate_yaml(yaml_content: str, check_categories: list | None = None, k8s_version: str | None = None) -> str:
+    """문서별 YAML 파싱 후 리소스 종류/컨테이너 경로 단위로 규칙 검증 (validator.py).
 
-    findings = []
-    content_lower = yaml_content.lower()
-
-    # SEC001: latest 태그
-    if ":latest" in content_lower or "image: latest" in content_lower:
-        rule = _get_rule("SEC001")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # SEC002: securityContext 미설정
-    if "securitycontext" not in content_lower:
-        rule = _get_rule("SEC002")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # SEC003: allowPrivilegeEscalation
-    if "allowprivilegeescalation" not in content_lower and "security" in check_categories:
-        rule = _get_rule("SEC003")
-        if rule:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # RES001: resources 미설정
-    if "resources:" not in content_lower:
-        rule = _get_rule("RES001")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # REL001: livenessProbe
-    if "livenessprobe" not in content_lower:
-        rule = _get_rule("REL001")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # REL002: readinessProbe
-    if "readinessprobe" not in content_lower:
-        rule = _get_rule("REL002")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # REL003: replicas < 2
-    replicas_match = re.search(r"replicas:\s*(\d+)", yaml_content)
-    if replicas_match and int(replicas_match.group(1)) < 2:
-        rule = _get_rule("REL003")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    # NET001: namespace 미지정
-    if "namespace:" not in content_lower:
-        rule = _get_rule("NET001")
-        if rule and rule["category"] in check_categories:
-            findings.append(f"[{rule['severity']}] {rule['message']}")
-
-    if not findings:
-        findings.append("[OK] 주요 검증 항목을 모두 통과했습니다.")
-
-    return f"[검증 결과]\n" + "\n".join(findings) + f"\n\n[원본 YAML]\n{yaml_content}"
+    스키마가 설치되어 있으면 k8s_version(기본: DEFAULT_K8S_VERSION)의 OpenAPI 스키마로도 검사합니다.
+    """
+    version = resolve_version(k8s_version)
+    try:
+        result = validate_manifests(yaml_content, check_categories, k8s_version=version)
+    except PolicyError as e:
+        return f"[오류] 정책 플러그인 로드 실패 - {e}"
+    if version:
+        schema_note = f"[스키마] k8s {version} OpenAPI 스키마로 검사\n"
+    elif k8s_version:
+        installed = ", ".join(available_versions()) or "없음"
+        schema_note = f"[스키마] k8s {k8s_version} 스키마가 없어 스키마 검증을 건너뜀 (설치된 버전: {installed})\n"
+    else:
+        schema_note = ""
+    return f"[검증 결과]\n{schema_note}{format_findings(result)}\n\n[원본 YAML]\n{yaml_content}"
 
 
-def generate_multi_resource(requirement: str, resource_types: list) -> str:
-    """여러 리소스 템플릿을 함께 반환."""
-    return generate_yaml(requirement, resource_types)
+def generate_multi_resource(requirement: str, resource_types: list, spec: dict | None = None) -> str:
+    """여러 리소스를 하나의 스펙으로 함께 렌더링 (스펙이 없으면 참고 템플릿 반환)."""
+    return generate_yaml(requirement, resource_types, spec)
 
 
 def diff_yaml(yaml_before: str, yaml_after: str) -> str:
-    """두 YAML을 나란히 반환."""
-    return f"[변경 전 YAML]\n{yaml_before}\n\n[변경 후 YAML]\n{yaml_after}"
+    """두 YAML의 구조 비교 결과(변경된 경로만)를 반환 (yaml_diff.py).
 
+    파싱할 수 없으면 두 YAML을 나란히 반환합니다.
+    """
+    try:
+        return format_diff(diff_manifests(yaml_before, yaml_after))
+    except yaml.YAMLError as e:
+        return (
+            f"[YAML 비교] 파싱 실패로 구조 비교를 하지 못했습니다: {e}\n\n"
+            f"[변경 전 YAML]\n{yaml_before}\n\n[변경 후 YAML]\n{yaml_after}"
+        )
 
-def _get_rule(rule_id: str) -> dict | None:
-    """규칙 ID로 검증 규칙 조회."""
-    return next((r for r in VALIDATION_RULES if r["id"] == rule_id), None)
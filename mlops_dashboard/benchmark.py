@@ -0,0 +1,164 @@
+"""execute_query 지연 시간 벤치마크.
+
+generate_data.py로 만든 대규모 DB에서 에이전트가 실제로 생성하는 형태의 SQL을
+execute_query로 실행해 쿼리별 지연 시간(p50/p95/max)을 측정합니다.
+결과 캐시(ResultCache)는 반복마다 비워 실제 실행 시간을 측정하고,
+캐시 적중 시간은 별도 열로 표시합니다.
+
+사용법:
+    python3 mlops_dashboard/generate_data.py --scale 100 --output /tmp/bench.db
+    python3 mlops_dashboard/benchmark.py --db /tmp/bench.db --repeat 5
+    python3 mlops_dashboard/benchmark.py --db /tmp/bench.db --json > bench.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mlops_dashboard import db_manager
+from mlops_dashboard.generate_data import DEFAULT_OUTPUT
+
+# (이름, SQL) — QUESTIONS.md의 질문 유형별로 에이전트가 생성하는 대표 쿼리
+BENCH_QUERIES = [
+    (
+        "production_models",
+        "SELECT m.name, m.version, x.f1_score, x.precision_val, x.recall "
+        "FROM models m JOIN metrics x ON x.model_id = m.id "
+        "WHERE m.stage = 'production' ORDER BY x.f1_score DESC LIMIT 20",
+    ),
+    (
+        "team_projects",
+        "SELECT p.name, p.task_type, p.status FROM projects p "
+        "JOIN users u ON u.id = p.user_id WHERE u.team = 'Vision AI'",
+    ),
+    (
+        "pipeline_status_counts",
+        "SELECT status, COUNT(*) FROM pipelines GROUP BY status",
+    ),
+    (
+        "project_failed_pipelines",
+        "SELECT pl.name, pl.started_at, pl.finished_at FROM pipelines pl "
+        "JOIN datasets d ON d.id = pl.dataset_id JOIN projects p ON p.id = d.project_id "
+        "WHERE p.id = 1 AND pl.status = 'failed'",
+    ),
+    (
+        "gpu_hours_by_project",
+        "SELECT p.name, pl.gpu_type, "
+        "SUM((julianday(pl.finished_at) - julianday(pl.started_at)) * 24) AS gpu_hours "
+        "FROM pipelines pl JOIN datasets d ON d.id = pl.dataset_id "
+        "JOIN projects p ON p.id = d.project_id WHERE pl.gpu_type = 'A100' "
+        "GROUP BY p.id, pl.gpu_type ORDER BY gpu_hours DESC LIMIT 10",
+    ),
+    (
+        "largest_checkpoints",
+        "SELECT file_path, size_mb FROM artifacts WHERE type = 'checkpoint' "
+        "ORDER BY size_mb DESC LIMIT 10",
+    ),
+    (
+        "pipeline_artifacts",
+        "SELECT a.type, a.file_path, a.size_mb FROM artifacts a "
+        "JOIN pipelines pl ON pl.id = a.pipeline_id WHERE pl.name = 'object-detection-exp0000042'",
+    ),
+    (
+        "high_recall_models",
+        "SELECT m.name, m.stage, x.recall, x.precision_val FROM metrics x "
+        "JOIN models m ON m.id = x.model_id WHERE x.recall > 0.95 "
+        "ORDER BY x.recall DESC LIMIT 10",
+    ),
+    (
+        "all_artifacts_page",
+        "SELECT * FROM artifacts",
+    ),
+]
+
+
+def _status(result: str) -> str:
+    for prefix, status in (
+        ("[실행 거부]", "rejected"),
+        ("[실행 중단]", "interrupted"),
+        ("[SQL 오류]", "error"),
+        ("[오류]", "error"),
+    ):
+        if result.startswith(prefix):
+            return status
+    return "warning" if "[경고]" in result else "ok"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def run_benchmark(db_path: str, repeat: int = 5, queries=None) -> list[dict]:
+    """쿼리별 실행 지연 시간(ms)을 측정.
+
+    Returns:
+        [{"name", "status", "p50_ms", "p95_ms", "max_ms", "cached_ms"}, ...]
+    """
+    db_manager.DB_PATH = db_path
+    db_manager.reset_pool()
+
+    results = []
+    for name, sql in queries or BENCH_QUERIES:
+        timings = []
+        result = ""
+        for _ in range(repeat):
+            db_manager.result_cache.clear()
+            started = time.perf_counter()
+            result = db_manager.execute_query(sql)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        db_manager.execute_query(sql)
+        cached_ms = (time.perf_counter() - started) * 1000
+
+        results.append(
+            {
+                "name": name,
+                "status": _status(result),
+                "p50_ms": round(statistics.median(timings), 2),
+                "p95_ms": round(_percentile(timings, 95), 2),
+                "max_ms": round(max(timings), 2),
+                "cached_ms": round(cached_ms, 3),
+            }
+        )
+    return results
+
+
+def format_table(results: list[dict]) -> str:
+    header = f"{'query':<26} {'status':<12} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'cached ms':>10}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['name']:<26} {r['status']:<12} {r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f} "
+            f"{r['max_ms']:>10.2f} {r['cached_ms']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="execute_query 지연 시간 벤치마크")
+    parser.add_argument("--db", default=DEFAULT_OUTPUT, help=f"벤치마크 DB 경로 (기본: {DEFAULT_OUTPUT})")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리별 반복 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"[오류] DB가 없습니다: {args.db} (generate_data.py로 먼저 생성하세요)")
+        sys.exit(1)
+
+    results = run_benchmark(args.db, max(args.repeat, 1))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
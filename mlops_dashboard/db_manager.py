@@ -1,60 +1,812 @@
+import hashlib
+import json
+import queue
+import re
 import sqlite3
 import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "data", "sample.db")
 
-BLOCKED_KEYWORDS = {"DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "CREATE", "TRUNCATE", "REPLACE"}
+# ── 쿼리 엔진 ──────────────────────────────
+# sqlite: SQLite만 사용 (기본)
+# duckdb: 모든 쿼리를 DuckDB로 실행 (SQLite 파일 attach 또는 PARQUET_DIR의 Parquet 사용)
+# auto:   SQLite로 실행하되, 큰 테이블을 스캔하는 집계 쿼리만 DuckDB로 라우팅
+BACKEND = os.environ.get("MLOPS_DB_BACKEND", "sqlite")
+# Parquet export 디렉터리 (DuckDB 백엔드에서 *.parquet 파일을 테이블로 등록)
+PARQUET_DIR = os.environ.get("MLOPS_PARQUET_DIR")
+
+# 렌더링된 스키마 디스크 캐시 (PRAGMA schema_version/user_version과 sqlite_master 내용이 같으면 재사용)
+SCHEMA_CACHE_PATH = os.path.join(os.path.dirname(__file__), "data", "schema_cache.json")
+
+# ── 쿼리 결과 출력 예산 ──────────────────────────────
+# 한 페이지에 표시할 최대 행 수
+PAGE_SIZE = 50
+# 한 페이지 결과 텍스트의 최대 크기 (bytes, UTF-8 기준)
+MAX_RESULT_BYTES = 8000
+# fetchmany 배치 크기
+FETCH_BATCH = 256
+# 잘린 결과의 요약 통계를 계산할 때 스캔할 최대 행 수
+SUMMARY_SCAN_LIMIT = 100_000
+# 컬럼별 distinct 값 추적 상한
+DISTINCT_LIMIT = 1000
+
+# SQL → 결과 텍스트 캐시 크기 (LRU, DB 파일이 바뀌면 전체 무효화)
+RESULT_CACHE_SIZE = 256
+
+# ── 쿼리 실행 제한 ──────────────────────────────
+# 이 행 수 이상인 테이블을 전체 스캔(SCAN)하면 경고
+LARGE_TABLE_ROWS = 10_000
+# 인덱스 없이 중첩 스캔하는 테이블들의 예상 행 수 곱이 이 값을 넘으면 실행 거부 (카테시안 조인)
+MAX_SCAN_PRODUCT = 10_000_000
+# 바깥 쿼리가 LIMIT(+OFFSET) 이 행 수 이하로 끝나고 ORDER BY/집계/DISTINCT가 없으면
+# SQLite가 그 행 수만큼만 만들고 멈추므로 카테시안 조인도 거부하지 않고 경고만 (단계 제한은 그대로 적용)
+SMALL_LIMIT_ROWS = 1000
+# 쿼리 실행 시간 제한 (초)
+QUERY_TIMEOUT_SEC = 5.0
+# 쿼리당 최대 SQLite VM 명령 수
+MAX_VM_STEPS = 50_000_000
+# progress handler 호출 간격 (VM 명령 수)
+PROGRESS_INTERVAL = 10_000
+# auto 모드: 이 행 수 이상을 전체 스캔하는 집계 쿼리를 DuckDB로 라우팅
+ANALYTICS_MIN_ROWS = 100_000
+
+# ── 읽기 전용 authorizer ──────────────────────────────
+# 문장 컴파일(prepare) 시 SQLite가 동작마다 authorizer를 호출하므로, 키워드 검사 없이
+# 쓰기/DDL/ATTACH 등 허용 목록 밖의 동작을 SQLite 파서 수준에서 차단합니다.
+_ALLOWED_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    getattr(sqlite3, "SQLITE_RECURSIVE", 33),  # WITH RECURSIVE (Python 3.11 미만은 상수 없음)
+    sqlite3.SQLITE_TRANSACTION,  # 풀 반환 시 rollback
+}
+# 인자로 테이블/인덱스 이름을 받는 조회용 PRAGMA
+_READ_PRAGMAS_WITH_ARG = {
+    "table_info", "table_xinfo", "index_list", "index_info", "index_xinfo", "foreign_key_list",
+}
+# 인자 없이 값을 조회하는 PRAGMA (인자가 있으면 설정 변경이므로 거부)
+_READ_PRAGMAS = {
+    "schema_version", "user_version", "data_version", "page_count", "page_size",
+    "freelist_count", "database_list", "table_list", "collation_list", "function_list",
+}
+
+# ── 읽기 전용 커넥션 풀 설정 ──────────────────────────────
+POOL_SIZE = 4
+# 커넥션별 prepared statement 캐시 크기 (sqlite3 기본값 128)
+STATEMENT_CACHE_SIZE = 128
+# 메모리 맵 I/O 크기 (bytes). 0이면 비활성화
+MMAP_SIZE = 256 * 1024 * 1024
+# 페이지 캐시 크기 (KiB). PRAGMA cache_size에 음수로 전달
+CACHE_SIZE_KB = 64 * 1024
+
+
+# 읽기 전용 authorizer가 거부했을 때의 sqlite3 오류 메시지
+_AUTH_ERRORS = ("not authorized", "authorization denied")
+# 두 번째 문장 여부를 판단할 때 무시할 주석
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+def _readonly_authorizer(action, arg1, arg2, db_name, trigger) -> int:
+    """SELECT와 조회용 PRAGMA만 허용하는 authorizer (sqlite3.Connection.set_authorizer)."""
+    if action in _ALLOWED_ACTIONS:
+        return sqlite3.SQLITE_OK
+    if action == sqlite3.SQLITE_PRAGMA:
+        name = (arg1 or "").lower()
+        if name in _READ_PRAGMAS_WITH_ARG or (name in _READ_PRAGMAS and arg2 is None):
+            return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+
+def validate_sql(sql: str) -> str | None:
+    """SQL이 하나의 완결된 문장인지 검사. 문제가 있으면 오류 메시지, 없으면 None.
+
+    쓰기 차단은 authorizer가 담당하고, 여기서는 sqlite3.complete_statement로
+    `SELECT ...; DROP ...`처럼 세미콜론으로 이어 붙인 문장만 걸러냅니다.
+    문자열/주석 안의 세미콜론은 complete_statement가 SQLite 토크나이저로 구분합니다.
+    """
+    text = sql.strip()
+    if not text:
+        return "[오류] 빈 쿼리입니다."
+    # 끝에 '--' 주석이 있으면 같은 줄에 붙인 세미콜론도 주석이 되므로 줄을 바꿔서 붙임
+    if not sqlite3.complete_statement(text + "\n;"):
+        return "[오류] 완결되지 않은 SQL 문장입니다 (따옴표/괄호/주석이 닫혔는지 확인하세요)."
+
+    # 첫 번째 문장이 끝나는 세미콜론 위치를 찾아 뒤에 다른 문장이 있는지 확인
+    pos = text.find(";")
+    while pos != -1:
+        if sqlite3.complete_statement(text[: pos + 1]):
+            rest = text[pos + 1 :]
+            if _COMMENT_RE.sub("", rest).strip(" \t\r\n;"):
+                return "[오류] 한 번에 하나의 SELECT 문만 실행할 수 있습니다."
+            break
+        pos = text.find(";", pos + 1)
+    return None
+
+
+class ConnectionPool:
+    """읽기 전용 SQLite 커넥션 풀 (thread-safe).
+
+    호출마다 connect/close를 반복하면 페이지 캐시와 statement 캐시가 매번 버려지므로,
+    `mode=ro` URI + 읽기 전용 authorizer로 연 커넥션을 재사용합니다. 커넥션은 필요할 때 size개까지 생성하고,
+    모두 사용 중이면 반환될 때까지 대기합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = POOL_SIZE,
+        cached_statements: int = STATEMENT_CACHE_SIZE,
+    ):
+        self.db_path = db_path
+        self.size = size
+        self.cached_statements = cached_statements
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        # 읽기 전용 커넥션이므로 journal_mode는 건드리지 않음 (WAL DB도 그대로 읽기 가능)
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+        conn.execute("PRAGMA query_only=ON")
+        # 이후 이 커넥션에서 컴파일되는 모든 문장은 읽기 동작만 허용
+        conn.set_authorizer(_readonly_authorizer)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """풀에서 커넥션을 빌려 with 블록 동안 사용하고 반환."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+
+        try:
+            yield conn
+        finally:
+            # 읽기 트랜잭션이 열린 채로 반환되면 이후 쿼리가 오래된 스냅샷을 보게 됨
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def close(self):
+        """대기 중인 커넥션을 모두 닫음."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """DB_PATH에 대한 전역 커넥션 풀 (첫 사용 시 생성)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.db_path != DB_PATH:
+            if _pool is not None:
+                _pool.close()
+            _pool = ConnectionPool(DB_PATH)
+        return _pool
+
+
+def reset_pool():
+    """DB 파일을 다시 만든 경우 기존 커넥션(DuckDB attach 포함)을 닫고 풀을 초기화."""
+    global _pool, _duckdb_backend, _duckdb_error
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = None
+    with _duckdb_lock:
+        if _duckdb_backend is not None:
+            _duckdb_backend.close()
+        _duckdb_backend = None
+        _duckdb_error = None
 
 
 def get_connection():
     return sqlite3.connect(DB_PATH)
 
 
-def get_schema() -> str:
-    conn = get_connection()
-    cur = conn.cursor()
+_schema_cache: dict | None = None
+
+
+def _schema_key(conn: sqlite3.Connection) -> dict:
+    """스키마 변경 감지용 키. DDL이 실행될 때마다 schema_version이 증가합니다.
+
+    같은 경로에 DB를 다시 만들면(setup_db/generate_data) schema_version이 우연히 같을 수 있으므로
+    sqlite_master의 DDL 내용 해시도 키에 포함합니다.
+    """
+    (ddl,) = conn.execute(
+        "SELECT group_concat(type || name || coalesce(sql, ''), char(10)) "
+        "FROM (SELECT type, name, sql FROM sqlite_master ORDER BY type, name)"
+    ).fetchone()
+    return {
+        "db_path": os.path.abspath(DB_PATH),
+        "schema_version": conn.execute("PRAGMA schema_version").fetchone()[0],
+        "user_version": conn.execute("PRAGMA user_version").fetchone()[0],
+        "fingerprint": hashlib.sha256((ddl or "").encode("utf-8")).hexdigest(),
+    }
+
+
+def _load_schema_cache() -> dict | None:
+    try:
+        with open(SCHEMA_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _save_schema_cache(cache: dict):
+    try:
+        tmp_path = SCHEMA_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, SCHEMA_CACHE_PATH)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시 (다음 실행에서 다시 생성)
+
 
-    cur.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+def _introspect_schema(cur: sqlite3.Cursor) -> list[dict]:
+    """테이블별 컬럼/외래키 정보를 조회."""
+    # sqlite_stat1 등 내부 테이블(ANALYZE 결과)은 제외
+    cur.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+    )
     tables = cur.fetchall()
 
-    schema_parts = []
+    schema_info = []
     for (table_name,) in tables:
         cur.execute(f"PRAGMA table_info({table_name})")
-        columns = cur.fetchall()
-        col_defs = [f"  {col[1]} {col[2]}" for col in columns]
+        columns = [[col[1], col[2]] for col in cur.fetchall()]
 
         cur.execute(f"PRAGMA foreign_key_list({table_name})")
-        fks = cur.fetchall()
-        fk_defs = [f"  FOREIGN KEY ({fk[3]}) REFERENCES {fk[2]}({fk[4]})" for fk in fks]
+        fks = [[fk[3], fk[2], fk[4]] for fk in cur.fetchall()]
 
-        parts = ",\n".join(col_defs + fk_defs)
-        schema_parts.append(f"CREATE TABLE {table_name} (\n{parts}\n);")
+        schema_info.append({"name": table_name, "columns": columns, "foreign_keys": fks})
+    return schema_info
+
+
+def get_schema_info() -> list[dict]:
+    """테이블 구조 정보. 스키마가 바뀌지 않았으면 캐시에서 반환.
 
-    conn.close()
+    Returns:
+        [{"name": str, "columns": [[name, type], ...],
+          "foreign_keys": [[column, ref_table, ref_column], ...]}, ...]
+    """
+    if BACKEND == "duckdb":
+        backend = _duckdb_or_none()
+        if backend is not None:
+            return backend.schema_info()
+        if not os.path.exists(DB_PATH):
+            raise RuntimeError(f"[오류] DuckDB 백엔드를 사용할 수 없습니다: {_duckdb_error}")
+        # SQLite 파일이 있으면 SQLite로 대체 (duckdb_active()가 False)
+
+    global _schema_cache
+    with get_pool().connection() as conn:
+        key = _schema_key(conn)
+
+        if _schema_cache is None:
+            _schema_cache = _load_schema_cache()
+        if _schema_cache and _schema_cache.get("key") == key:
+            return _schema_cache["tables"]
+
+        tables = _introspect_schema(conn.cursor())
+
+    _schema_cache = {"key": key, "tables": tables}
+    _save_schema_cache(_schema_cache)
+    return tables
+
+
+def render_schema(tables: list[dict]) -> str:
+    """테이블 구조 정보를 CREATE TABLE 형태의 텍스트로 렌더링."""
+    schema_parts = []
+    for table in tables:
+        col_defs = [f"  {name} {col_type}" for name, col_type in table["columns"]]
+        fk_defs = [
+            f"  FOREIGN KEY ({col}) REFERENCES {ref_table}({ref_col})"
+            for col, ref_table, ref_col in table["foreign_keys"]
+        ]
+        parts = ",\n".join(col_defs + fk_defs)
+        schema_parts.append(f"CREATE TABLE {table['name']} (\n{parts}\n);")
     return "\n\n".join(schema_parts)
 
 
-def execute_query(sql: str) -> str:
-    sql_upper = sql.strip().upper()
-    for keyword in BLOCKED_KEYWORDS:
-        if keyword in sql_upper.split():
-            return f"[오류] {keyword} 쿼리는 허용되지 않습니다. SELECT만 사용 가능합니다."
+def get_schema() -> str:
+    return render_schema(get_schema_info())
+
+
+def _sort_key(value):
+    """숫자와 문자열이 섞인 컬럼도 min/max를 계산할 수 있도록 비교 키를 만듦."""
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+    return (1, 0, str(value))
+
+
+class _ColumnStats:
+    """스트리밍 방식 컬럼 요약 (min/max/distinct/null 수)."""
+
+    def __init__(self):
+        self.min = None
+        self.max = None
+        self.nulls = 0
+        self.distinct: set = set()
+        self.distinct_overflow = False
+
+    def add(self, value):
+        if value is None:
+            self.nulls += 1
+            return
+        key = _sort_key(value)
+        if self.min is None or key < _sort_key(self.min):
+            self.min = value
+        if self.max is None or key > _sort_key(self.max):
+            self.max = value
+        if not self.distinct_overflow:
+            self.distinct.add(value)
+            if len(self.distinct) > DISTINCT_LIMIT:
+                self.distinct_overflow = True
+                self.distinct.clear()
+
+    def describe(self) -> str:
+        distinct = f"{DISTINCT_LIMIT}+" if self.distinct_overflow else str(len(self.distinct))
+        return f"min={_short(self.min)} | max={_short(self.max)} | distinct={distinct} | null={self.nulls}"
+
+
+def _short(value, limit: int = 40) -> str:
+    text = str(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _format_row(row) -> str:
+    return " | ".join(str(val) for val in row)
+
+
+# EXPLAIN QUERY PLAN detail: "SCAN m", "SEARCH x USING INDEX ...", (구버전) "SCAN TABLE models AS m"
+_PLAN_RE = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\S+)(?: AS (\S+))?")
+# "FROM models m", "JOIN metrics AS x" 형태의 테이블 별칭 (lookahead로 겹치는 매치 허용)
+_ALIAS_RE = re.compile(r"\b([A-Za-z_]\w*)(?=\s+(?:AS\s+)?([A-Za-z_]\w*))", re.IGNORECASE)
+_NON_ALIAS_WORDS = {
+    "AS", "CROSS", "EXCEPT", "FROM", "FULL", "GROUP", "HAVING", "INDEXED", "INNER",
+    "INTERSECT", "JOIN", "LEFT", "LIMIT", "NATURAL", "NOT", "ON", "ORDER", "OUTER",
+    "RIGHT", "SELECT", "UNION", "USING", "WHERE", "WINDOW",
+}
+
+
+def _alias_map(conn: sqlite3.Connection, sql: str) -> dict[str, str]:
+    """SQL의 테이블 별칭 → 실제 테이블 이름 (EXPLAIN 출력은 별칭만 보여줌)."""
+    tables = {
+        name.lower(): name
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    }
+    aliases = {name: name for name in tables.values()}
+    for match in _ALIAS_RE.finditer(sql):
+        table, alias = match.group(1), match.group(2)
+        if table.lower() in tables and alias.upper() not in _NON_ALIAS_WORDS:
+            aliases[alias] = tables[table.lower()]
+    return aliases
+
 
+def _row_estimate(conn: sqlite3.Connection, table: str) -> int | None:
+    """테이블 행 수 추정치. max(rowid)는 B-tree 끝만 읽으므로 COUNT(*)와 달리 O(log n)."""
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(sql)
-        columns = [desc[0] for desc in cur.description] if cur.description else []
-        rows = cur.fetchall()
-        conn.close()
+        row = conn.execute(f'SELECT max(rowid) FROM "{table}"').fetchone()
+    except sqlite3.Error:
+        return None  # WITHOUT ROWID 테이블 등
+    return row[0] or 0
+
+
+# 바깥 쿼리 끝의 "LIMIT n", "LIMIT n OFFSET m", "LIMIT m, n" (주석 제거 후)
+_OUTER_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)(?:\s+OFFSET\s+(\d+)|\s*,\s*(\d+))?\s*;?\s*$", re.IGNORECASE)
+# 모든 행을 만들어야 결과가 정해지는 절 (LIMIT가 있어도 중간에 멈추지 못함)
+_FULL_RESULT_RE = re.compile(r"\bORDER\s+BY\b|\bDISTINCT\b", re.IGNORECASE)
+
+
+def _small_outer_limit(sql: str) -> int | None:
+    """바깥 쿼리의 LIMIT(+OFFSET)가 SMALL_LIMIT_ROWS 이하이고 정렬/집계/DISTINCT가 없으면 그 행 수."""
+    body = _COMMENT_RE.sub(" ", sql).strip()
+    match = _OUTER_LIMIT_RE.search(body)
+    if not match or _FULL_RESULT_RE.search(body) or _AGGREGATE_RE.search(body):
+        return None
+    rows = sum(int(n) for n in match.groups() if n)
+    return rows if rows <= SMALL_LIMIT_ROWS else None
+
+
+def check_query_plan(conn: sqlite3.Connection, sql: str) -> dict:
+    """EXPLAIN QUERY PLAN으로 실행 전에 쿼리 비용을 점검.
+
+    Returns:
+        {"plan": [str, ...],       # 들여쓰기된 실행 계획 (스캔 테이블은 예상 행 수 표시)
+         "warnings": [str, ...],   # 큰 테이블 전체 스캔
+         "error": str | None,      # 카테시안 조인 등 실행 거부 사유 (작은 LIMIT가 있으면 경고로 대체)
+         "max_scan_rows": int}     # 전체 스캔하는 테이블 중 가장 큰 테이블의 예상 행 수
+    """
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    aliases = _alias_map(conn, sql)
+    estimates: dict[str, int | None] = {}
+
+    plan, warnings = [], []
+    max_scan_rows = 0
+    depth: dict[int, int] = {}
+    # 같은 parent 아래의 SCAN들은 중첩 루프로 실행됨
+    scans_by_parent: dict[int, list[tuple[str, int]]] = {}
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        line = detail
+        match = _PLAN_RE.match(detail)
+        if match:
+            table = aliases.get(match.group(2)) or aliases.get(match.group(3) or "")
+            if table and table not in estimates:
+                estimates[table] = _row_estimate(conn, table)
+            n_rows = estimates.get(table) if table else None
+            if match.group(1) == "SCAN" and n_rows is not None:
+                line += f" (약 {n_rows:,}행)"
+                scans_by_parent.setdefault(parent, []).append((table, n_rows))
+                max_scan_rows = max(max_scan_rows, n_rows)
+                if n_rows >= LARGE_TABLE_ROWS:
+                    warnings.append(
+                        f"[경고] {table} 전체 스캔 (약 {n_rows:,}행). "
+                        "인덱스 컬럼(id, *_id)으로 WHERE/JOIN 조건을 추가하면 빨라집니다."
+                    )
+        plan.append("  " * depth[node_id] + line)
+
+    error = None
+    limit = _small_outer_limit(sql)
+    for scans in scans_by_parent.values():
+        if len(scans) < 2:
+            continue
+        product = 1
+        for _, n_rows in scans:
+            product *= max(n_rows, 1)
+        if product > MAX_SCAN_PRODUCT:
+            names = " × ".join(f"{t}({n:,})" for t, n in scans)
+            if limit is not None:
+                warnings.append(
+                    f"[경고] 인덱스 없이 중첩 스캔하는 테이블 {names} — LIMIT {limit:,}행에서 멈추므로 실행합니다. "
+                    "JOIN ... ON 조건이 빠진 카테시안 조인인지 확인하세요."
+                )
+                continue
+            error = (
+                f"[실행 거부] 인덱스 없이 중첩 스캔하는 테이블 {names} — 예상 {product:,}개 행 조합 "
+                f"(제한 {MAX_SCAN_PRODUCT:,}). JOIN ... ON 조건이 빠진 카테시안 조인인지 확인하고, "
+                "외래키 컬럼으로 조인하거나 WHERE로 범위를 좁히세요."
+            )
+            break
+    return {"plan": plan, "warnings": warnings, "error": error, "max_scan_rows": max_scan_rows}
+
+
+def _render_plan(check: dict) -> str:
+    return "[쿼리 계획]\n" + "\n".join(check["plan"])
+
+
+# 집계 쿼리 판별용 (집계 함수, GROUP BY, 윈도 함수)
+_AGGREGATE_RE = re.compile(
+    r"\b(?:COUNT|SUM|AVG|MIN|MAX|TOTAL|GROUP_CONCAT|MEDIAN)\s*\(|\bGROUP\s+BY\b|\bOVER\s*\(",
+    re.IGNORECASE,
+)
+
+
+def is_analytical(sql: str, check: dict) -> bool:
+    """큰 테이블을 전체 스캔하는 집계 쿼리인지 (auto 모드에서 DuckDB로 라우팅할 대상)."""
+    return check["max_scan_rows"] >= ANALYTICS_MIN_ROWS and bool(_AGGREGATE_RE.search(sql))
+
+
+_duckdb_backend = None
+# DuckDB 백엔드를 만들지 못한 이유 (한 번 실패하면 reset_pool 전까지 재시도하지 않음)
+_duckdb_error: str | None = None
+_duckdb_lock = threading.Lock()
+
+
+def get_duckdb_backend():
+    """DuckDB 분석 백엔드 (첫 사용 시 생성). duckdb 패키지가 없으면 ImportError."""
+    from mlops_dashboard.duckdb_backend import DuckDBBackend
+
+    global _duckdb_backend
+    with _duckdb_lock:
+        backend = _duckdb_backend
+        if backend is None or (backend.db_path, backend.parquet_dir) != (DB_PATH, PARQUET_DIR):
+            if backend is not None:
+                backend.close()
+            _duckdb_backend = DuckDBBackend(DB_PATH, PARQUET_DIR)
+        return _duckdb_backend
+
+
+def _duckdb_or_none():
+    """DuckDB 백엔드. 만들 수 없으면 이유를 _duckdb_error에 남기고 None."""
+    global _duckdb_error
+    if _duckdb_error is not None:
+        return None
+    try:
+        return get_duckdb_backend()
+    except Exception as e:
+        # duckdb 미설치, sqlite 확장 설치 실패(오프라인) 등 — 매 쿼리 재시도하지 않음
+        _duckdb_error = f"{type(e).__name__}: {e}"
+        return None
+
+
+def duckdb_active() -> bool:
+    """BACKEND=duckdb이고 DuckDB 백엔드를 실제로 사용 중인지 (False면 SQLite로 대체 실행)."""
+    return BACKEND == "duckdb" and _duckdb_or_none() is not None
+
+
+def duckdb_error() -> str | None:
+    """DuckDB 백엔드를 만들지 못한 이유 (없으면 None)."""
+    return _duckdb_error
+
+
+def _execute_on_duckdb(sql: str, page: int) -> str | None:
+    """auto 모드 라우팅. DuckDB를 쓸 수 없으면 None (이후 라우팅 중지)."""
+    backend = _duckdb_or_none()
+    if backend is None:
+        return None
+    try:
+        return backend.execute(sql, page, fallback_ok=True)
+    except Exception:
+        return None
+
+
+def _db_fingerprint() -> tuple:
+    """DB 파일(+WAL, Parquet)의 mtime/크기. 다른 프로세스가 커밋하면 값이 바뀝니다.
 
-        if not rows:
-            return "결과 없음"
+    PRAGMA data_version은 커넥션마다 값이 달라 풀의 여러 커넥션 사이에서 비교할 수 없고,
+    조회하려면 SQLite를 거쳐야 하므로 파일 stat으로 변경을 감지합니다.
+    """
+    fingerprint = [DB_PATH]
+    for path in (DB_PATH, DB_PATH + "-wal"):
+        try:
+            st = os.stat(path)
+        except OSError:
+            fingerprint.append(None)
+            continue
+        fingerprint.append((st.st_mtime_ns, st.st_size))
+    if PARQUET_DIR and BACKEND != "sqlite":
+        try:
+            with os.scandir(PARQUET_DIR) as entries:
+                fingerprint.extend(
+                    (e.name, e.stat().st_mtime_ns, e.stat().st_size)
+                    for e in entries
+                    if e.name.endswith(".parquet")
+                )
+        except OSError:
+            pass
+    return tuple(fingerprint)
 
-        header = " | ".join(columns)
-        separator = "-" * len(header)
-        row_strs = [" | ".join(str(val) for val in row) for row in rows]
 
-        return f"{header}\n{separator}\n" + "\n".join(row_strs)
+class ResultCache:
+    """SQL 텍스트(+페이지) → 결과 텍스트 LRU 캐시 (thread-safe).
+
+    DB 파일이 바뀌면(다른 프로세스의 커밋, 샘플 DB 재생성) 전체를 비웁니다.
+    """
+
+    def __init__(self, size: int = RESULT_CACHE_SIZE):
+        self.size = size
+        self._entries: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._fingerprint: tuple | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, sql: str, page: int) -> str | None:
+        fingerprint = _db_fingerprint()
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._entries.clear()
+                self._fingerprint = fingerprint
+            result = self._entries.get((sql, page))
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((sql, page))
+            self.hits += 1
+            return result
+
+    def put(self, sql: str, page: int, result: str):
+        with self._lock:
+            self._entries[(sql, page)] = result
+            self._entries.move_to_end((sql, page))
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+result_cache = ResultCache()
+
+
+def execute_query(sql: str, page: int = 1) -> str:
+    """SELECT 쿼리 결과 한 페이지. 같은 SQL/페이지는 DB가 바뀌기 전까지 캐시에서 반환."""
+    page = max(int(page or 1), 1)
+    key = sql.strip().rstrip(";").strip()
+    cached = result_cache.get(key, page)
+    if cached is not None:
+        return cached
+
+    backend = _duckdb_or_none() if BACKEND == "duckdb" else None
+    if backend is not None:
+        result = backend.execute(sql, page)
+    elif BACKEND == "duckdb" and not os.path.exists(DB_PATH):
+        result = f"[오류] DuckDB 백엔드를 사용할 수 없습니다: {_duckdb_error}"
+    else:
+        result = _execute_query(sql, page)
+    # 시간 제한 중단은 부하에 따라 달라지므로 캐시하지 않음
+    if not result.startswith("[실행 중단]"):
+        result_cache.put(key, page, result)
+    return result
+
+
+def _execute_query(sql: str, page: int) -> str:
+    """SELECT 쿼리를 실행하고 결과 한 페이지를 텍스트로 반환.
+
+    결과는 fetchmany로 스트리밍하며 PAGE_SIZE행 / MAX_RESULT_BYTES 안에서만 렌더링합니다.
+    결과가 잘리면 전체 행 수와 컬럼별 min/max/distinct 요약을 덧붙이고,
+    다음 페이지는 page 인자(fetch_sql_page 도구)로 요청할 수 있습니다.
+
+    실행 전에 EXPLAIN QUERY PLAN으로 카테시안 조인을 거부하고 큰 테이블 전체 스캔을 경고하며,
+    실행은 progress handler로 QUERY_TIMEOUT_SEC / MAX_VM_STEPS 안에서만 허용합니다.
+    경고/거부/중단 시 실행 계획을 함께 반환해 LLM이 쿼리를 고쳐 쓸 수 있게 합니다.
+    """
+    error = validate_sql(sql)
+    if error:
+        return error
+
+    offset = (page - 1) * PAGE_SIZE
+
+    limits = f"제한: {QUERY_TIMEOUT_SEC:g}초 / VM {MAX_VM_STEPS:,} 스텝"
+    try:
+        with get_pool().connection() as conn:
+            check = check_query_plan(conn, sql)
+            if check["error"]:
+                return f"{check['error']}\n\n{_render_plan(check)}"
+            routed = BACKEND == "auto" and is_analytical(sql, check)
+
+        if routed:
+            # DuckDB가 SQLite 전용 함수(julianday 등)로 실패하면 SQLite로 실행
+            result = _execute_on_duckdb(sql, page)
+            if result is not None:
+                return result
+
+        with get_pool().connection() as conn:
+
+            # progress handler가 0이 아닌 값을 반환하면 SQLite가 실행을 중단 (OperationalError)
+            state = {"steps": 0, "reason": None}
+            deadline = time.monotonic() + QUERY_TIMEOUT_SEC
+
+            def guard():
+                state["steps"] += PROGRESS_INTERVAL
+                if state["steps"] > MAX_VM_STEPS:
+                    state["reason"] = f"VM 스텝 {MAX_VM_STEPS:,}회"
+                elif time.monotonic() > deadline:
+                    state["reason"] = f"실행 시간 {QUERY_TIMEOUT_SEC:g}초"
+                return 1 if state["reason"] else 0
+
+            conn.set_progress_handler(guard, PROGRESS_INTERVAL)
+            try:
+                result = _fetch_page(conn.cursor(), sql, offset)
+            except sqlite3.OperationalError:
+                if not state["reason"]:
+                    raise
+                return (
+                    f"[실행 중단] 쿼리가 {state['reason']} 제한을 초과했습니다 ({limits}). "
+                    "집계/LIMIT/인덱스 조건으로 쿼리를 다시 작성하세요.\n\n"
+                    + _render_plan(check)
+                )
+            finally:
+                # 풀에 반환된 커넥션이 다른 쿼리의 제한을 물려받지 않도록 해제
+                conn.set_progress_handler(None, 0)
+
+        notes = ""
+        if check["warnings"]:
+            notes = "\n\n" + "\n".join(check["warnings"]) + "\n" + _render_plan(check)
+        return render_page(result, page, notes)
+    except sqlite3.DatabaseError as e:
+        # authorizer가 거부하면 prepare 단계에서 "not authorized",
+        # VACUUM처럼 실행 단계에서 권한을 확인하는 문장은 "authorization denied"(SQLITE_AUTH) 오류 발생
+        if any(message in str(e) for message in _AUTH_ERRORS):
+            return "[오류] 읽기 전용 대시보드입니다. SELECT 쿼리만 사용 가능합니다."
+        return f"[SQL 오류] {e}"
     except Exception as e:
         return f"[SQL 오류] {e}"
+
+
+def render_page(result: tuple, page: int, notes: str = "") -> str:
+    """_fetch_page 결과를 텍스트로 렌더링 (잘린 경우 요약/다음 페이지 안내 포함)."""
+    columns, row_strs, total, page_full, exhausted, stats = result
+    offset = (page - 1) * PAGE_SIZE
+    if not row_strs:
+        if total and offset:
+            return f"결과 없음 (전체 {total}행, {page}페이지는 범위를 벗어났습니다)"
+        return "결과 없음" + notes
+
+    header = " | ".join(columns)
+    separator = "-" * len(header)
+    text = f"{header}\n{separator}\n" + "\n".join(row_strs)
+    if not page_full and offset == 0:
+        return text + notes
+
+    shown_from, shown_to = offset + 1, offset + len(row_strs)
+    total_text = f"{total}행" if exhausted else f"{total}행 이상"
+    summary = [f"\n\n[요약] 전체 {total_text} 중 {shown_from}~{shown_to}행 표시 (page {page})"]
+    if page_full:
+        summary.append(
+            f"다음 페이지: fetch_sql_page(sql, page={page + 1}) "
+            "또는 WHERE/GROUP BY/LIMIT로 범위를 좁히세요."
+        )
+        summary.append(f"[컬럼 요약] (스캔한 {total}행 기준)")
+        summary.extend(f"- {col}: {cs.describe()}" for col, cs in zip(columns, stats))
+    return text + "\n".join(summary) + notes
+
+
+def _fetch_page(cur, sql: str, offset: int, columns: list[str] | None = None) -> tuple:
+    """쿼리를 실행해 offset 이후 한 페이지를 렌더링하고, 스캔한 행으로 컬럼 요약을 계산.
+
+    cur는 DB-API 커서(sqlite3 커서 또는 DuckDB 커넥션)면 됩니다.
+    columns를 주면 커서의 컬럼 이름 대신 사용합니다 (정렬용으로 감싼 쿼리의 원래 컬럼 이름).
+
+    Returns:
+        (columns, row_strs, total, page_full, exhausted, stats)
+    """
+    cur.execute(sql)
+    if columns is None:
+        columns = [desc[0] for desc in cur.description] if cur.description else []
+    header = " | ".join(columns)
+    budget = MAX_RESULT_BYTES - len(header.encode()) * 2
+
+    stats = [_ColumnStats() for _ in columns]
+    row_strs = []
+    page_full = False
+    total = 0
+    while True:
+        batch = cur.fetchmany(FETCH_BATCH)
+        if not batch:
+            break
+        for row in batch:
+            total += 1
+            for col_stats, value in zip(stats, row):
+                col_stats.add(value)
+            if total <= offset or page_full:
+                continue
+            row_str = _format_row(row)
+            size = len(row_str.encode()) + 1
+            if len(row_strs) >= PAGE_SIZE or (size > budget and row_strs):
+                page_full = True
+                continue
+            if size > budget:
+                row_str = row_str[: max(budget, 0)] + "...(잘림)"
+            row_strs.append(row_str)
+            budget -= size
+        # 페이지가 찼으면 요약 통계를 위해 SUMMARY_SCAN_LIMIT행까지만 더 스캔
+        if page_full and total >= offset + SUMMARY_SCAN_LIMIT:
+            break
+    exhausted = not page_full or cur.fetchone() is None
+    return columns, row_strs, total, page_full, exhausted, stats
@@ -0,0 +1,283 @@
+"""DuckDB 분석 백엔드 (선택 의존성: pip install duckdb).
+
+SQLite는 행 단위 엔진이라 수개월치 파이프라인 이력을 집계하는 질문에서 느립니다.
+DuckDB는 컬럼 단위 벡터화 엔진이므로 같은 데이터를 attach해서 집계 쿼리를 실행합니다.
+
+데이터 소스:
+  - Parquet export: PARQUET_DIR의 <table>.parquet 파일을 테이블로 등록 (SQLite 테이블보다 우선)
+  - SQLite 파일: Parquet에 없는 테이블이 있을 때만 sqlite 확장으로 읽기 전용 attach (복사 없음)
+
+db_manager.BACKEND로 사용 방식을 정합니다.
+  - duckdb: 스키마 조회와 모든 쿼리를 DuckDB로 실행
+  - auto:   큰 테이블을 스캔하는 집계 쿼리만 DuckDB로 라우팅 (실패 시 SQLite로 실행)
+
+Parquet export:
+    python3 mlops_dashboard/duckdb_backend.py export --out mlops_dashboard/data/parquet
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mlops_dashboard import db_manager
+
+# attach한 SQLite DB의 카탈로그 이름
+SQLITE_CATALOG = "mlops_sqlite"
+
+# ORDER BY 유무를 판단할 때 무시할 문자열 리터럴/주석
+_LITERAL_OR_COMMENT_RE = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.DOTALL)
+_ORDER_BY_RE = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
+
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError(f"DuckDB 백엔드에는 duckdb 패키지가 필요합니다: pip install duckdb ({e})") from e
+    return duckdb
+
+
+def _load_sqlite_extension(conn):
+    """sqlite 확장 로드. 설치되어 있지 않으면 설치 후 로드 (최초 1회 네트워크 필요)."""
+    try:
+        conn.execute("LOAD sqlite")
+    except Exception:
+        conn.execute("INSTALL sqlite")
+        conn.execute("LOAD sqlite")
+
+
+def _statement_body(sql: str) -> str:
+    """단일 문장(validate_sql 통과)에서 종료 세미콜론과 그 뒤의 주석을 뺀 본문 (서브쿼리로 감쌀 때 사용)."""
+    pos = sql.find(";")
+    while pos != -1:
+        if sqlite3.complete_statement(sql[: pos + 1]):
+            return sql[:pos]
+        pos = sql.find(";", pos + 1)
+    return sql
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+class DuckDBBackend:
+    """SQLite 파일/Parquet을 읽는 DuckDB 인메모리 인스턴스.
+
+    모든 테이블은 main 스키마의 뷰로 등록하므로 쿼리는 SQLite와 같은 테이블 이름을 사용합니다.
+    데이터 소스를 등록한 뒤에는 enable_external_access를 끄고(등록한 경로만 허용) 설정을 잠가
+    쿼리에서 임의 파일을 읽거나 쓰지 못하게 합니다 (duckdb>=1.2).
+    sqlite 확장을 설치할 수 없으면(오프라인) 생성자가 duckdb.Error를 던지고, db_manager가 SQLite로 대체합니다.
+    """
+
+    def __init__(self, db_path: str | None = None, parquet_dir: str | None = None):
+        self.duckdb = _import_duckdb()
+        self.db_path = db_path
+        self.parquet_dir = parquet_dir
+        self._lock = threading.Lock()
+        self._conn = self.duckdb.connect(":memory:")
+        self._attached = False
+        self._tables = self._register_sources()
+        # 등록한 데이터 소스 외의 파일 접근 차단 (read_csv('/etc/passwd') 등)
+        if self.parquet_dir:
+            directory = os.path.abspath(self.parquet_dir) + os.sep
+            self._conn.execute(f"SET allowed_directories = [{_sql_string(directory)}]")
+        if self._attached:
+            self._conn.execute(f"SET allowed_paths = [{_sql_string(os.path.abspath(self.db_path))}]")
+        self._conn.execute("SET enable_external_access = false")
+        self._conn.execute("SET lock_configuration = true")
+
+    def _register_sources(self) -> list[str]:
+        tables: dict[str, str] = {}
+        if self.parquet_dir and os.path.isdir(self.parquet_dir):
+            for path in sorted(Path(self.parquet_dir).glob("*.parquet")):
+                tables[path.stem] = f"SELECT * FROM read_parquet({_sql_string(str(path.resolve()))})"
+
+        # Parquet으로 모두 export된 경우 sqlite 확장(최초 설치 시 네트워크 필요) 없이 동작
+        if self.db_path and os.path.exists(self.db_path):
+            missing = [name for name in self._sqlite_table_names() if name not in tables]
+            if missing:
+                _load_sqlite_extension(self._conn)
+                self._conn.execute(
+                    f"ATTACH {_sql_string(self.db_path)} AS {SQLITE_CATALOG} (TYPE sqlite, READ_ONLY)"
+                )
+                self._attached = True
+                for name in missing:
+                    tables[name] = f"SELECT * FROM {SQLITE_CATALOG}.{_quote(name)}"
+
+        for name, select_sql in tables.items():
+            self._conn.execute(f"CREATE VIEW {_quote(name)} AS {select_sql}")
+        return sorted(tables)
+
+    def _sqlite_table_names(self) -> list[str]:
+        conn = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            return [
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+                )
+            ]
+        finally:
+            conn.close()
+
+    def schema_info(self) -> list[dict]:
+        """db_manager.get_schema_info()와 같은 형식의 테이블 구조 정보.
+
+        외래키는 DuckDB 카탈로그에 없으므로 SQLite 파일이 있으면 그 정보를 사용합니다.
+        """
+        foreign_keys = {}
+        if self.db_path and os.path.exists(self.db_path):
+            conn = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True)
+            try:
+                foreign_keys = {
+                    t["name"]: t["foreign_keys"] for t in db_manager._introspect_schema(conn.cursor())
+                }
+            finally:
+                conn.close()
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT table_name, column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = 'main' ORDER BY table_name, ordinal_position"
+            ).fetchall()
+
+        columns: dict[str, list] = {}
+        for table, column, data_type in rows:
+            columns.setdefault(table, []).append([column, data_type])
+        return [
+            {"name": name, "columns": columns.get(name, []), "foreign_keys": foreign_keys.get(name, [])}
+            for name in self._tables
+        ]
+
+    def _check_statement(self, sql: str) -> str | None:
+        """DuckDB 파서로 단일 SELECT 문인지 확인 (SQLite authorizer 역할)."""
+        error = db_manager.validate_sql(sql)
+        if error:
+            return error
+        with self._lock:
+            statements = self._conn.extract_statements(sql)
+        if len(statements) != 1:
+            return "[오류] 한 번에 하나의 SELECT 문만 실행할 수 있습니다."
+        if statements[0].type != self.duckdb.StatementType.SELECT:
+            return "[오류] 읽기 전용 대시보드입니다. SELECT 쿼리만 사용 가능합니다."
+        return None
+
+    def execute(self, sql: str, page: int = 1, fallback_ok: bool = False) -> str | None:
+        """SELECT 쿼리를 실행하고 결과 한 페이지를 db_manager와 같은 형식으로 반환.
+
+        QUERY_TIMEOUT_SEC이 지나면 interrupt()로 중단합니다.
+        fallback_ok=True이면 DuckDB 오류(SQLite 전용 함수 등) 시 None을 반환해
+        호출자가 SQLite로 다시 실행할 수 있게 합니다.
+        """
+        try:
+            error = self._check_statement(sql)
+        except self.duckdb.Error as e:
+            return None if fallback_ok else f"[SQL 오류] {e}"
+        if error:
+            return error
+
+        offset = (page - 1) * db_manager.PAGE_SIZE
+        with self._lock:
+            cursor = self._conn.cursor()
+        # DuckDB는 ORDER BY가 없으면 실행마다 행 순서가 달라질 수 있어(병렬 스캔/집계)
+        # 페이지를 다시 실행할 때 행이 반복되거나 빠지므로, 모든 컬럼으로 정렬해 순서를 고정
+        columns = None
+        if not _ORDER_BY_RE.search(_LITERAL_OR_COMMENT_RE.sub(" ", sql)):
+            try:
+                columns = cursor.sql(_statement_body(sql)).columns
+            except self.duckdb.Error as e:
+                cursor.close()
+                return None if fallback_ok else f"[SQL 오류] {e}"
+            sql = f"SELECT * FROM (\n{_statement_body(sql)}\n) ORDER BY ALL"
+        timed_out = threading.Event()
+
+        def interrupt():
+            timed_out.set()
+            cursor.interrupt()
+
+        timer = threading.Timer(db_manager.QUERY_TIMEOUT_SEC, interrupt)
+        timer.start()
+        try:
+            result = db_manager._fetch_page(cursor, sql, offset, columns)
+        except Exception as e:
+            if timed_out.is_set():
+                return (
+                    f"[실행 중단] 쿼리가 실행 시간 {db_manager.QUERY_TIMEOUT_SEC:g}초 제한을 "
+                    "초과했습니다 (DuckDB). 집계/LIMIT 조건으로 쿼리를 다시 작성하세요."
+                )
+            return None if fallback_ok else f"[SQL 오류] {e}"
+        finally:
+            timer.cancel()
+            cursor.close()
+
+        note = "\n\n(DuckDB 분석 엔진으로 실행)" if db_manager.BACKEND == "auto" else ""
+        return db_manager.render_page(result, page, note)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def export_parquet(db_path: str, out_dir: str) -> list[str]:
+    """SQLite 테이블을 <table>.parquet로 export (DuckDB 백엔드의 PARQUET_DIR로 사용)."""
+    duckdb = _import_duckdb()
+    os.makedirs(out_dir, exist_ok=True)
+    conn = duckdb.connect(":memory:")
+    try:
+        _load_sqlite_extension(conn)
+        conn.execute(f"ATTACH {_sql_string(db_path)} AS {SQLITE_CATALOG} (TYPE sqlite, READ_ONLY)")
+        names = [
+            name
+            for (name,) in conn.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_catalog = ?",
+                [SQLITE_CATALOG],
+            ).fetchall()
+            if not name.startswith("sqlite_")
+        ]
+        paths = []
+        for name in names:
+            path = os.path.join(out_dir, f"{name}.parquet")
+            conn.execute(
+                f"COPY (SELECT * FROM {SQLITE_CATALOG}.{_quote(name)}) "
+                f"TO {_sql_string(path)} (FORMAT parquet)"
+            )
+            paths.append(path)
+        return paths
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DuckDB 백엔드 유틸리티")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="SQLite 테이블을 Parquet로 export")
+    export.add_argument("--db", default=db_manager.DB_PATH, help="SQLite DB 경로")
+    export.add_argument(
+        "--out",
+        default=os.path.join(os.path.dirname(__file__), "data", "parquet"),
+        help="출력 디렉터리",
+    )
+    args = parser.parse_args()
+
+    try:
+        paths = export_parquet(args.db, args.out)
+    except ImportError as e:
+        print(f"[오류] {e}")
+        sys.exit(1)
+    for path in paths:
+        print(f"export 완료: {path}")
+    print(f"\n사용법: MLOPS_DB_BACKEND=duckdb MLOPS_PARQUET_DIR={args.out} python3 mlops_dashboard/main.py")
+
+
+if __name__ == "__main__":
+    main()
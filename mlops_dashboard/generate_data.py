@@ -0,0 +1,306 @@
+"""벤치마크용 대규모 합성 데이터 생성기.
+
+setup_db.create_sample_db()는 수십 행의 고정 데이터만 넣기 때문에 대시보드 경로
+(스키마 조회, 쿼리 계획 점검, 결과 스트리밍)를 실제 규모에서 검증할 수 없습니다.
+--scale 배수만큼 사용자/프로젝트/데이터셋/파이프라인/아티팩트/모델/메트릭을 생성합니다.
+
+  scale 1    → 파이프라인 1,000개, 아티팩트 약 3,800개
+  scale 1000 → 파이프라인 100만 개, 아티팩트 약 380만 개
+
+빌드 속도를 위해:
+  - 행은 제너레이터로 만들어 CHUNK_ROWS 단위로 executemany (메모리 사용량 일정)
+  - 청크마다 커밋하는 트랜잭션 단위 삽입
+  - 빌드 중에는 journal_mode=OFF / synchronous=OFF (실패하면 파일을 다시 생성하면 되므로)
+
+사용법:
+    python3 mlops_dashboard/generate_data.py --scale 100
+    python3 mlops_dashboard/generate_data.py --scale 1000 --output /tmp/mlops_1000.db --maintain
+"""
+
+import argparse
+import math
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mlops_dashboard.setup_db import create_tables
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "data", "bench.db")
+
+# executemany 한 번에 넣을 행 수 (청크마다 커밋)
+CHUNK_ROWS = 50_000
+
+TABLES = ["users", "projects", "datasets", "pipelines", "artifacts", "models", "metrics"]
+
+# scale 1당 생성 개수
+PER_SCALE = {"users": 20, "projects": 50, "datasets": 200, "pipelines": 1000}
+
+TEAMS = ["ML Platform", "Vision AI", "NLP", "Data Platform", "Recommendation"]
+ROLES = [("ML Engineer", 5), ("MLOps Engineer", 2), ("Data Scientist", 3), ("Research Scientist", 1)]
+
+# task_type → (가중치, 프레임워크 후보, [(아키텍처, 파라미터 수(M))], 데이터셋 포맷)
+TASKS = {
+    "object_detection": (
+        30,
+        ["ultralytics", "PyTorch", "MMDetection"],
+        [("YOLOv8m", 25.9), ("YOLOv8l", 43.7), ("YOLOv5l", 46.5), ("RT-DETR-L", 32.0)],
+        ["COCO", "YOLO"],
+    ),
+    "image_classification": (
+        20,
+        ["PyTorch", "timm"],
+        [("ResNet-50", 25.6), ("EfficientNet-B3", 12.0), ("ViT-B/16", 86.6)],
+        ["ImageFolder", "WebDataset"],
+    ),
+    "text_classification": (
+        15,
+        ["HuggingFace"],
+        [("KoBERT", 110.0), ("KoELECTRA", 110.0), ("RoBERTa-base", 125.0)],
+        ["CSV", "JSON"],
+    ),
+    "anomaly_detection": (
+        15,
+        ["scikit-learn", "PyTorch"],
+        [("IsolationForest", 0.5), ("LSTM-AE", 2.1), ("PatchCore", 68.0)],
+        ["Parquet", "JSON"],
+    ),
+    "ocr": (
+        10,
+        ["PaddleOCR"],
+        [("PP-OCRv4", 14.8), ("TrOCR-base", 334.0)],
+        ["COCO", "LMDB"],
+    ),
+    "segmentation": (
+        10,
+        ["PyTorch", "MMSegmentation"],
+        [("SegFormer-B2", 27.5), ("Mask2Former", 44.0)],
+        ["COCO", "Cityscapes"],
+    ),
+}
+
+PIPELINE_STATUS = [("completed", 78), ("failed", 12), ("running", 4), ("pending", 6)]
+GPU_TYPES = [("A100", 45), ("V100", 30), ("H100", 15), ("L4", 10)]
+MODEL_STAGES = [("development", 45), ("staging", 20), ("production", 10), ("archived", 25)]
+# 완료된 파이프라인 중 모델로 등록되는 비율
+MODEL_REGISTER_RATE = 0.6
+
+START_DATE = datetime(2023, 1, 1)
+DATE_RANGE_DAYS = 730
+
+
+def _weighted(rng: random.Random, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def _skewed_id(rng: random.Random, n: int) -> int:
+    """작은 id 쪽으로 치우친 1..n (일부 사용자/프로젝트에 실험이 몰리는 분포)."""
+    return int(n * rng.random() ** 2) + 1
+
+
+def _users(rng: random.Random, n: int):
+    for i in range(1, n + 1):
+        yield (
+            i,
+            f"user{i:05d}",
+            f"user{i:05d}@company.com",
+            TEAMS[i % len(TEAMS)],
+            _weighted(rng, ROLES),
+        )
+
+
+def _projects(rng: random.Random, n: int, n_users: int, project_tasks: list):
+    task_choices = [(task, spec[0]) for task, spec in TASKS.items()]
+    for i in range(1, n + 1):
+        task = _weighted(rng, task_choices)
+        project_tasks.append(task)
+        created = START_DATE + timedelta(days=rng.randrange(DATE_RANGE_DAYS))
+        yield (
+            i,
+            _skewed_id(rng, n_users),
+            f"{task.replace('_', '-')}-{i:05d}",
+            f"{task} 프로젝트 {i}",
+            task,
+            created.strftime("%Y-%m-%d"),
+            "completed" if rng.random() < 0.3 else "active",
+        )
+
+
+def _datasets(rng: random.Random, n: int, project_tasks: list, dataset_projects: list):
+    for i in range(1, n + 1):
+        project_id = _skewed_id(rng, len(project_tasks))
+        dataset_projects.append(project_id)
+        task = project_tasks[project_id - 1]
+        num_samples = int(rng.lognormvariate(9.5, 1.2))
+        yield (
+            i,
+            project_id,
+            f"dataset-{i:06d}-{rng.choice(['train', 'val', 'test'])}",
+            rng.choice(TASKS[task][3]),
+            num_samples,
+            round(num_samples * rng.uniform(0.01, 0.8), 1),
+            (START_DATE + timedelta(days=rng.randrange(DATE_RANGE_DAYS))).strftime("%Y-%m-%d"),
+        )
+
+
+def _pipeline_rows(rng: random.Random, n: int, project_tasks: list, dataset_projects: list):
+    """파이프라인과 그에 딸린 아티팩트/모델/메트릭 행을 (테이블, 행) 형태로 생성."""
+    artifact_id = model_id = 0
+    model_versions: dict[str, int] = {}
+    for i in range(1, n + 1):
+        dataset_id = _skewed_id(rng, len(dataset_projects))
+        task = project_tasks[dataset_projects[dataset_id - 1] - 1]
+        _, frameworks, architectures, _ = TASKS[task]
+        framework = rng.choice(frameworks)
+        gpu_type = None if framework == "scikit-learn" else _weighted(rng, GPU_TYPES)
+        status = _weighted(rng, PIPELINE_STATUS)
+        name = f"{task.replace('_', '-')}-exp{i:07d}"
+
+        started = START_DATE + timedelta(seconds=rng.randrange(DATE_RANGE_DAYS * 86400))
+        # 학습 시간: 로그정규 분포 (중앙값 약 4.5시간), 실패는 초반에 종료
+        hours = rng.lognormvariate(1.5, 1.0) * (0.2 if status == "failed" else 1.0)
+        finished = started + timedelta(hours=hours)
+        started_at = None if status == "pending" else started.strftime("%Y-%m-%d %H:%M:%S")
+        finished_at = finished.strftime("%Y-%m-%d %H:%M:%S") if status in ("completed", "failed") else None
+        yield "pipelines", (i, dataset_id, name, framework, gpu_type, status, started_at, finished_at)
+
+        architecture, params_m = rng.choice(architectures)
+        base_path = f"/artifacts/{name}"
+        artifacts = []
+        if status in ("completed", "running"):
+            n_ckpt = min(int(rng.expovariate(0.5)) + (1 if status == "completed" else 0), 10)
+            artifacts += [
+                ("checkpoint", f"{base_path}/epoch{(k + 1) * 10}.pt", params_m * 4 * rng.uniform(0.9, 1.1))
+                for k in range(n_ckpt)
+            ]
+        if status != "pending":
+            log_name = "error.log" if status == "failed" else "train.log"
+            artifacts.append(("log", f"{base_path}/{log_name}", rng.lognormvariate(0.5, 1.0)))
+        artifacts.append(("config", f"{base_path}/config.yaml", 0.01))
+        for a_type, path, size_mb in artifacts:
+            artifact_id += 1
+            yield "artifacts", (artifact_id, i, a_type, path, round(size_mb, 2), finished_at or started_at or "2023-01-01 00:00:00")
+
+        if status != "completed" or rng.random() > MODEL_REGISTER_RATE:
+            continue
+
+        model_id += 1
+        model_name = f"{task.replace('_', '-')}-{architecture.lower()}-{dataset_projects[dataset_id - 1]}"
+        model_versions[model_name] = model_versions.get(model_name, 0) + 1
+        registered = finished.strftime("%Y-%m-%d")
+        yield "models", (
+            model_id, i, model_name, f"v{model_versions[model_name]}.0", architecture,
+            params_m, registered, _weighted(rng, MODEL_STAGES),
+        )
+
+        precision = rng.betavariate(18, 3)
+        recall = rng.betavariate(18, 3)
+        yield "metrics", (
+            model_id,
+            model_id,
+            round(rng.betavariate(20, 4), 3) if task == "object_detection" else None,
+            round(2 * precision * recall / (precision + recall), 3),
+            round(precision, 3),
+            round(recall, 3),
+            round(rng.lognormvariate(math.log(params_m + 1) + 1, 0.4), 1),
+            rng.choice([0.25, 0.3, 0.4, 0.5]),
+            None,
+            registered,
+        )
+
+
+class _ChunkWriter:
+    """테이블별 버퍼를 CHUNK_ROWS 단위로 executemany하고 커밋."""
+
+    def __init__(self, conn: sqlite3.Connection, chunk_rows: int = CHUNK_ROWS):
+        self.conn = conn
+        self.chunk_rows = chunk_rows
+        self.buffers: dict[str, list[tuple]] = {}
+        self.counts: dict[str, int] = dict.fromkeys(TABLES, 0)
+
+    def add(self, table: str, row: tuple):
+        buffer = self.buffers.setdefault(table, [])
+        buffer.append(row)
+        if len(buffer) >= self.chunk_rows:
+            self.flush(table)
+
+    def flush(self, table: str | None = None):
+        tables = [table] if table else list(self.buffers)
+        with self.conn:
+            for name in tables:
+                rows = self.buffers.get(name)
+                if not rows:
+                    continue
+                placeholders = ",".join("?" * len(rows[0]))
+                self.conn.executemany(f"INSERT INTO {name} VALUES ({placeholders})", rows)
+                self.counts[name] += len(rows)
+                rows.clear()
+
+
+def generate(output: str = DEFAULT_OUTPUT, scale: float = 1, seed: int = 42) -> dict[str, int]:
+    """scale 배수의 합성 데이터로 DB를 새로 생성. {테이블: 행 수} 반환."""
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    if os.path.exists(output):
+        os.remove(output)
+
+    rng = random.Random(seed)
+    sizes = {table: max(int(n * scale), 1) for table, n in PER_SCALE.items()}
+
+    conn = sqlite3.connect(output)
+    # 빌드 전용 설정: 롤백 저널/fsync 없이 기록 (중간에 실패하면 다시 생성)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-262144")
+    create_tables(conn.cursor())
+
+    writer = _ChunkWriter(conn)
+    project_tasks: list[str] = []
+    dataset_projects: list[int] = []
+    for row in _users(rng, sizes["users"]):
+        writer.add("users", row)
+    for row in _projects(rng, sizes["projects"], sizes["users"], project_tasks):
+        writer.add("projects", row)
+    for row in _datasets(rng, sizes["datasets"], project_tasks, dataset_projects):
+        writer.add("datasets", row)
+    for table, row in _pipeline_rows(rng, sizes["pipelines"], project_tasks, dataset_projects):
+        writer.add(table, row)
+    writer.flush()
+    conn.close()
+    return writer.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MLOps Dashboard 벤치마크용 합성 데이터 생성")
+    parser.add_argument("--scale", type=float, default=1, help="생성 배수 (1 = 파이프라인 1,000개)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"출력 DB 경로 (기본: {DEFAULT_OUTPUT})")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument(
+        "--maintain", action="store_true", help="생성 후 maintenance.py의 인덱스/요약 테이블도 생성"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = generate(args.output, args.scale, args.seed)
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"합성 DB 생성 완료: {args.output} ({elapsed:.1f}초, {total / elapsed:,.0f}행/초)")
+    for table, count in counts.items():
+        print(f"  - {table}: {count:,}행")
+
+    if args.maintain:
+        from mlops_dashboard import db_manager, maintenance
+
+        db_manager.DB_PATH = args.output
+        started = time.perf_counter()
+        maintenance.run_maintenance()
+        print(f"인덱스/요약 테이블 생성 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
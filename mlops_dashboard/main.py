@@ -3,6 +3,7 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from mlops_dashboard import db_manager
 from mlops_dashboard.db_manager import DB_PATH
 from mlops_dashboard.setup_db import create_sample_db
 from mlops_dashboard.sql_agent import SQLAgent
@@ -10,17 +11,22 @@ from mlops_dashboard.sql_agent import SQLAgent
 
 def main():
     usage_enabled = "--usage" in sys.argv
+    use_cache = "--no-cache" not in sys.argv
 
     if not os.path.exists(DB_PATH):
         print("샘플 DB가 없습니다. 생성합니다...")
         create_sample_db()
 
     print(f"DB 연결 완료 ({DB_PATH})")
+    if db_manager.BACKEND == "duckdb" and not db_manager.duckdb_active():
+        print(f"[경고] DuckDB 백엔드를 사용할 수 없어 SQLite로 실행합니다: {db_manager.duckdb_error()}")
+    elif db_manager.BACKEND != "sqlite":
+        print(f"쿼리 엔진: {db_manager.BACKEND} (DuckDB 분석 백엔드)")
     if usage_enabled:
         print("📊 사용량 추적 활성화 (비용은 추정치이며, 정확한 차감량은 console.upstage.ai/billing 에서 확인하세요)")
     print("질문을 입력하세요 (quit 또는 exit로 종료)\n")
 
-    agent = SQLAgent(usage_enabled=usage_enabled)
+    agent = SQLAgent(usage_enabled=usage_enabled, use_cache=use_cache)
 
     while True:
         try:
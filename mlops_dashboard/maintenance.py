@@ -0,0 +1,211 @@
+"""DB 유지보수: 외래키 인덱스 생성과 요약 테이블 갱신.
+
+대시보드 질문 대부분은 projects → datasets → pipelines → models → metrics를
+매번 조인하는데, 샘플 스키마에는 PK 외의 인덱스가 없어 조인마다 전체 스캔이 발생합니다.
+
+  1. 외래키 컬럼(user_id, project_id, dataset_id, pipeline_id, model_id)에
+     자주 함께 조회하는 컬럼을 붙인 covering 인덱스 생성
+  2. 자주 묻는 집계(스테이지별 최신 메트릭, 프로젝트별 GPU 사용 시간)를
+     요약 테이블로 미리 계산 (다시 실행하면 최신 데이터로 갱신)
+  3. ANALYZE로 쿼리 플래너 통계 갱신
+
+사용법:
+    python3 mlops_dashboard/maintenance.py            # 인덱스 + 요약 테이블 갱신
+    python3 mlops_dashboard/maintenance.py --refresh  # 요약 테이블만 갱신
+
+요약 테이블이 있으면 SQLAgent가 시스템 프롬프트에서 해당 테이블을 우선 사용하도록 안내합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mlops_dashboard import db_manager
+
+# (인덱스 이름, 테이블, 컬럼) — 외래키를 앞에 두고 자주 함께 조회하는 컬럼을 붙여 covering 인덱스로 사용
+INDEXES = [
+    ("idx_projects_user", "projects", ["user_id", "status", "task_type"]),
+    ("idx_datasets_project", "datasets", ["project_id", "num_samples", "size_mb"]),
+    ("idx_pipelines_dataset", "pipelines", ["dataset_id", "status", "gpu_type"]),
+    ("idx_artifacts_pipeline", "artifacts", ["pipeline_id", "type", "size_mb"]),
+    ("idx_models_pipeline_stage", "models", ["pipeline_id", "stage"]),
+    ("idx_models_stage", "models", ["stage", "registered_at"]),
+    ("idx_metrics_model", "metrics", ["model_id", "evaluated_at"]),
+]
+
+# 요약 테이블: 이름 → (설명, CREATE TABLE 컬럼 정의, 채우는 SELECT)
+SUMMARY_TABLES = {
+    "model_stage_latest_metrics": (
+        "모델 이름·스테이지별 가장 최근 등록된 버전의 메트릭 (프로젝트 이름 포함). "
+        "스테이지별 모델 성능/최신 모델 질문에 사용",
+        """
+            model_id INTEGER PRIMARY KEY,
+            model_name TEXT NOT NULL,
+            version TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            architecture TEXT NOT NULL,
+            project_name TEXT NOT NULL,
+            registered_at DATE NOT NULL,
+            map50 REAL,
+            f1_score REAL,
+            precision_val REAL,
+            recall REAL,
+            inference_ms REAL,
+            confidence_threshold REAL,
+            evaluated_at DATE
+        """,
+        """
+            SELECT model_id, model_name, version, stage, architecture, project_name,
+                   registered_at, map50, f1_score, precision_val, recall, inference_ms,
+                   confidence_threshold, evaluated_at
+            FROM (
+                SELECT m.id AS model_id, m.name AS model_name, m.version, m.stage,
+                       m.architecture, pr.name AS project_name, m.registered_at,
+                       x.map50, x.f1_score, x.precision_val, x.recall, x.inference_ms,
+                       x.confidence_threshold, x.evaluated_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY m.name, m.stage
+                           ORDER BY m.registered_at DESC, m.id DESC
+                       ) AS rn
+                FROM models m
+                JOIN pipelines p ON p.id = m.pipeline_id
+                JOIN datasets d ON d.id = p.dataset_id
+                JOIN projects pr ON pr.id = d.project_id
+                LEFT JOIN metrics x ON x.model_id = m.id
+            )
+            WHERE rn = 1
+        """,
+    ),
+    "project_gpu_hours": (
+        "프로젝트·GPU 타입별 파이프라인 수와 GPU 사용 시간(시간 단위, 종료된 파이프라인 기준). "
+        "GPU 사용량/학습 시간 질문에 사용",
+        """
+            project_id INTEGER NOT NULL,
+            project_name TEXT NOT NULL,
+            gpu_type TEXT NOT NULL,
+            pipeline_count INTEGER NOT NULL,
+            failed_count INTEGER NOT NULL,
+            gpu_hours REAL NOT NULL,
+            PRIMARY KEY (project_id, gpu_type)
+        """,
+        """
+            SELECT pr.id, pr.name, p.gpu_type,
+                   COUNT(*),
+                   SUM(p.status = 'failed'),
+                   ROUND(COALESCE(SUM(
+                       (julianday(p.finished_at) - julianday(p.started_at)) * 24
+                   ), 0), 2)
+            FROM pipelines p
+            JOIN datasets d ON d.id = p.dataset_id
+            JOIN projects pr ON pr.id = d.project_id
+            WHERE p.gpu_type IS NOT NULL
+            GROUP BY pr.id, p.gpu_type
+        """,
+    ),
+}
+
+# 요약 테이블 갱신 기록
+REFRESH_LOG_TABLE = "summary_refresh_log"
+
+
+def create_indexes(conn) -> list[str]:
+    """INDEXES를 생성 (이미 있으면 건너뜀). 새로 만든 인덱스 이름 목록 반환."""
+    existing = {
+        name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    created = []
+    for name, table, columns in INDEXES:
+        if name in existing:
+            continue
+        conn.execute(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+        created.append(name)
+    return created
+
+
+def refresh_summaries(conn) -> dict[str, int]:
+    """요약 테이블을 다시 계산. {테이블 이름: 행 수} 반환 (트랜잭션은 호출한 쪽에서 관리)."""
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {REFRESH_LOG_TABLE} ("
+        "table_name TEXT PRIMARY KEY, refreshed_at DATETIME NOT NULL, row_count INTEGER NOT NULL)"
+    )
+    refreshed_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    counts = {}
+    for name, (_, columns, select_sql) in SUMMARY_TABLES.items():
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {name} ({columns})")
+        conn.execute(f"DELETE FROM {name}")
+        conn.execute(f"INSERT INTO {name} {select_sql}")
+        counts[name] = conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+        conn.execute(
+            f"INSERT OR REPLACE INTO {REFRESH_LOG_TABLE} VALUES (?, ?, ?)",
+            (name, refreshed_at, counts[name]),
+        )
+    return counts
+
+
+def run_maintenance(refresh_only: bool = False) -> dict:
+    """인덱스 생성과 요약 테이블 갱신을 한 트랜잭션으로 실행한 뒤 ANALYZE.
+
+    sqlite3 기본(legacy) 모드는 DML 앞에서만 암묵적으로 BEGIN하므로 그 전의 DDL은 각각 자동 커밋됩니다.
+    autocommit 모드(isolation_level=None)로 열고 BEGIN/COMMIT을 직접 실행해 DDL까지 함께 롤백되도록 합니다.
+    """
+    conn = db_manager.get_connection()
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN")
+        try:
+            created = [] if refresh_only else create_indexes(conn)
+            counts = refresh_summaries(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return {"indexes": created, "summaries": counts}
+
+
+def summary_hint(table_names) -> str:
+    """존재하는 요약 테이블에 대한 시스템 프롬프트 안내문 (없으면 빈 문자열)."""
+    table_names = set(table_names)
+    available = [name for name in SUMMARY_TABLES if name in table_names]
+    if not available:
+        return ""
+
+    refreshed = {}
+    if REFRESH_LOG_TABLE in table_names:
+        with db_manager.get_pool().connection() as conn:
+            refreshed = dict(
+                conn.execute(f"SELECT table_name, refreshed_at FROM {REFRESH_LOG_TABLE}")
+            )
+
+    lines = ["\n\n요약 테이블 (미리 계산된 집계 — 질문에 맞으면 원본 테이블 조인 대신 우선 사용):"]
+    for name in available:
+        description = SUMMARY_TABLES[name][0]
+        when = f" [갱신: {refreshed[name]}]" if name in refreshed else ""
+        lines.append(f"- {name}: {description}{when}")
+    lines.append("- 요약 테이블은 갱신 시점 기준이므로, 실시간 상태(running 파이프라인 등)는 원본 테이블을 조회하세요.")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MLOps Dashboard DB 유지보수 (인덱스/요약 테이블)")
+    parser.add_argument("--refresh", action="store_true", help="요약 테이블만 갱신")
+    args = parser.parse_args()
+
+    if not os.path.exists(db_manager.DB_PATH):
+        print(f"[오류] DB가 없습니다: {db_manager.DB_PATH}")
+        sys.exit(1)
+
+    result = run_maintenance(refresh_only=args.refresh)
+    if not args.refresh:
+        print(f"인덱스 생성: {', '.join(result['indexes']) or '(모두 존재)'}")
+    for name, count in result["summaries"].items():
+        print(f"요약 테이블 갱신: {name} ({count}행)")
+
+
+if __name__ == "__main__":
+    main()
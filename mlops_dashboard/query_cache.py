@@ -0,0 +1,137 @@
+"""질문 → SQL/응답 캐시 (NL→SQL 캐시).
+
+대시보드 사용자는 "프로덕션 모델은?" 같은 질문을 반복해서 묻는데, 매번 SQL 생성과
+결과 설명에 solar-pro3를 2회 이상 호출합니다. 정규화한 질문을 키로 LLM이 실행한 도구 호출과
+최종 응답을 저장해 두고, 같은 질문이 오면 도구 호출만 다시 실행(SQL→결과 캐시 적용)합니다.
+
+  - 결과가 저장 당시와 같으면: LLM 호출 없이 저장된 응답 반환
+  - 데이터가 바뀌었으면: 저장된 SQL을 재사용하고 결과 설명만 LLM에 요청 (SQL 생성 생략)
+
+독립 질문("프로덕션 모델은?")은 세션의 앞선 대화와 관계없이 현재 질문만으로 키를 만들어
+어느 세션에서 다시 물어도 캐시가 적중합니다. 후속 질문("그중 가장 높은 건?")은 앞선 대화에 따라
+의미가 달라지므로, 지시어/접속 표현(FOLLOW_UP_CUES)이 있으면 직전 FOLLOW_UP_TURNS개 질문까지 키에 포함합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "data", "question_cache.json")
+# 저장할 최대 질문 수 (초과 시 오래된 항목부터 삭제)
+MAX_ENTRIES = 500
+# 후속 질문의 키에 함께 넣을 직전 질문 수
+FOLLOW_UP_TURNS = 2
+# 후속 질문 표지 (normalize_question 결과에서 찾으므로 공백 없이 적음)
+FOLLOW_UP_CUES = (
+    "그중", "이중", "그것", "그거", "그걸", "거기", "그럼", "그러면", "그다음", "그모델", "그실험",
+    "이모델", "이실험", "위의", "위결과", "방금", "아까", "앞의", "앞에서", "나머지", "이들", "그들",
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# 영어 후속 질문 표지 (단어 단위)
+_FOLLOW_UP_EN_RE = re.compile(r"\b(?:those|these|them|it|its|same|previous)\b|^(?:and|what about|how about)\b")
+
+
+def normalize_question(question: str) -> str:
+    """대소문자/전각·반각/공백 차이만 무시하도록 정규화.
+
+    띄어쓰기 오류가 잦은 한국어 질문("프로덕션모델 목록" / "프로덕션 모델 목록")도
+    같은 키가 되도록 공백을 모두 제거합니다. 비교 연산자, '!', 소수점, 숫자는
+    질문의 의미(= 생성될 SQL)를 바꾸므로 그대로 둡니다.
+
+    >>> normalize_question("프로덕션모델 목록") == normalize_question("프로덕션  모델 목록")
+    True
+    >>> normalize_question("ＦＩ Score") == normalize_question("fi score")
+    True
+    >>> normalize_question("stage != production") == normalize_question("stage = production")
+    False
+    >>> normalize_question("f1 >= 0.9") == normalize_question("f1 <= 0.9")
+    False
+    >>> normalize_question("f1 1.5 이상") == normalize_question("f1 15 이상")
+    False
+    """
+    text = unicodedata.normalize("NFKC", question).lower()
+    return _WHITESPACE_RE.sub("", text)
+
+
+def is_follow_up(question: str) -> bool:
+    """앞선 대화 없이는 의미가 정해지지 않는 후속 질문인지 판단.
+
+    >>> is_follow_up("그중 f1이 가장 높은 건?")
+    True
+    >>> is_follow_up("What about the staging ones?")
+    True
+    >>> is_follow_up("프로덕션 모델 목록")
+    False
+    """
+    text = unicodedata.normalize("NFKC", question).lower().strip()
+    if _FOLLOW_UP_EN_RE.search(text):
+        return True
+    compact = _WHITESPACE_RE.sub("", text)
+    return any(cue in compact for cue in FOLLOW_UP_CUES)
+
+
+def digest(texts: list[str]) -> str:
+    """도구 결과 목록의 해시 (저장 당시 결과와 같은지 비교용)."""
+    h = hashlib.sha256()
+    for text in texts:
+        h.update(text.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class QuestionCache:
+    """(모델, 시스템 프롬프트, 질문(후속 질문이면 직전 질문 포함)) → 도구 호출/결과 해시/응답 캐시.
+
+    저장 구조 (data/question_cache.json):
+        {"<key>": {"question": str,
+                   "tool_calls": [{"name": str, "arguments": str}, ...],
+                   "digest": str, "answer": str}, ...}
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def key(model: str, system_prompt: str, questions: list[str]) -> str:
+        """세션 질문 목록(마지막이 현재 질문)의 캐시 키.
+
+        독립 질문은 현재 질문만, 후속 질문은 직전 FOLLOW_UP_TURNS개 질문까지 포함합니다.
+        """
+        context = questions[-(FOLLOW_UP_TURNS + 1) :] if is_follow_up(questions[-1]) else questions[-1:]
+        payload = json.dumps(
+            [model, system_prompt, [normalize_question(q) for q in context]],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        return self._data.get(key)
+
+    def put(self, key: str, entry: dict):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = entry
+            while len(self._data) > self.max_entries:
+                del self._data[next(iter(self._data))]
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass  # 캐시 저장 실패는 무시
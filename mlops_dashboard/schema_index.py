@@ -0,0 +1,142 @@
+"""질문 관련 테이블 검색 (스키마 pruning).
+
+전체 스키마를 시스템 프롬프트에 넣으면 테이블 수에 비례해 매 턴 프롬프트 토큰이 늘어납니다.
+테이블/컬럼 이름과 설명을 BM25로 색인해 질문마다 상위 k개 테이블과
+그 외래키 이웃 테이블만 골라, 스키마가 커져도 프롬프트 크기를 일정하게 유지합니다.
+
+한국어 질문은 조사가 붙어 단어 단위로 매칭되지 않으므로("프로젝트의"),
+한글 토큰은 글자 bigram으로 나눠 색인합니다.
+"""
+
+import math
+import re
+
+# 테이블 설명 (한국어 질문과 매칭되도록 한글 동의어 포함)
+TABLE_DESCRIPTIONS = {
+    "users": "사용자 담당자 엔지니어 이름 이메일 팀 역할 user",
+    "projects": "프로젝트 과제 태스크 유형 상태 project",
+    "datasets": "데이터셋 데이터 샘플 수 포맷 용량 dataset",
+    "pipelines": "파이프라인 학습 실험 GPU 프레임워크 실행 중 실패 완료 상태 pipeline experiment",
+    "artifacts": "아티팩트 체크포인트 로그 설정 파일 경로 용량 artifact checkpoint log config",
+    "models": "모델 버전 아키텍처 파라미터 스테이지 배포 프로덕션 스테이징 model production",
+    "metrics": "메트릭 평가 지표 성능 정밀도 재현율 오탐 미탐 추론 시간 배포 메모 metric",
+    # maintenance.py가 만드는 요약 테이블
+    "model_stage_latest_metrics": "스테이지별 최신 모델 버전 메트릭 성능 프로덕션 스테이징 요약 latest",
+    "project_gpu_hours": "프로젝트별 GPU 사용 시간 학습 시간 파이프라인 수 요약 hours",
+}
+
+# 컬럼 설명 ("테이블.컬럼": 설명)
+COLUMN_DESCRIPTIONS = {
+    "models.stage": "development staging production archived 라이프사이클 배포 단계",
+    "models.parameters_m": "파라미터 수 백만",
+    "metrics.map50": "mAP 객체 탐지 정확도",
+    "metrics.f1_score": "F1 점수",
+    "metrics.precision_val": "precision 정밀도 오탐",
+    "metrics.recall": "recall 재현율 미탐",
+    "metrics.inference_ms": "추론 시간 밀리초 속도 latency",
+    "metrics.confidence_threshold": "confidence 임계값",
+    "metrics.deploy_note": "배포 의사결정 메모 현장",
+    "pipelines.status": "pending running completed failed 실행 중 실패 완료",
+    "pipelines.gpu_type": "GPU A100 V100 H100",
+    "artifacts.type": "checkpoint log config 체크포인트 로그 설정",
+    "artifacts.file_path": "경로 path",
+}
+
+_WORD_RE = re.compile(r"[0-9A-Za-z_]+|[가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> list[str]:
+    """영문/숫자는 단어(및 '_' 분리 조각) 단위, 한글은 글자 bigram 단위로 토큰화."""
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if _HANGUL_RE.match(word):
+            if len(word) == 1:
+                tokens.append(word)
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+            parts = word.split("_")
+            if len(parts) > 1:
+                tokens.extend(p for p in parts if p)
+            # 복수형 테이블 이름(models ↔ model) 매칭
+            if word.endswith("s") and len(word) > 3:
+                tokens.append(word[:-1])
+    return tokens
+
+
+class SchemaIndex:
+    """테이블 단위 BM25 색인."""
+
+    def __init__(self, tables: list[dict], k1: float = 1.2, b: float = 0.75):
+        self.tables = {t["name"]: t for t in tables}
+        self.k1 = k1
+        self.b = b
+
+        self._docs: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        df: dict[str, int] = {}
+        for t in tables:
+            text = " ".join(
+                [t["name"], TABLE_DESCRIPTIONS.get(t["name"], "")]
+                + [
+                    f"{col} {COLUMN_DESCRIPTIONS.get(t['name'] + '.' + col, '')}"
+                    for col, _ in t["columns"]
+                ]
+            )
+            freqs: dict[str, int] = {}
+            tokens = tokenize(text)
+            for tok in tokens:
+                freqs[tok] = freqs.get(tok, 0) + 1
+            for tok in freqs:
+                df[tok] = df.get(tok, 0) + 1
+            self._docs[t["name"]] = freqs
+            self._lengths[t["name"]] = len(tokens)
+
+        n = max(len(tables), 1)
+        self._avg_len = sum(self._lengths.values()) / n if tables else 1.0
+        self._idf = {tok: math.log(1 + (n - d + 0.5) / (d + 0.5)) for tok, d in df.items()}
+
+        # 외래키 이웃: 참조하는 테이블(outgoing)과 참조받는 테이블(incoming)
+        self._outgoing: dict[str, set[str]] = {name: set() for name in self.tables}
+        self._incoming: dict[str, set[str]] = {name: set() for name in self.tables}
+        for t in tables:
+            for _, ref_table, _ in t["foreign_keys"]:
+                if ref_table in self.tables:
+                    self._outgoing[t["name"]].add(ref_table)
+                    self._incoming[ref_table].add(t["name"])
+
+    def search(self, question: str, top_k: int = 5) -> list[str]:
+        """질문과 관련도가 높은 테이블 이름 상위 top_k개."""
+        query = set(tokenize(question))
+        scored = []
+        for name, freqs in self._docs.items():
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[name] / self._avg_len)
+            score = sum(
+                self._idf[tok] * freqs[tok] * (self.k1 + 1) / (freqs[tok] + norm)
+                for tok in query
+                if tok in freqs
+            )
+            if score > 0:
+                scored.append((score, name))
+        scored.sort(reverse=True)
+        return [name for _, name in scored[:top_k]]
+
+    def expand(self, names: list[str], max_tables: int = 15) -> list[str]:
+        """선택된 테이블에 외래키 이웃 테이블을 추가 (JOIN 경로 확보).
+
+        참조하는 테이블을 먼저, 참조받는 테이블을 나중에 추가하고
+        허브 테이블(예: users)의 이웃이 많아도 max_tables개로 제한합니다.
+        """
+        selected = dict.fromkeys(names)
+        for edges in (self._outgoing, self._incoming):
+            for name in names:
+                for neighbor in sorted(edges.get(name, ())):
+                    if len(selected) >= max_tables:
+                        return list(selected)
+                    selected.setdefault(neighbor)
+        return list(selected)
+
+    def relevant_tables(self, question: str, top_k: int = 5) -> list[dict]:
+        """질문에 필요한 테이블 구조 정보 (상위 top_k + 외래키 이웃)."""
+        return [self.tables[name] for name in self.expand(self.search(question, top_k))]
@@ -3,19 +3,9 @@ import os
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "data", "sample.db")
 
-
-def create_sample_db():
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
-
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-
-    # ── 테이블 생성 ──────────────────────────────────────
-
-    cur.execute("""
+# 테이블 생성 DDL (generate_data.py의 대규모 데이터 생성기와 공유)
+TABLE_DDL = [
+    """
         CREATE TABLE users (
             id INTEGER PRIMARY KEY,
             name TEXT NOT NULL,
@@ -23,9 +13,8 @@ def create_sample_db():
             team TEXT NOT NULL,
             role TEXT NOT NULL
         )
-    """)
-
-    cur.execute("""
+    """,
+    """
         CREATE TABLE projects (
             id INTEGER PRIMARY KEY,
             user_id INTEGER NOT NULL,
@@ -36,9 +25,8 @@ def create_sample_db():
             status TEXT NOT NULL DEFAULT 'active',
             FOREIGN KEY (user_id) REFERENCES users(id)
         )
-    """)
-
-    cur.execute("""
+    """,
+    """
         CREATE TABLE datasets (
             id INTEGER PRIMARY KEY,
             project_id INTEGER NOT NULL,
@@ -49,9 +37,8 @@ def create_sample_db():
             created_at DATE NOT NULL,
             FOREIGN KEY (project_id) REFERENCES projects(id)
         )
-    """)
-
-    cur.execute("""
+    """,
+    """
         CREATE TABLE pipelines (
             id INTEGER PRIMARY KEY,
             dataset_id INTEGER NOT NULL,
@@ -63,9 +50,8 @@ def create_sample_db():
             finished_at DATETIME,
             FOREIGN KEY (dataset_id) REFERENCES datasets(id)
         )
-    """)
-
-    cur.execute("""
+    """,
+    """
         CREATE TABLE artifacts (
             id INTEGER PRIMARY KEY,
             pipeline_id INTEGER NOT NULL,
@@ -75,9 +61,8 @@ def create_sample_db():
             created_at DATETIME NOT NULL,
             FOREIGN KEY (pipeline_id) REFERENCES pipelines(id)
         )
-    """)
-
-    cur.execute("""
+    """,
+    """
         CREATE TABLE models (
             id INTEGER PRIMARY KEY,
             pipeline_id INTEGER NOT NULL UNIQUE,
@@ -89,9 +74,8 @@ def create_sample_db():
             stage TEXT NOT NULL DEFAULT 'development',
             FOREIGN KEY (pipeline_id) REFERENCES pipelines(id)
         )
-    """)
-
-    cur.execute("""
+    """,
+    """
         CREATE TABLE metrics (
             id INTEGER PRIMARY KEY,
             model_id INTEGER NOT NULL UNIQUE,
@@ -105,7 +89,25 @@ def create_sample_db():
             evaluated_at DATE NOT NULL,
             FOREIGN KEY (model_id) REFERENCES models(id)
         )
-    """)
+    """,
+]
+
+
+def create_tables(cur):
+    for ddl in TABLE_DDL:
+        cur.execute(ddl)
+
+
+def create_sample_db():
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+
+    conn = sqlite3.connect(DB_PATH)
+    cur = conn.cursor()
+
+    create_tables(cur)
 
     # ── 데이터 삽입 ──────────────────────────────────────
 
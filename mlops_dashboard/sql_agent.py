@@ -1,12 +1,26 @@
 import json
 import sys
 import os
+from collections import deque
+from types import SimpleNamespace
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from common.client import client
 from common.usage import UsageTracker, print_usage
-from mlops_dashboard.db_manager import get_schema, execute_query
+from mlops_dashboard import db_manager
+from mlops_dashboard.db_manager import get_schema_info, render_schema, execute_query
+from mlops_dashboard.schema_index import SchemaIndex
+from mlops_dashboard.query_cache import QuestionCache, digest
+from mlops_dashboard.maintenance import summary_hint
+
+MODEL = "solar-pro3"
+
+# 테이블이 이 수보다 많으면 질문 관련 테이블만 시스템 프롬프트에 포함
+SCHEMA_PRUNE_THRESHOLD = 12
+SCHEMA_TOP_K = 5
+# 직전 N개 질문의 관련 테이블을 후속 질문("그중 ...")을 위해 프롬프트에 유지
+SCHEMA_HISTORY_TURNS = 2
 
 TOOLS = [
     {
@@ -25,7 +39,49 @@ TOOLS = [
                 "required": ["sql"],
             },
         },
-    }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "fetch_sql_page",
+            "description": "execute_sql 결과가 잘렸을 때 같은 쿼리의 다음 페이지를 조회합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "sql": {
+                        "type": "string",
+                        "description": "이전에 실행한 SQL SELECT 쿼리 (동일한 텍스트)",
+                    },
+                    "page": {
+                        "type": "integer",
+                        "description": "조회할 페이지 번호 (2부터)",
+                    },
+                },
+                "required": ["sql", "page"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "describe_tables",
+            "description": "시스템 프롬프트에 없는 테이블의 스키마를 조회합니다. 테이블 이름 또는 키워드로 검색합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "table_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "스키마를 조회할 테이블 이름 목록",
+                    },
+                    "keywords": {
+                        "type": "string",
+                        "description": "관련 테이블을 찾기 위한 키워드 (예: '배포 승인 이력')",
+                    },
+                },
+            },
+        },
+    },
 ]
 
 SYSTEM_PROMPT = """당신은 MLOps 플랫폼의 SQL 전문가입니다. 사용자의 자연어 질문을 SQL 쿼리로 변환하고 실행 결과를 설명합니다.
@@ -67,16 +123,34 @@ SYSTEM_PROMPT = """당신은 MLOps 플랫폼의 SQL 전문가입니다. 사용
 - 메트릭 값은 소수점으로 표시하되, 퍼센트로 변환해서 설명해도 됩니다 (예: 0.923 → 92.3%).
 - precision/recall 관련 질문에는 오탐/미탐 관점에서 실무적으로 설명하세요.
 - 용량은 MB 단위입니다.
+- 결과가 잘리면 [요약]의 전체 행 수와 컬럼 요약을 활용하고, 더 필요하면 집계 쿼리로 범위를 좁히거나 fetch_sql_page로 다음 페이지를 조회하세요.
 """
 
 
-def handle_tool_call(tool_call) -> str:
+def describe_tables(index: SchemaIndex, args: dict) -> str:
+    '''
+    테이블 이름 또는 키워드로 스키마를 조회합니다.
+    '''
+    names = [n for n in args.get("table_names") or [] if n in index.tables]
+    if args.get("keywords"):
+        names += index.search(args["keywords"], SCHEMA_TOP_K)
+    names = list(dict.fromkeys(names))
+    if not names:
+        return "[결과] 일치하는 테이블이 없습니다."
+    return render_schema([index.tables[n] for n in names])
+
+
+def handle_tool_call(tool_call, index: SchemaIndex | None = None) -> str:
     '''
     LLM이 생성한 Tool 호출 정보를 받아 실제 함수(`execute_query`)를 실행합니다.
     '''
+    args = json.loads(tool_call.function.arguments)
     if tool_call.function.name == "execute_sql":
-        args = json.loads(tool_call.function.arguments)
         return execute_query(args["sql"])
+    if tool_call.function.name == "fetch_sql_page":
+        return execute_query(args["sql"], args.get("page", 2))
+    if tool_call.function.name == "describe_tables" and index is not None:
+        return describe_tables(index, args)
     return "[오류] 알 수 없는 도구입니다."
 
 
@@ -84,26 +158,143 @@ class SQLAgent:
     '''
     SQLAgent는 자연어 질문을 SQL로 변환하고, 실행 결과를 설명하는 에이전트입니다.
     '''
-    def __init__(self, usage_enabled: bool = False):
-        schema = get_schema()
+    def __init__(self, usage_enabled: bool = False, use_cache: bool = True):
+        tables = get_schema_info()
+        # 테이블이 많으면 질문마다 관련 테이블만 프롬프트에 포함 (ask에서 갱신)
+        self.index = SchemaIndex(tables) if len(tables) > SCHEMA_PRUNE_THRESHOLD else None
+        self.recent_tables: deque[list[str]] = deque(maxlen=SCHEMA_HISTORY_TURNS)
+        self.tools = TOOLS if self.index is not None else TOOLS[:2]
+        # 요약 테이블(maintenance.py)이 있으면 우선 사용하도록 안내
+        self.summary_hint = summary_hint(t["name"] for t in tables)
+        if db_manager.duckdb_active():
+            self.summary_hint += (
+                "\n\n(쿼리 엔진: DuckDB — julianday 대신 date_diff('hour', a, b), "
+                "strftime(timestamp, format) 등 DuckDB SQL 문법을 사용하세요.)"
+            )
+        schema = render_schema(tables) + self.summary_hint if self.index is None else ""
         self.messages = [
             {"role": "system", "content": SYSTEM_PROMPT.format(schema=schema)}
         ]
         self.tracker = UsageTracker(enabled=usage_enabled)
 
+        # 질문 → SQL/응답 캐시. 전체 스키마가 포함된 프롬프트를 키에 넣어 스키마가 바뀌면 무효화
+        self.question_cache = QuestionCache() if use_cache else None
+        self.cache_context = SYSTEM_PROMPT.format(schema=render_schema(tables) + self.summary_hint)
+        self.questions: list[str] = []
+
+    def _update_schema_prompt(self, question: str):
+        '''
+        질문 관련 테이블(상위 k개 + 외래키 이웃)로 시스템 프롬프트 스키마를 교체합니다.
+        직전 SCHEMA_HISTORY_TURNS개 질문의 테이블만 후속 질문을 위해 유지하므로
+        세션이 길어져도 스키마 크기는 질문 단위로 제한됩니다.
+        '''
+        current = [table["name"] for table in self.index.relevant_tables(question, SCHEMA_TOP_K)]
+        names = dict.fromkeys(current + [name for turn in reversed(self.recent_tables) for name in turn])
+        self.recent_tables.append(current)
+        schema = render_schema([self.index.tables[n] for n in names])
+        schema += (
+            f"\n\n(전체 {len(self.index.tables)}개 테이블 중 질문 관련 테이블만 표시. "
+            "필요한 테이블이 없으면 describe_tables 도구로 조회하세요.)"
+        )
+        schema += self.summary_hint
+        self.messages[0] = {"role": "system", "content": SYSTEM_PROMPT.format(schema=schema)}
+
+    def _run_tool_calls(self, tool_calls, executed: list[dict], results: list[str]):
+        '''
+        Tool 호출을 실행하고 결과를 대화 기록에 추가합니다.
+        '''
+        for tool_call in tool_calls:
+            if tool_call.function.name in ("execute_sql", "fetch_sql_page"):
+                sql = json.loads(tool_call.function.arguments).get("sql", "")
+                print(f"\n[SQL] {sql}")
+            else:
+                print(f"\n[{tool_call.function.name}] {tool_call.function.arguments}")
+
+            result = handle_tool_call(tool_call, self.index)
+            print(f"\n[결과]\n{result}")
+            executed.append(
+                {"name": tool_call.function.name, "arguments": tool_call.function.arguments}
+            )
+            results.append(result)
+
+            self.messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": result,
+                }
+            )
+
+    def _replay_cached(self, cached: dict, executed: list[dict], results: list[str]) -> str | None:
+        '''
+        캐시된 질문의 Tool 호출을 다시 실행합니다 (SQL→결과 캐시 적용).
+        결과가 저장 당시와 같으면 저장된 응답을 반환하고, 다르면 None을 반환합니다.
+        (다른 경우 Tool 호출/결과는 대화 기록에 남아 LLM이 설명만 새로 생성)
+        '''
+        tool_calls = [
+            SimpleNamespace(
+                id=f"cached-{i}",
+                type="function",
+                function=SimpleNamespace(name=call["name"], arguments=call["arguments"]),
+            )
+            for i, call in enumerate(cached["tool_calls"])
+        ]
+        self.messages.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call.id,
+                        "type": "function",
+                        "function": {
+                            "name": call.function.name,
+                            "arguments": call.function.arguments,
+                        },
+                    }
+                    for call in tool_calls
+                ],
+            }
+        )
+        self._run_tool_calls(tool_calls, executed, results)
+        if digest(results) != cached["digest"]:
+            return None
+
+        # 대화 기록은 Tool 호출 없이 질문/응답만 남김 (후속 질문 맥락용)
+        del self.messages[-(len(tool_calls) + 1) :]
+        self.messages.append({"role": "assistant", "content": cached["answer"]})
+        return cached["answer"]
+
     def ask(self, question: str) -> str:
         '''
         자연어 질문을 받아 SQLAgent를 실행합니다.
+        같은 질문(후속 질문이면 직전 질문 포함)이 캐시에 있으면 저장된 SQL을 다시 실행하고,
+        결과가 같으면 LLM 호출 없이 저장된 응답을 반환합니다.
         '''
+        self.questions.append(question)
+        cache_key = QuestionCache.key(MODEL, self.cache_context, self.questions)
+        cached = self.question_cache.get(cache_key) if self.question_cache else None
+
+        if self.index is not None:
+            self._update_schema_prompt(question)
         self.messages.append({"role": "user", "content": question})
 
+        executed, results = [], []
+        if cached:
+            print("\n[캐시] 이전에 생성한 SQL을 다시 실행합니다.")
+            answer = self._replay_cached(cached, executed, results)
+            if answer is not None:
+                print("[캐시] 결과가 같아 저장된 응답을 사용합니다.")
+                return answer
+            # 데이터가 바뀐 경우: 다시 실행한 Tool 결과로 설명만 새로 생성 (SQL 생성 생략)
+
         # [Upstage API] Chat Completions + Function Calling
         # 자연어 질문을 SQL로 변환하기 위해 tools(execute_sql)와 함께 호출
         # https://console.upstage.ai/docs/capabilities/generate/function-calling
         response = client.chat.completions.create(
-            model="solar-pro3",
+            model=MODEL,
             messages=self.messages,
-            tools=TOOLS,
+            tools=self.tools,
         )
         self.tracker.track_chat(response)
 
@@ -112,31 +303,29 @@ class SQLAgent:
 
         # Tool 호출이 있으면 반복 실행
         while message.tool_calls:
-            for tool_call in message.tool_calls:
-                sql = json.loads(tool_call.function.arguments).get("sql", "")
-                print(f"\n[SQL] {sql}")
-
-                result = handle_tool_call(tool_call)
-                print(f"\n[결과]\n{result}")
-
-                self.messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": result,
-                    }
-                )
+            self._run_tool_calls(message.tool_calls, executed, results)
 
             # [Upstage API] Chat Completions + Function Calling (tool 결과 반영 후 재호출)
             response = client.chat.completions.create(
-                model="solar-pro3",
+                model=MODEL,
                 messages=self.messages,
-                tools=TOOLS,
+                tools=self.tools,
             )
             self.tracker.track_chat(response)
             message = response.choices[0].message
             self.messages.append(message)
 
+        if self.question_cache and executed and message.content:
+            self.question_cache.put(
+                cache_key,
+                {
+                    "question": question,
+                    "tool_calls": executed,
+                    "digest": digest(results),
+                    "answer": message.content,
+                },
+            )
+
         last_info = {"input": self.tracker.total_input_tokens, "output": self.tracker.total_output_tokens, "cost": self.tracker.total_cost}
         print_usage(self.tracker, last_info)
 